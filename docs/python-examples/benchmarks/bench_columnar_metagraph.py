@@ -0,0 +1,68 @@
+"""
+Compare parse time and retained memory of `SubnetMetagraph` and `ColumnarMetagraph`.
+
+Usage:
+    python benchmarks/bench_columnar_metagraph.py [--uids 256 1024 4096] [--repeat 50]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from kami.columnar import ColumnarMetagraph  # noqa: E402
+from kami.types import SubnetMetagraph  # noqa: E402
+from payloads import make_metagraph_payload  # noqa: E402
+
+
+def retained_bytes(build: Callable[[], Any]) -> int:
+    """Bytes still allocated after `build()` returns, i.e. the size of the result."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def run(num_uids: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    payload = make_metagraph_payload(num_uids)
+    parsers: Dict[str, Callable[[], Any]] = {
+        "pydantic": lambda: SubnetMetagraph.model_validate(payload),
+        "columnar": lambda: ColumnarMetagraph.from_response(payload),
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    for name, parse in parsers.items():
+        parse()  # warm up validators and dtype caches
+        best = min(timeit.repeat(parse, number=1, repeat=repeat))
+        results[name] = {
+            "parse_ms": best * 1000,
+            "memory_kib": retained_bytes(parse) / 1024,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uids", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'uids':>6} {'model':>9} {'parse (ms)':>11} {'memory (KiB)':>13}")
+    for num_uids in args.uids:
+        for name, stats in run(num_uids, args.repeat).items():
+            print(
+                f"{num_uids:>6} {name:>9} {stats['parse_ms']:>11.3f} {stats['memory_kib']:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
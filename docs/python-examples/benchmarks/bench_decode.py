@@ -0,0 +1,77 @@
+"""
+Micro-benchmark of the metagraph decode path: JSON parsing plus model building.
+
+Compares the stdlib `json` + pydantic validation path `Kami` used to take with the
+fast JSON backend (orjson/msgspec when installed), with and without the columnar
+metagraph.
+
+Usage:
+    python benchmarks/bench_decode.py [--uids 256 4096] [--repeat 50] [--payload recorded.json]
+
+`--payload` replays a recorded `chain/subnet-metagraph/{netuid}` response body
+instead of a synthetic one.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from kami.columnar import ColumnarMetagraph  # noqa: E402
+from kami.decoding import JSON_BACKEND, loads  # noqa: E402
+from kami.types import SubnetMetagraph  # noqa: E402
+from payloads import make_metagraph_payload  # noqa: E402
+
+
+def decoders() -> Dict[str, Callable[[bytes], Any]]:
+    return {
+        "json + validate": lambda raw: SubnetMetagraph.model_validate(
+            json.loads(raw)["data"]
+        ),
+        f"{JSON_BACKEND} + validate": lambda raw: SubnetMetagraph.model_validate(
+            loads(raw)["data"]
+        ),
+        f"{JSON_BACKEND} + columnar": lambda raw: ColumnarMetagraph.from_response(
+            loads(raw)["data"]
+        ),
+    }
+
+
+def bench(raw: bytes, repeat: int):
+    baseline = None
+    for name, decode in decoders().items():
+        decode(raw)
+        best = min(timeit.repeat(lambda: decode(raw), number=1, repeat=repeat)) * 1000
+        baseline = baseline or best
+        print(f"  {name:<28} {best:>9.3f} ms  {baseline / best:>5.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uids", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--payload", help="Path to a recorded metagraph response body")
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, "rb") as f:
+            raw = f.read()
+        print(f"{args.payload} ({len(raw) / 1024:.0f} KiB)")
+        bench(raw, args.repeat)
+        return
+
+    for num_uids in args.uids:
+        body = {"statusCode": 200, "success": True, "error": None}
+        body["data"] = make_metagraph_payload(num_uids)
+        raw = json.dumps(body).encode()
+        print(f"{num_uids} uids ({len(raw) / 1024:.0f} KiB)")
+        bench(raw, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark per-call latency of `SyncKami` against calling `asyncio.run` per request.
+
+A local aiohttp server stands in for Kami, so the numbers show client overhead:
+loop creation, session setup and TCP connects that `asyncio.run` pays every call.
+
+Usage:
+    python benchmarks/bench_sync.py [--calls 200] [--uids 256]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Awaitable, Callable, List
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.payloads import make_metagraph_payload  # noqa: E402
+from kami.kami import Kami  # noqa: E402
+from kami.sync import SyncKami  # noqa: E402
+
+
+def serve(num_uids: int) -> str:
+    """
+    Start a Kami stand-in on a free port in a daemon thread and return its URL.
+    """
+    metagraph = make_metagraph_payload(num_uids)
+    started = threading.Event()
+    url: List[str] = []
+
+    async def latest_block(request: web.Request) -> web.Response:
+        return web.json_response(
+            {"statusCode": 200, "success": True, "data": {"blockNumber": 1}}
+        )
+
+    async def subnet_metagraph(request: web.Request) -> web.Response:
+        return web.json_response({"statusCode": 200, "success": True, "data": metagraph})
+
+    async def start():
+        app = web.Application()
+        app.router.add_get("/chain/latest-block", latest_block)
+        app.router.add_get("/chain/subnet-metagraph/{netuid}", subnet_metagraph)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        url.append(f"http://127.0.0.1:{port}")
+        started.set()
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    started.wait()
+    return url[0]
+
+
+def measure(call: Callable[[], object], calls: int) -> List[float]:
+    call()
+    latencies = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--uids", type=int, default=256)
+    args = parser.parse_args()
+    url = serve(args.uids)
+
+    def with_asyncio_run(
+        call: Callable[[Kami], Awaitable[object]],
+    ) -> Callable[[], object]:
+        async def once():
+            async with Kami(url=url) as kami:
+                return await call(kami)
+
+        return lambda: asyncio.run(once())
+
+    print(f"{'call':<20} {'pattern':<12} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    with SyncKami(url=url) as sync:
+        cases = [
+            (
+                "get_current_block",
+                with_asyncio_run(lambda kami: kami.get_current_block()),
+                sync.get_current_block,
+            ),
+            (
+                "get_metagraph",
+                with_asyncio_run(lambda kami: kami.get_metagraph(1)),
+                lambda: sync.get_metagraph(1),
+            ),
+        ]
+        for method, per_call_loop, shared_loop in cases:
+            for pattern, run in (
+                ("asyncio.run", per_call_loop),
+                ("SyncKami", shared_loop),
+            ):
+                latencies = sorted(measure(run, args.calls))
+                p50 = statistics.median(latencies)
+                p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+                print(f"{method:<20} {pattern:<12} {p50:>9.3f} {p99:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark `kami.weights` against the loop-based reference implementation.
+
+Usage:
+    python benchmarks/bench_weights.py [--uids 256 1024 4096] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests"))
+
+import reference_weights as reference  # noqa: E402
+from kami.weights import process_weights, quantize_weights  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uids", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'uids':>6} {'reference (ms)':>15} {'vectorized (ms)':>16} {'speedup':>8}")
+    for num_uids in args.uids:
+        scores = rng.random(num_uids) ** 4
+        scores[rng.random(num_uids) < 0.2] = 0
+        min_allowed, limit = 8, 0.05
+
+        def run_reference():
+            uids, weights = reference.process_weights(
+                scores.tolist(), min_allowed, limit, 0.1
+            )
+            return reference.convert_weights_and_uids_for_emit(uids, weights)
+
+        def run_vectorized():
+            uids, weights = process_weights(scores, min_allowed, limit, 0.1)
+            return quantize_weights(uids, weights)
+
+        ref = min(timeit.repeat(run_reference, number=1, repeat=args.repeat)) * 1000
+        vec = min(timeit.repeat(run_vectorized, number=1, repeat=args.repeat)) * 1000
+        print(f"{num_uids:>6} {ref:>15.3f} {vec:>16.3f} {ref / vec:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Load test the Kami websocket with many concurrent block subscribers.
+
+Connects batches of python-socketio clients that all send `subscribe-blocks`, then
+records when each client receives each `new-block`. For every batch size it prints
+the connect time and the fan-out spread per block (time between the first and the
+last client receiving it). Kami shares one upstream block subscription between all
+clients, so the spread per client, i.e. the cost of one more subscriber, should stay
+flat as the number of clients grows.
+
+Usage:
+    python benchmarks/load_websocket.py --url http://127.0.0.1:8882 [--clients 1 10 100 500]
+    # Against an in-process FakeKami producing a block every 0.5s:
+    python benchmarks/load_websocket.py --fake
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import socketio
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from kami.testing import FakeKami  # noqa: E402
+
+
+class Subscriber:
+    def __init__(self, url: str, finalised: bool, received: Dict[int, List[float]]):
+        self.url = url
+        self.finalised = finalised
+        self.received = received
+        self.confirmed = asyncio.Event()
+        self.client = socketio.AsyncClient(reconnection=False, handle_sigint=False)
+        self.client.on("connect", self._on_connect)
+        self.client.on("subscription-confirmed", self._on_confirmed)
+        self.client.on("new-block", self._on_new_block)
+
+    async def _on_connect(self):
+        await self.client.emit("subscribe-blocks", self.finalised)
+
+    async def _on_confirmed(self, data):
+        self.confirmed.set()
+
+    async def _on_new_block(self, data):
+        self.received[data["blockNumber"]].append(time.perf_counter())
+
+    async def start(self):
+        await self.client.connect(self.url, transports=["websocket"])
+        await self.confirmed.wait()
+
+    async def stop(self):
+        await self.client.disconnect()
+
+
+async def run_batch(
+    url: str, clients: int, blocks: int, finalised: bool, timeout: float
+) -> Dict[str, float]:
+    received: Dict[int, List[float]] = defaultdict(list)
+    subscribers = [Subscriber(url, finalised, received) for _ in range(clients)]
+    started = time.perf_counter()
+    # Bounded, so the server isn't measured under a connection storm.
+    semaphore = asyncio.Semaphore(64)
+
+    async def start(subscriber: Subscriber):
+        async with semaphore:
+            await subscriber.start()
+
+    await asyncio.gather(*(start(subscriber) for subscriber in subscribers))
+    connect = time.perf_counter() - started
+
+    try:
+        async with asyncio.timeout(timeout):
+            while sum(len(times) == clients for times in received.values()) < blocks:
+                await asyncio.sleep(0.05)
+    finally:
+        await asyncio.gather(*(subscriber.stop() for subscriber in subscribers))
+
+    # Blocks that reached every client, blocks emitted while clients were still
+    # subscribing reached only some.
+    spreads = sorted(
+        (max(times) - min(times)) * 1000
+        for times in received.values()
+        if len(times) == clients
+    )
+    spread = statistics.median(spreads)
+    return {
+        "connect_ms": connect * 1000 / clients,
+        "spread_ms": spread,
+        "spread_max_ms": max(spreads),
+        "per_client_us": spread * 1000 / clients,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="Kami base URL")
+    parser.add_argument(
+        "--fake", action="store_true", help="Serve blocks from an in-process FakeKami"
+    )
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--blocks", type=int, default=5, help="Blocks per batch")
+    parser.add_argument(
+        "--best", action="store_true", help="Subscribe to best instead of finalised"
+    )
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    fake = None
+    url = args.url
+    if args.fake:
+        fake = FakeKami(block_interval=0.5)
+        url = await fake.start()
+    elif url is None:
+        parser.error("pass --url or --fake")
+
+    print(
+        f"{'clients':>8} {'connect/client (ms)':>20} {'spread p50 (ms)':>16} "
+        f"{'spread max (ms)':>16} {'per client (us)':>16}"
+    )
+    try:
+        for clients in args.clients:
+            result = await run_batch(
+                url, clients, args.blocks, not args.best, args.timeout
+            )
+            print(
+                f"{clients:>8} {result['connect_ms']:>20.2f} "
+                f"{result['spread_ms']:>16.2f} {result['spread_max_ms']:>16.2f} "
+                f"{result['per_client_us']:>16.1f}"
+            )
+    finally:
+        if fake is not None:
+            await fake.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,11 @@
+"""
+Synthetic Kami API payloads for benchmarks.
+
+The shapes mirror the `data` field returned by the Kami server, so they can be fed
+straight into the `kami` models without a running server. They live in
+`kami.testing`, next to the `FakeKami` server that serves them.
+"""
+
+from kami.testing import make_hyperparameters_payload, make_metagraph_payload
+
+__all__ = ["make_hyperparameters_payload", "make_metagraph_payload"]
@@ -0,0 +1,197 @@
+"""
+pytest-benchmark suite for the client against an in-process `FakeKami`.
+
+Measures metagraph fetches, weight setting and block streams end to end over local
+HTTP and Socket.IO, so client regressions show up without a chain or a Kami server.
+Every benchmark also stores per-request p50/p99 latency and throughput in its
+`extra_info`.
+
+Usage:
+    pip install -e ".[bench]"
+    python -m pytest benchmarks --benchmark-autosave
+    # Later, fail if the median of any benchmark got more than 10% slower:
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:10%
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, Awaitable, Callable, Iterator, List
+
+import pytest
+
+from kami.kami import Kami
+from kami.retry import RetryPolicy
+from kami.testing import FakeKami
+from kami.types import SetWeightsPayload
+
+pytest.importorskip("pytest_benchmark")
+
+NETUIDS = range(8)
+NUM_UIDS = 256
+ROUNDS = 30
+# Requests in flight at once in the throughput benchmarks.
+CONCURRENCY = 32
+NO_RETRY = RetryPolicy(max_retries=0, failure_threshold=0)
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    # E.g. Socket.IO ping tasks of connections closed by the server.
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+
+    async def cancelled():
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    loop.run_until_complete(cancelled())
+    loop.close()
+
+
+def _serve(loop: asyncio.AbstractEventLoop, **kwargs: Any) -> Iterator[FakeKami]:
+    fake = FakeKami(netuids=NETUIDS, num_uids=NUM_UIDS, **kwargs)
+    loop.run_until_complete(fake.start())
+    yield fake
+    loop.run_until_complete(fake.stop())
+
+
+@pytest.fixture(scope="module")
+def fake(loop: asyncio.AbstractEventLoop) -> Iterator[FakeKami]:
+    yield from _serve(loop)
+
+
+@pytest.fixture(scope="module")
+def flaky(loop: asyncio.AbstractEventLoop) -> Iterator[FakeKami]:
+    """A slower Kami that fails 5% of requests."""
+    yield from _serve(loop, latency=0.002, jitter=0.004, error_rate=0.05, seed=1)
+
+
+@contextlib.contextmanager
+def client(loop: asyncio.AbstractEventLoop, **kwargs: Any) -> Iterator[Kami]:
+    kami = Kami(**kwargs)
+    try:
+        yield kami
+    finally:
+        loop.run_until_complete(kami.close())
+
+
+def batch(
+    loop: asyncio.AbstractEventLoop,
+    call: Callable[[int], Awaitable[Any]],
+    count: int,
+    latencies: List[float],
+) -> Callable[[], None]:
+    """
+    A benchmark round that runs `call(0)` ... `call(count - 1)` concurrently and
+    appends each call's latency to `latencies`.
+    """
+
+    async def timed(i: int):
+        started = time.perf_counter()
+        await call(i)
+        latencies.append(time.perf_counter() - started)
+
+    async def run():
+        await asyncio.gather(*(timed(i) for i in range(count)))
+
+    return lambda: loop.run_until_complete(run())
+
+
+def summarize(benchmark: Any, latencies: List[float], per_round: int):
+    if benchmark.stats is None:
+        # Run with --benchmark-disable, e.g. as a smoke test.
+        return
+    ordered = sorted(latencies)
+
+    def percentile(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    benchmark.extra_info["p50_ms"] = round(percentile(0.5), 3)
+    benchmark.extra_info["p99_ms"] = round(percentile(0.99), 3)
+    benchmark.extra_info["per_second"] = round(per_round / benchmark.stats["mean"], 1)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["json", "msgpack"])
+@pytest.mark.parametrize("columnar", [False, True], ids=["models", "columnar"])
+def test_get_metagraph(benchmark, loop, fake, columnar, compact):
+    latencies: List[float] = []
+    # Without revalidation, so every round transfers and decodes the metagraph.
+    with client(
+        loop, url=fake.url, retry=NO_RETRY, compact=compact, revalidate=False
+    ) as kami:
+        run = batch(
+            loop, lambda _: kami.get_metagraph(1, columnar=columnar), 1, latencies
+        )
+        benchmark.pedantic(run, rounds=ROUNDS, warmup_rounds=1)
+    summarize(benchmark, latencies, 1)
+
+
+def test_get_metagraph_throughput(benchmark, loop, fake):
+    latencies: List[float] = []
+    # Without coalescing, so every call is its own request.
+    with client(loop, url=fake.url, coalesce=False, retry=NO_RETRY) as kami:
+
+        def call(i: int) -> Awaitable[Any]:
+            return kami.get_metagraph(NETUIDS[i % len(NETUIDS)], columnar=True)
+
+        run = batch(loop, call, CONCURRENCY, latencies)
+        benchmark.pedantic(run, rounds=ROUNDS, warmup_rounds=1)
+    summarize(benchmark, latencies, CONCURRENCY)
+
+
+def test_get_metagraph_with_errors(benchmark, loop, flaky):
+    latencies: List[float] = []
+    retry = RetryPolicy(initial_retry_delay=0.005, failure_threshold=0)
+    with client(loop, url=flaky.url, coalesce=False, retry=retry) as kami:
+
+        def call(i: int) -> Awaitable[Any]:
+            return kami.get_metagraph(NETUIDS[i % len(NETUIDS)], columnar=True)
+
+        run = batch(loop, call, CONCURRENCY, latencies)
+        benchmark.pedantic(run, rounds=ROUNDS, warmup_rounds=1)
+    summarize(benchmark, latencies, CONCURRENCY)
+
+
+def test_set_weights(benchmark, loop, fake):
+    latencies: List[float] = []
+    payloads = [
+        SetWeightsPayload(
+            netuid=netuid,
+            dests=list(range(NUM_UIDS)),
+            weights=[(uid * 7919) % 65536 for uid in range(NUM_UIDS)],
+            version_key=0,
+        )
+        for netuid in NETUIDS
+    ]
+    with client(loop, url=fake.url, retry=NO_RETRY) as kami:
+        run = batch(
+            loop, lambda i: kami.set_weights(payloads[i]), len(payloads), latencies
+        )
+        benchmark.pedantic(run, rounds=ROUNDS, warmup_rounds=1)
+    summarize(benchmark, latencies, len(payloads))
+
+
+def test_block_stream(benchmark, loop, fake):
+    """Produce-to-delivery latency of blocks through `subscribe_blocks`."""
+    latencies: List[float] = []
+    blocks_per_round = 32
+    with client(loop, url=fake.url) as kami:
+        stream = kami.subscribe_blocks(maxsize=blocks_per_round)
+        loop.run_until_complete(stream.connect())
+        loop.run_until_complete(fake.wait_for_subscribers())
+
+        async def run():
+            for _ in range(blocks_per_round):
+                started = time.perf_counter()
+                await fake.produce_block()
+                await anext(stream)
+                latencies.append(time.perf_counter() - started)
+
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(run()), rounds=ROUNDS, warmup_rounds=1
+        )
+        loop.run_until_complete(stream.close())
+    summarize(benchmark, latencies, blocks_per_round)
@@ -1,6 +1,22 @@
+from .batch import NetuidResult
+from .blocks import BlockEvent, BlockStream, OverflowPolicy
+from .cache import BaseCache, ResponseCache
+from .columnar import ColumnarMetagraph
+from .config import ConnectionConfig
+from .index import MetagraphIndex
 from .kami import Kami
+from .metagraph_stream import MetagraphStream, MetagraphUpdate
+from .metrics import Histogram, Metrics
+from .pool import KamiPool, ReadStrategy, Replica
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy, deadline
+from .shared import SharedMetagraphPublisher, SharedMetagraphReader
+from .signing import verify_signature
+from .store import SnapshotStore
+from .sync import SyncIterator, SyncKami
+from .tracker import MetagraphDelta, MetagraphTracker
 from .types import (
     AxonInfo,
+    BlockInfo,
     CommitRevealPayload,
     IdentitiesInfo,
     MovingPrice,
@@ -8,13 +24,45 @@ from .types import (
     SetWeightsPayload,
     SubnetIdentity,
     SubnetMetagraph,
+    SubnetMetagraphInfo,
     KeyringPairInfo,
+    SubstrateHealth,
+    TimelockedWeightsPayload,
 )
 
 __all__ = [
     "Kami",
+    "KamiPool",
+    "ReadStrategy",
+    "Replica",
+    "BaseCache",
+    "ResponseCache",
+    "ConnectionConfig",
+    "Metrics",
+    "Histogram",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "deadline",
+    "NetuidResult",
+    "MetagraphTracker",
+    "MetagraphDelta",
+    "MetagraphIndex",
+    "SnapshotStore",
+    "SharedMetagraphPublisher",
+    "SharedMetagraphReader",
+    "SyncKami",
+    "SyncIterator",
+    "BlockEvent",
+    "BlockStream",
+    "OverflowPolicy",
+    "MetagraphStream",
+    "MetagraphUpdate",
     "SubnetMetagraph",
+    "SubnetMetagraphInfo",
+    "ColumnarMetagraph",
     "AxonInfo",
+    "BlockInfo",
     "ServeAxonPayload",
     "SetWeightsPayload",
     "CommitRevealPayload",
@@ -22,4 +70,7 @@ __all__ = [
     "SubnetIdentity",
     "IdentitiesInfo",
     "KeyringPairInfo",
+    "SubstrateHealth",
+    "TimelockedWeightsPayload",
+    "verify_signature",
 ]
@@ -0,0 +1,97 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import AsyncIterator, Awaitable, Callable, Deque, Generic, Iterable, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+@dataclass
+class NetuidResult(Generic[T]):
+    """
+    Outcome of one netuid in a bulk request. Exactly one of `value` and `error` is set.
+    """
+
+    netuid: int
+    value: T | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def fan_out(
+    netuids: Iterable[int],
+    fetch: Callable[[int], Awaitable[T]],
+    concurrency: int,
+) -> AsyncIterator[NetuidResult[T]]:
+    """
+    Call `fetch(netuid)` for every netuid with at most `concurrency` calls in flight,
+    yielding results in completion order.
+
+    A failing netuid is yielded with its `error` set instead of aborting the batch.
+    Calls still running when the iterator is closed are cancelled; wrap it in
+    `contextlib.aclosing` when breaking out of the loop early.
+
+    Args:
+        netuids (Iterable[int]): The netuids to fetch. Duplicates are fetched once.
+        fetch (Callable[[int], Awaitable[T]]): Fetches a single netuid.
+        concurrency (int): Maximum number of concurrent `fetch` calls.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be greater than 0")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(netuid: int) -> NetuidResult[T]:
+        async with semaphore:
+            try:
+                return NetuidResult(netuid=netuid, value=await fetch(netuid))
+            except Exception as e:
+                return NetuidResult(netuid=netuid, error=e)
+
+    tasks = [asyncio.ensure_future(run(netuid)) for netuid in dict.fromkeys(netuids)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fan_out_ordered(
+    items: Iterable[K],
+    fetch: Callable[[K], Awaitable[T]],
+    concurrency: int,
+) -> AsyncIterator[T]:
+    """
+    Call `fetch(item)` for every item with at most `concurrency` calls in flight,
+    yielding results in the order of `items`.
+
+    Calls run ahead of the consumer by up to `concurrency` items, so a slow consumer
+    overlaps with the next fetches without unbounded buffering. The first failing
+    call raises when its result is reached; calls still running are cancelled then,
+    or when the iterator is closed.
+
+    Args:
+        items (Iterable[K]): The items to fetch, consumed lazily.
+        fetch (Callable[[K], Awaitable[T]]): Fetches a single item.
+        concurrency (int): Maximum number of concurrent `fetch` calls.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be greater than 0")
+    remaining = iter(items)
+    pending: Deque[asyncio.Future[T]] = deque(
+        asyncio.ensure_future(fetch(item)) for item in islice(remaining, concurrency)
+    )
+    try:
+        while pending:
+            result = await pending.popleft()
+            for item in islice(remaining, 1):
+                pending.append(asyncio.ensure_future(fetch(item)))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,283 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict
+
+import aiohttp
+from loguru import logger
+
+from kami.types import BlockInfo
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What a `BlockStream` does with a new block when its queue is full.
+    """
+
+    # Drop the oldest queued block to make room.
+    DROP_OLDEST = "drop-oldest"
+    # Drop every queued block and keep only the newest one.
+    COALESCE = "coalesce-to-latest"
+    # Never drop a block. Socket.IO can't pause the websocket, so blocks that
+    # arrive while the queue is full wait in an unbounded buffer in front of it.
+    BLOCK = "block"
+
+
+@dataclass
+class BlockEvent:
+    block: BlockInfo
+    # Wall-clock time the block header reached the client.
+    received_at: float
+    # True if the block was missing from the subscription and filled in by the
+    # client; only `blockNumber` is set on its `block`.
+    backfilled: bool = False
+    # Wall-clock time the block was handed to the consumer.
+    delivered_at: float | None = None
+
+    @property
+    def latency(self) -> float | None:
+        if self.delivered_at is None:
+            return None
+        return self.delivered_at - self.received_at
+
+
+@dataclass
+class BlockStreamStats:
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    backfilled: int = 0
+    # Missing blocks that were not backfilled because the gap was too large.
+    skipped: int = 0
+    reconnects: int = 0
+    # Receive-to-delivery latency in seconds of the most recent blocks.
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """
+        Receive-to-delivery latency percentile in seconds, e.g. `0.99` for p99.
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(percentile * len(ordered)))
+        return ordered[index]
+
+
+_CLOSED = object()
+
+
+class BlockStream:
+    """
+    Async iterator over new blocks from the Kami websocket, backed by a bounded queue.
+
+    Socket.IO handlers only enqueue blocks, so a slow consumer never stalls the event
+    loop; what happens once the queue is full is decided by `overflow`. With
+    `OverflowPolicy.BLOCK` nothing is dropped, but memory grows for as long as the
+    consumer falls behind, so only use it for consumers that keep up on average. The
+    subscription is re-sent after every reconnect, and blocks missed in between
+    are backfilled by number (up to `max_backfill` blocks) for finalised streams.
+
+    Usually created through `Kami.subscribe_blocks`. Connects on first use:
+
+        async with kami.subscribe_blocks() as blocks:
+            async for event in blocks:
+                print(event.block.blockNumber, event.latency)
+
+    Args:
+        url (str): Base URL of the Kami server.
+        finalised (bool): Subscribe to finalised blocks if True, new blocks otherwise.
+        maxsize (int): Maximum number of blocks queued for the consumer.
+        overflow (OverflowPolicy | str): Policy applied when the queue is full.
+        max_backfill (int): Largest gap that is backfilled, 0 disables backfilling.
+        connector_factory (Callable[[], aiohttp.BaseConnector] | None): Creates the
+            connector of the websocket's HTTP session, e.g. for Unix domain sockets.
+            The Socket.IO client's default session is used if None.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        finalised: bool = True,
+        maxsize: int = 64,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        max_backfill: int = 64,
+        connector_factory: Callable[[], aiohttp.BaseConnector] | None = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        self.url = url
+        self.finalised = finalised
+        self.overflow = OverflowPolicy(overflow)
+        self.max_backfill = max_backfill
+        self.connector_factory = connector_factory
+        self._http_session: aiohttp.ClientSession | None = None
+        self.stats = BlockStreamStats()
+        self.last_block: int | None = None
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+        self._client: Any = None
+        self._connected_once = False
+        self._closed = False
+        self._reconnect_task: asyncio.Future[None] | None = None
+        # Blocks waiting for room in the queue, with `OverflowPolicy.BLOCK`.
+        self._pending: Deque[BlockEvent] = deque()
+        self._pump_task: asyncio.Future[None] | None = None
+
+    async def __aenter__(self) -> "BlockStream":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.close()
+
+    def __aiter__(self) -> "BlockStream":
+        return self
+
+    async def __anext__(self) -> BlockEvent:
+        if self._client is None and not self._closed:
+            await self.connect()
+        event = await self._queue.get()
+        if event is _CLOSED:
+            # Leave the marker for any other consumer.
+            self._queue.put_nowait(_CLOSED)
+            raise StopAsyncIteration
+        event.delivered_at = time.time()
+        self.stats.delivered += 1
+        self.stats.latencies.append(event.delivered_at - event.received_at)
+        return event
+
+    async def connect(self):
+        """
+        Connect to the websocket and subscribe to blocks.
+        """
+        if self._client is not None:
+            return
+        import socketio
+
+        kwargs: Dict[str, Any] = {}
+        if self.connector_factory is not None:
+            self._http_session = aiohttp.ClientSession(
+                connector=self.connector_factory()
+            )
+            kwargs["http_session"] = self._http_session
+        client = socketio.AsyncClient(reconnection=True, handle_sigint=False, **kwargs)
+        client.on("connect", self._on_connect)
+        client.on("disconnect", self._on_disconnect)
+        client.on("new-block", self._on_new_block)
+        client.on("subscription-error", self._on_subscription_error)
+        self._client = client
+        await client.connect(self.url, transports=["websocket"])
+
+    async def close(self):
+        """
+        Disconnect and end iteration once the queued blocks are consumed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+        self._pending.clear()
+        if self._client is not None:
+            await self._client.disconnect()
+        if self._http_session is not None:
+            await self._http_session.close()
+        while True:
+            try:
+                self._queue.put_nowait(_CLOSED)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+
+    async def _on_connect(self):
+        if self._connected_once:
+            self.stats.reconnects += 1
+            logger.info("Reconnected to Kami websocket, resubscribing to blocks")
+        self._connected_once = True
+        await self._client.emit("subscribe-blocks", self.finalised)
+
+    async def _on_disconnect(self, reason: str | None = None):
+        if self._closed:
+            return
+        logger.warning(f"Disconnected from Kami websocket: {reason}")
+        # The Socket.IO client reconnects by itself after transport errors, but not
+        # when the server closes the connection, e.g. while Kami restarts.
+        if reason == self._client.reason.SERVER_DISCONNECT:
+            self._reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    async def _reconnect(self):
+        await asyncio.sleep(1)
+        if self._closed or self._client.connected:
+            return
+        try:
+            await self._client.connect(self.url, transports=["websocket"], retry=True)
+        except Exception as e:
+            logger.error(f"Failed to reconnect to Kami websocket: {e}")
+
+    async def _on_subscription_error(self, data: Dict[str, Any]):
+        logger.error(f"Block subscription error: {data}")
+
+    async def _on_new_block(self, data: Dict[str, Any]):
+        received_at = time.time()
+        block = BlockInfo.model_validate(data)
+        self.stats.received += 1
+        number = block.blockNumber
+        last = self.last_block
+        backfill = range(0)
+        if last is not None and self.finalised:
+            if number <= last:
+                return
+            missing = number - last - 1
+            if missing > self.max_backfill:
+                self.stats.skipped += missing
+                logger.warning(
+                    f"Missed {missing} blocks between {last} and {number}, not backfilling"
+                )
+            else:
+                backfill = range(last + 1, number)
+        self.last_block = number if last is None else max(last, number)
+
+        for missed in backfill:
+            self.stats.backfilled += 1
+            self._put(
+                BlockEvent(
+                    block=BlockInfo(blockNumber=missed),
+                    received_at=received_at,
+                    backfilled=True,
+                )
+            )
+        self._put(BlockEvent(block=block, received_at=received_at))
+
+    def _put(self, event: BlockEvent):
+        # Never awaits: the Socket.IO client runs every event in its own task, so
+        # handlers waiting for the queue would pile up and could reorder blocks.
+        if self._closed:
+            return
+        if self.overflow is OverflowPolicy.BLOCK:
+            if not self._pending and not self._queue.full():
+                self._queue.put_nowait(event)
+                return
+            self._pending.append(event)
+            if self._pump_task is None or self._pump_task.done():
+                self._pump_task = asyncio.ensure_future(self._pump())
+            return
+        if self._queue.full():
+            if self.overflow is OverflowPolicy.COALESCE:
+                while not self._queue.empty():
+                    self._queue.get_nowait()
+                    self.stats.dropped += 1
+            else:
+                self._queue.get_nowait()
+                self.stats.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def _pump(self):
+        # The only task waiting for room in the queue, so blocks keep their order.
+        # Blocks stay in `_pending` until queued, so `_put` can't overtake them.
+        while self._pending:
+            await self._queue.put(self._pending[0])
+            self._pending.popleft()
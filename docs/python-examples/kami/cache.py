@@ -0,0 +1,297 @@
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+# TTLs in seconds for each endpoint family. Endpoints without an entry (e.g.
+# `chain/latest-block`) are never cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    "chain/subnet-metagraph": 12.0,
+    "chain/subnet-hyperparameters": 60.0,
+    "chain/check-hotkey": 12.0,
+    "substrate/keyring-pair-info": 3600.0,
+}
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+$")
+# Query parameter that pins a request to a historical block.
+_PINNED_BLOCK = re.compile(r"[?&]block=")
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Strip query strings and trailing path parameters from an endpoint.
+
+    `chain/subnet-metagraph/12` and `chain/check-hotkey?netuid=1&hotkey=...` map to
+    `chain/subnet-metagraph` and `chain/check-hotkey` respectively.
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    return _NUMERIC_SEGMENT.sub("", path)
+
+
+def make_cache_key(endpoint: str, params: Dict[str, Any] | None = None) -> str:
+    """
+    Build a stable cache key from an endpoint and its query parameters.
+    """
+    endpoint = endpoint.strip("/")
+    if not params:
+        return endpoint
+    query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+    separator = "&" if "?" in endpoint else "?"
+    return f"{endpoint}{separator}{query}"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class BaseCache(ABC):
+    """
+    Interface for response caches used by `Kami`.
+
+    Implementations store decoded JSON responses keyed by `make_cache_key` and
+    decide for themselves which endpoints are cacheable.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a response.
+
+        Returns:
+            Tuple[bool, Any]: `(True, response)` on a hit, `(False, None)` on a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, response: Any) -> None:
+        """Store a response, if its endpoint is cacheable."""
+
+    @abstractmethod
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Drop cached responses of an endpoint, e.g. `chain/subnet-metagraph/1`, or of
+        a whole endpoint family, e.g. `chain/subnet-metagraph`. Drops everything if
+        `endpoint` is None.
+        """
+
+    def observe_block(self, block: int) -> None:
+        """Called with every block number `Kami.get_current_block` returns."""
+
+
+class ResponseCache(BaseCache):
+    """
+    In-memory LRU cache with per-endpoint TTLs and block-height invalidation.
+
+    Responses whose `data` carries a `block` field (e.g. subnet metagraphs) are
+    dropped as soon as `observe_block` sees a newer block, even if their TTL has
+    not expired yet. Requests pinned to a block with a `block` query parameter
+    never go stale this way and only expire by TTL.
+
+    Args:
+        ttls (Dict[str, float] | None): TTL in seconds per endpoint family, see
+            `endpoint_family`. Families that are missing or have a TTL <= 0 are
+            not cached. Defaults to `DEFAULT_TTLS`.
+        maxsize (int): Maximum number of entries kept before the least recently
+            used one is evicted.
+        block_invalidation (bool): Whether to invalidate entries on new blocks.
+        clock (Callable[[], float]): Monotonic time source, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float] | None = None,
+        maxsize: int = 1024,
+        block_invalidation: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.block_invalidation = block_invalidation
+        self.clock = clock
+        self.stats: Dict[str, CacheStats] = {}
+        self.latest_block: int | None = None
+        # key -> (expires_at, block, response)
+        self._entries: OrderedDict[str, Tuple[float, int | None, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _stats_for(self, key: str) -> CacheStats:
+        family = endpoint_family(key)
+        if family not in self.stats:
+            self.stats[family] = CacheStats()
+        return self.stats[family]
+
+    @property
+    def hits(self) -> int:
+        return sum(stats.hits for stats in self.stats.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(stats.misses for stats in self.stats.values())
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        if self.ttls.get(endpoint_family(key), 0) <= 0:
+            return False, None
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, block, response = entry
+            stale = (
+                self.block_invalidation
+                and block is not None
+                and self.latest_block is not None
+                and block < self.latest_block
+            )
+            if expires_at > self.clock() and not stale:
+                self._entries.move_to_end(key)
+                self._stats_for(key).hits += 1
+                return True, response
+            del self._entries[key]
+        self._stats_for(key).misses += 1
+        return False, None
+
+    def set(self, key: str, response: Any) -> None:
+        ttl = self.ttls.get(endpoint_family(key), 0)
+        if ttl <= 0:
+            return
+        block = None
+        pinned = _PINNED_BLOCK.search(key) is not None
+        if not pinned and isinstance(response, dict) and isinstance(
+            response.get("data"), dict
+        ):
+            block = response["data"].get("block")
+        self._entries[key] = (self.clock() + ttl, block, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            self._stats_for(evicted).evictions += 1
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        if endpoint is None:
+            self._entries.clear()
+            return
+        endpoint = endpoint.strip("/")
+        for key in list(self._entries):
+            path = key.split("?", 1)[0]
+            if path == endpoint or endpoint_family(path) == endpoint:
+                del self._entries[key]
+
+    def observe_block(self, block: int) -> None:
+        if self.latest_block is None or block > self.latest_block:
+            self.latest_block = block
+
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)")
+
+
+@dataclass
+class Validator:
+    etag: str
+    response: Any
+    # Clock time until which `response` may be used without asking Kami.
+    fresh_until: float
+
+
+class ETagCache:
+    """
+    Remembers the ETag and decoded body of recent GET responses, so `Kami` can send
+    conditional requests and reuse the body when the server answers 304 Not Modified.
+
+    Kami tags subnet metagraphs and hyperparameters with the hash of the block they
+    were read at and sends `Cache-Control: no-cache`, so a 304 skips the transfer
+    and decoding of a payload that has not changed, but every request still reaches
+    Kami. Responses with `no-store` are not kept, and responses with a `max-age` are
+    reused without a request until it expires.
+
+    Args:
+        maxsize (int): Maximum number of responses kept before the least recently
+            used one is evicted.
+        clock (Callable[[], float]): Monotonic time source, overridable for tests.
+    """
+
+    def __init__(self, maxsize: int = 256, clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        self.maxsize = maxsize
+        self.clock = clock
+        # Responses reused after a 304 or within their max-age.
+        self.revalidated = 0
+        self._entries: OrderedDict[str, Validator] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Validator | None:
+        """
+        The validator of a request built by `make_cache_key`, None if there is none.
+        """
+        validator = self._entries.get(key)
+        if validator is not None:
+            self._entries.move_to_end(key)
+        return validator
+
+    def fresh(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a response that may be used without revalidating it.
+
+        Returns:
+            Tuple[bool, Any]: `(True, response)` within its max-age, `(False, None)`
+                otherwise.
+        """
+        validator = self._entries.get(key)
+        if validator is None or validator.fresh_until <= self.clock():
+            return False, None
+        self.revalidated += 1
+        return True, validator.response
+
+    def set(
+        self, key: str, etag: str, response: Any, cache_control: str | None = None
+    ) -> None:
+        """
+        Store a response and its ETag, unless `cache_control` forbids it.
+        """
+        directives = (cache_control or "").lower()
+        if "no-store" in directives:
+            self._entries.pop(key, None)
+            return
+        max_age = _MAX_AGE.search(directives)
+        fresh_until = float("-inf")
+        if max_age is not None and "no-cache" not in directives:
+            fresh_until = self.clock() + int(max_age.group(1))
+        self._entries[key] = Validator(etag, response, fresh_until)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def refresh(
+        self, key: str, validator: Validator, cache_control: str | None = None
+    ) -> Any:
+        """
+        Keep the response of `validator` after the server answered 304 Not Modified.
+
+        Returns:
+            Any: The stored response.
+        """
+        self.revalidated += 1
+        self.set(key, validator.etag, validator.response, cache_control)
+        return validator.response
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Drop the responses of an endpoint or endpoint family, see
+        `BaseCache.invalidate`, or everything if `endpoint` is None.
+        """
+        if endpoint is None:
+            self._entries.clear()
+            return
+        endpoint = endpoint.strip("/")
+        for key in list(self._entries):
+            path = key.split("?", 1)[0]
+            if path == endpoint or endpoint_family(path) == endpoint:
+                del self._entries[key]
@@ -0,0 +1,192 @@
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from pydantic import TypeAdapter
+
+from kami.types import AxonInfo, IdentitiesInfo, SubnetMetagraph, SubnetMetagraphInfo
+
+# Per-UID columns and the dtype each one is decoded into.
+FLOAT_COLUMNS: Tuple[str, ...] = (
+    "emission",
+    "dividends",
+    "incentives",
+    "consensus",
+    "trust",
+    "rank",
+    "alphaStake",
+    "taoStake",
+    "totalStake",
+)
+INT_COLUMNS: Tuple[str, ...] = ("pruningScore", "lastUpdate", "blockAtRegistration")
+BOOL_COLUMNS: Tuple[str, ...] = ("active", "validatorPermit")
+
+AXON_DTYPE = np.dtype(
+    [
+        ("block", np.int64),
+        ("version", np.uint32),
+        # Long enough for a fully expanded IPv6 address.
+        ("ip", "U39"),
+        ("port", np.uint16),
+        ("ipType", np.uint8),
+        ("protocol", np.uint8),
+        ("placeholder1", np.uint8),
+        ("placeholder2", np.uint8),
+    ]
+)
+
+_identities_adapter = TypeAdapter(List[IdentitiesInfo | None])
+_axon_row = itemgetter(*(AXON_DTYPE.names or ()))
+
+
+def _axons_to_array(axons: List[Dict[str, Any]]) -> np.ndarray:
+    return np.array(list(map(_axon_row, axons)), dtype=AXON_DTYPE)
+
+
+class ColumnarMetagraph(SubnetMetagraphInfo):
+    """
+    Subnet metagraph with every per-UID field decoded into a typed NumPy array.
+
+    Subnet-level fields are validated exactly like `SubnetMetagraph`; per-UID
+    fields keep their `SubnetMetagraph` attribute names, so `metagraph.emission`
+    is a `float64` array, `metagraph.active` a `bool` array and `metagraph.axons`
+    a structured array with `AXON_DTYPE`.
+    """
+
+    hotkeys: List[str]
+    coldkeys: List[str]
+    identities: List[IdentitiesInfo | None]
+    axons: np.ndarray
+    active: np.ndarray
+    validatorPermit: np.ndarray
+    pruningScore: np.ndarray
+    lastUpdate: np.ndarray
+    emission: np.ndarray
+    dividends: np.ndarray
+    incentives: np.ndarray
+    consensus: np.ndarray
+    trust: np.ndarray
+    rank: np.ndarray
+    blockAtRegistration: np.ndarray
+    alphaStake: np.ndarray
+    taoStake: np.ndarray
+    totalStake: np.ndarray
+    taoDividendsPerHotkey: List[Tuple[str, float]]
+    alphaDividendsPerHotkey: List[Tuple[str, float]]
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "ColumnarMetagraph":
+        """
+        Build a columnar metagraph from the `data` field of a metagraph response.
+
+        Args:
+            data (Dict[str, Any]): The decoded `chain/subnet-metagraph/{netuid}` payload,
+                per-UID fields as lists or, from a MessagePack response, NumPy arrays.
+
+        Returns:
+            ColumnarMetagraph: The columnar metagraph object.
+        """
+        info = SubnetMetagraphInfo.model_validate(data)
+        columns: Dict[str, Any] = {}
+        # Copied, MessagePack responses hold read-only arrays shared with the cache.
+        for name in FLOAT_COLUMNS:
+            columns[name] = np.array(data.get(name, []), dtype=np.float64)
+        for name in INT_COLUMNS:
+            columns[name] = np.array(data.get(name, []), dtype=np.int64)
+        for name in BOOL_COLUMNS:
+            columns[name] = np.array(data.get(name, []), dtype=np.bool_)
+
+        return cls.model_construct(
+            **dict(info),
+            **columns,
+            hotkeys=list(data.get("hotkeys", [])),
+            coldkeys=list(data.get("coldkeys", [])),
+            identities=_identities_adapter.validate_python(data.get("identities", [])),
+            axons=_axons_to_array(data.get("axons", [])),
+            taoDividendsPerHotkey=[
+                (hotkey, float(value))
+                for hotkey, value in data.get("taoDividendsPerHotkey", [])
+            ],
+            alphaDividendsPerHotkey=[
+                (hotkey, float(value))
+                for hotkey, value in data.get("alphaDividendsPerHotkey", [])
+            ],
+        )
+
+    def get_axon(self, uid: int) -> AxonInfo:
+        """
+        Get the axon of a single UID as an `AxonInfo` model.
+
+        Args:
+            uid (int): The UID to get the axon for.
+
+        Returns:
+            AxonInfo: The axon information of the UID.
+        """
+        row = self.axons[uid]
+        names = AXON_DTYPE.names or ()
+        return AxonInfo.model_validate({name: row[name].item() for name in names})
+
+    def to_metagraph(self) -> SubnetMetagraph:
+        """
+        Convert back into a `SubnetMetagraph` with plain Python lists.
+
+        Returns:
+            SubnetMetagraph: The same metagraph as a `SubnetMetagraph`.
+        """
+        names = AXON_DTYPE.names or ()
+        data: Dict[str, Any] = {
+            name: getattr(self, name) for name in SubnetMetagraphInfo.model_fields
+        }
+        for name in FLOAT_COLUMNS + INT_COLUMNS + BOOL_COLUMNS:
+            data[name] = getattr(self, name).tolist()
+        return SubnetMetagraph.model_validate(
+            {
+                **data,
+                "hotkeys": list(self.hotkeys),
+                "coldkeys": list(self.coldkeys),
+                "identities": list(self.identities),
+                "axons": [dict(zip(names, row)) for row in self.axons.tolist()],
+                "taoDividendsPerHotkey": list(self.taoDividendsPerHotkey),
+                "alphaDividendsPerHotkey": list(self.alphaDividendsPerHotkey),
+            }
+        )
+
+
+def _metadata(metagraph: ColumnarMetagraph) -> Dict[str, Any]:
+    """
+    The fields of a metagraph that are not per-UID arrays, as JSON-serializable data.
+    """
+    info = SubnetMetagraphInfo.model_validate(
+        {name: getattr(metagraph, name) for name in SubnetMetagraphInfo.model_fields}
+    )
+    return {
+        "info": info.model_dump(mode="json"),
+        "identities": _identities_adapter.dump_python(
+            metagraph.identities, mode="json"
+        ),
+        "taoDividendsPerHotkey": metagraph.taoDividendsPerHotkey,
+        "alphaDividendsPerHotkey": metagraph.alphaDividendsPerHotkey,
+    }
+
+
+def _from_metadata(meta: Dict[str, Any], columns: Dict[str, Any]) -> ColumnarMetagraph:
+    """
+    Rebuild a metagraph from `_metadata` output and its per-UID `columns`, which are
+    used as is, e.g. memory-mapped arrays.
+    """
+    info = SubnetMetagraphInfo.model_validate(meta["info"])
+    return ColumnarMetagraph.model_construct(
+        **dict(info),
+        **columns,
+        identities=_identities_adapter.validate_python(meta["identities"]),
+        taoDividendsPerHotkey=[
+            (hotkey, float(value)) for hotkey, value in meta["taoDividendsPerHotkey"]
+        ],
+        alphaDividendsPerHotkey=[
+            (hotkey, float(value)) for hotkey, value in meta["alphaDividendsPerHotkey"]
+        ],
+    )
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from kami.types import SetWeightsPayload, SubnetHyperparameters
+
+
+def commit_epoch(block: int, netuid: int, tempo: int) -> int:
+    """
+    Epoch of `block` on a subnet, as used to pick the reveal round of a commit.
+    """
+    return (block + netuid + 1) // (tempo + 1)
+
+
+@dataclass(frozen=True)
+class PreparedCommit:
+    """
+    A timelock-encrypted weights commit, ready to submit.
+
+    The reveal round is derived from the commit's epoch and the time it was
+    encrypted, so the commit stays valid until the epoch ends.
+    """
+
+    netuid: int
+    epoch: int
+    tempo: int
+    reveal_period: int
+    dests: Tuple[int, ...]
+    weights: Tuple[int, ...]
+    version_key: int
+    commit: bytes
+    reveal_round: int
+
+    def is_valid_for(
+        self,
+        payload: SetWeightsPayload,
+        hyperparameters: SubnetHyperparameters,
+        block: int,
+    ) -> bool:
+        """
+        Whether this commit can be submitted for `payload` at `block`.
+        """
+        return (
+            self.netuid == payload.netuid
+            and self.dests == tuple(payload.dests)
+            and self.weights == tuple(payload.weights)
+            and self.version_key == payload.version_key
+            and self.tempo == hyperparameters.tempo
+            and self.reveal_period == hyperparameters.commitRevealPeriod
+            and self.epoch == commit_epoch(block, payload.netuid, self.tempo)
+        )
+
+
+def encrypt_commit(
+    payload: SetWeightsPayload, hyperparameters: SubnetHyperparameters, block: int
+) -> PreparedCommit:
+    """
+    Encrypt `payload` for the commit-reveal weights extrinsic.
+
+    This is CPU-bound and blocking; `Kami` runs it in an executor.
+    `bittensor_commit_reveal` is only imported on the first call.
+
+    Args:
+        payload (SetWeightsPayload): The weights to commit.
+        hyperparameters (SubnetHyperparameters): The subnet's hyperparameters.
+        block (int): The current block.
+
+    Returns:
+        PreparedCommit: The encrypted commit and its reveal round.
+    """
+    tempo = hyperparameters.tempo
+    reveal_period = hyperparameters.commitRevealPeriod
+    if tempo == 0 or reveal_period == 0:
+        raise ValueError(
+            "Tempo and reveal round must be greater than 0 for commit reveal weights."
+        )
+
+    from bittensor_commit_reveal import get_encrypted_commit  # type: ignore
+
+    # Encrypt `commit_hash` with t-lock and `get reveal_round`
+    commit, reveal_round = get_encrypted_commit(  # type: ignore
+        uids=payload.dests,
+        weights=payload.weights,
+        version_key=payload.version_key,
+        tempo=tempo,
+        current_block=block,
+        netuid=payload.netuid,
+        subnet_reveal_period_epochs=reveal_period,
+    )
+    return PreparedCommit(
+        netuid=payload.netuid,
+        epoch=commit_epoch(block, payload.netuid, tempo),
+        tempo=tempo,
+        reveal_period=reveal_period,
+        dests=tuple(payload.dests),
+        weights=tuple(payload.weights),
+        version_key=payload.version_key,
+        commit=commit,
+        reveal_round=reveal_round,
+    )
@@ -0,0 +1,55 @@
+import os
+
+import aiohttp
+from pydantic import BaseModel
+
+
+class ConnectionConfig(BaseModel):
+    """
+    Connection pool, keep-alive and timeout settings of the `Kami` HTTP session.
+
+    Timeouts are in seconds; None disables that timeout. Set `unix_socket` to talk
+    to a Kami server on the same host over a Unix domain socket instead of TCP.
+    """
+
+    # Connection pool
+    limit: int = 100
+    limit_per_host: int = 32
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: int | None = 300
+    # Timeouts
+    total_timeout: float | None = 30.0
+    connect_timeout: float | None = 5.0
+    read_timeout: float | None = 15.0
+    # Transport
+    unix_socket: str | None = None
+
+    @classmethod
+    def from_env(cls) -> "ConnectionConfig":
+        """
+        Build a config from defaults, with the transport taken from `KAMI_UNIX_SOCKET`.
+        """
+        return cls(unix_socket=os.getenv("KAMI_UNIX_SOCKET") or None)
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+
+    def connector(self) -> aiohttp.BaseConnector:
+        if self.unix_socket is not None:
+            return aiohttp.UnixConnector(
+                path=self.unix_socket,
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.ttl_dns_cache is not None,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
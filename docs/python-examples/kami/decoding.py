@@ -0,0 +1,65 @@
+import json
+from typing import Any
+
+# Use the fastest JSON parser available, in order of preference. Both are optional
+# dependencies (`pip install kami[fast]`).
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+
+    def loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+except ImportError:
+    try:
+        import msgspec
+
+        JSON_BACKEND = "msgspec"
+        _decoder = msgspec.json.Decoder()
+
+        def loads(raw: bytes) -> Any:
+            try:
+                return _decoder.decode(raw)
+            except msgspec.DecodeError as e:
+                # Keep the error type callers already handle.
+                raise json.JSONDecodeError(str(e), raw.decode(errors="replace"), 0)
+
+    except ImportError:
+        JSON_BACKEND = "json"
+
+        def loads(raw: bytes) -> Any:
+            return json.loads(raw)
+
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+# Extension types Kami packs arrays made only of numbers into, little-endian.
+_FLOAT64_ARRAY = 1
+_INT64_ARRAY = 2
+
+# MessagePack is optional too (`pip install kami[compact]`); without it the client
+# asks for JSON.
+try:
+    import msgpack
+    import numpy as np
+
+    MSGPACK_AVAILABLE = True
+
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code == _FLOAT64_ARRAY:
+            return np.frombuffer(data, dtype="<f8")
+        if code == _INT64_ARRAY:
+            return np.frombuffer(data, dtype="<i8")
+        return msgpack.ExtType(code, data)
+
+    def loads_msgpack(raw: bytes) -> Any:
+        """
+        Decode a MessagePack response, arrays of numbers into read-only NumPy arrays.
+        """
+        return msgpack.unpackb(raw, ext_hook=_ext_hook)
+
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+    def loads_msgpack(raw: bytes) -> Any:
+        raise RuntimeError("Install msgpack to decode MessagePack responses")
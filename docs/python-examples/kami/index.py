@@ -0,0 +1,79 @@
+from typing import Dict, List, Tuple
+
+from kami.columnar import ColumnarMetagraph
+from kami.types import AxonInfo, SubnetMetagraph
+
+_NO_UIDS: Tuple[int, ...] = ()
+
+
+class MetagraphIndex:
+    """
+    Constant-time lookups over one metagraph snapshot: hotkey to UID, coldkey to
+    UIDs and UID to `AxonInfo`.
+
+    Build it once per metagraph and reuse it until the metagraph changes; lookups
+    never scan the hotkey list.
+
+    Args:
+        metagraph (SubnetMetagraph | ColumnarMetagraph): The snapshot to index.
+    """
+
+    def __init__(self, metagraph: SubnetMetagraph | ColumnarMetagraph):
+        self.netuid = metagraph.netuid
+        self.block = metagraph.block
+        self.metagraph = metagraph
+        self.hotkey_to_uid: Dict[str, int] = {
+            hotkey: uid for uid, hotkey in enumerate(metagraph.hotkeys)
+        }
+        coldkey_to_uids: Dict[str, List[int]] = {}
+        for uid, coldkey in enumerate(metagraph.coldkeys):
+            coldkey_to_uids.setdefault(coldkey, []).append(uid)
+        self.coldkey_to_uids: Dict[str, Tuple[int, ...]] = {
+            coldkey: tuple(uids) for coldkey, uids in coldkey_to_uids.items()
+        }
+        # Columnar axons are converted to `AxonInfo` on first use.
+        self._axons: Dict[int, AxonInfo] = (
+            {}
+            if isinstance(metagraph, ColumnarMetagraph)
+            else dict(enumerate(metagraph.axons))
+        )
+
+    def __len__(self) -> int:
+        return len(self.metagraph.hotkeys)
+
+    def __contains__(self, hotkey: object) -> bool:
+        return hotkey in self.hotkey_to_uid
+
+    def uid(self, hotkey: str) -> int | None:
+        """
+        UID of `hotkey`, or None if it is not registered.
+        """
+        return self.hotkey_to_uid.get(hotkey)
+
+    def uids(self, coldkey: str) -> Tuple[int, ...]:
+        """
+        UIDs owned by `coldkey`, in ascending order.
+        """
+        return self.coldkey_to_uids.get(coldkey, _NO_UIDS)
+
+    def axon(self, uid: int) -> AxonInfo:
+        """
+        Axon of `uid`.
+
+        Raises:
+            IndexError: If `uid` does not exist.
+        """
+        axon = self._axons.get(uid)
+        if axon is None:
+            if not 0 <= uid < len(self):
+                raise IndexError(f"UID {uid} not in metagraph of netuid {self.netuid}")
+            assert isinstance(self.metagraph, ColumnarMetagraph)
+            axon = self._axons[uid] = self.metagraph.get_axon(uid)
+        return axon
+
+    def axon_of(self, hotkey: str) -> AxonInfo | None:
+        """
+        Axon of the UID registered to `hotkey`, or None if it is not registered.
+        """
+        uid = self.hotkey_to_uid.get(hotkey)
+        return None if uid is None else self.axon(uid)
@@ -1,12 +1,43 @@
+import asyncio
 import json
 import os
-from typing import Any, Dict
+import time
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+)
 
 import aiohttp
-from bittensor_commit_reveal import get_encrypted_commit  # type: ignore
-from bittensor.utils.networking import ip_to_int
 from loguru import logger
 
+from kami.batch import NetuidResult, fan_out, fan_out_ordered
+from kami.blocks import BlockStream, OverflowPolicy
+from kami.cache import BaseCache, ETagCache, Validator, make_cache_key
+from kami.columnar import ColumnarMetagraph
+from kami.commit_reveal import PreparedCommit, encrypt_commit
+from kami.config import ConnectionConfig
+from kami.decoding import (
+    MSGPACK_AVAILABLE,
+    MSGPACK_CONTENT_TYPE,
+    loads,
+    loads_msgpack,
+)
+from kami.index import MetagraphIndex
+from kami.metagraph_stream import MetagraphStream
+from kami.metrics import Metrics, RequestTrace
+from kami.networking import ip_to_int
+from kami.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, remaining_time
+from kami.signing import verify_signature
+from kami.singleflight import SingleFlight
+from kami.store import SnapshotStore
 from kami.types import (
     AxonInfo,
     ServeAxonPayload,
@@ -14,68 +45,250 @@ from kami.types import (
     SubnetHyperparameters,
     SubnetMetagraph,
     KeyringPairInfo,
+    SubstrateHealth,
+    TimelockedWeightsPayload,
 )
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Sent with metagraph requests of compact clients. Kami only offers MessagePack on
+# `chain/subnet-metagraph` and answers in JSON if a route has no MessagePack form.
+_COMPACT_ACCEPT = f"{MSGPACK_CONTENT_TYPE}, application/json;q=0.9"
+# Added to the cache keys of compact requests, whose responses hold NumPy arrays, so
+# they are never shared with JSON requests of the same endpoint.
+_COMPACT_KEY = {"format": "msgpack"}
+
+
+class _RetryableStatus(Exception):
+    def __init__(self, status: int, decode: Callable[[], Tuple[int, Any]]):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        # Decodes the response, for when it turns out to be the last attempt.
+        self.decode = decode
+
+
+async def _gather_bounded(
+    items: Iterable[T], call: Callable[[T], Awaitable[R]], concurrency: int
+) -> List[R]:
+    if concurrency <= 0:
+        raise ValueError("concurrency must be greater than 0")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await call(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
 
 class Kami:
     """
     Kami is a class that handles the connection to the Kami API.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: BaseCache | None = None,
+        coalesce: bool = True,
+        config: ConnectionConfig | None = None,
+        commit_executor: Executor | None = None,
+        compact: bool = True,
+        metrics: Metrics | None = None,
+        retry: RetryPolicy | None = None,
+        revalidate: bool = True,
+        url: str | None = None,
+        store: SnapshotStore | None = None,
+    ):
+        """
+        Args:
+            cache (BaseCache | None): Optional response cache for GET requests, e.g.
+                `ResponseCache()`. Responses are not cached if None.
+            coalesce (bool): If True, concurrent GET requests for the same endpoint and
+                params share a single HTTP request and decoded response.
+            config (ConnectionConfig | None): Connection pool, timeout and transport
+                settings. Defaults to `ConnectionConfig.from_env()`.
+            commit_executor (Executor | None): Thread or process pool that runs the
+                commit-reveal encryption. Uses the event loop's default executor if None.
+            compact (bool): If True and `msgpack` is installed, `get_metagraph` asks
+                for MessagePack, which Kami packs per-UID columns into as typed
+                arrays, and decodes them straight into NumPy arrays.
+            metrics (Metrics | None): Records per-endpoint, per-phase latency histograms
+                and counters, see `export_metrics`. Nothing is recorded if None.
+            retry (RetryPolicy | None): Retry, backoff and circuit breaker settings.
+                Defaults to `RetryPolicy()`; use `RetryPolicy(max_retries=0,
+                failure_threshold=0)` to send every request exactly once.
+            revalidate (bool): If True, GET requests for a response that carried an
+                ETag are sent with `If-None-Match`, and a 304 Not Modified answer
+                reuses the previous response, see `ETagCache`.
+            url (str | None): Base URL of the Kami server, e.g. `http://10.0.0.2:8882`.
+                Read from `KAMI_HOST`/`KAMI_PORT` if None.
+            store (SnapshotStore | None): Persists every metagraph fetched, and
+                hyperparameters whenever they change, keyed by netuid and block.
+        """
+        self.config = config or ConnectionConfig.from_env()
+        self.session: aiohttp.ClientSession | None = None
+        self._session_lock = asyncio.Lock()
+        self.cache = cache
+        self.inflight: SingleFlight | None = SingleFlight() if coalesce else None
+        self.etags: ETagCache | None = ETagCache() if revalidate else None
+        self.commit_executor = commit_executor
+        self.compact = compact and MSGPACK_AVAILABLE
+        self._prepared_commits: Dict[int, PreparedCommit] = {}
+        self._indexes: Dict[int, MetagraphIndex] = {}
+        self.metrics = metrics
+        self.retry = retry or RetryPolicy()
+        self.circuit_breaker: CircuitBreaker | None = (
+            CircuitBreaker(self.retry.failure_threshold, self.retry.reset_timeout)
+            if self.retry.failure_threshold > 0
+            else None
+        )
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self.store = store
+        # Latest block seen in any response.
+        self.latest_block: int | None = None
+        self._stored_hyperparameters: Dict[int, SubnetHyperparameters] = {}
+        if url is not None:
+            self.url = url.rstrip("/")
+            return
+
         kami_host = os.getenv("KAMI_HOST")
         kami_port = os.getenv("KAMI_PORT")
+        if self.config.unix_socket is not None:
+            # Only used for the Host header, the socket path decides where we connect.
+            kami_host = kami_host or "localhost"
+            kami_port = kami_port or "80"
         if kami_host is None:
             raise ValueError("Require KAMI_HOST to be set in environment variables")
         if kami_port is None:
             raise ValueError("Require KAMI_PORT to be set in environment variables")
 
         self.url = f"http://{kami_host}:{kami_port}"
-        self.session: aiohttp.ClientSession | None = None
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+
+    async def __aenter__(self) -> "Kami":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.close()
 
     async def _ensure_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        if self.session is not None and not self.session.closed:
+            return
+        async with self._session_lock:
+            if self.session is None or self.session.closed:
+                trace_configs = []
+                if self.metrics is not None:
+                    trace_configs.append(self.metrics.trace_config())
+                self.session = aiohttp.ClientSession(
+                    connector=self.config.connector(),
+                    timeout=self.config.timeout(),
+                    trace_configs=trace_configs,
+                )
 
     async def close(self):
         """
-        Close the aiohttp session.
+        Close the aiohttp session, cancelling GET requests that are still in flight.
         """
-        if self.session is not None:
-            await self.session.close()
+        if self.inflight is not None:
+            self.inflight.cancel()
+        async with self._session_lock:
+            if self.session is not None:
+                await self.session.close()
+                self.session = None
 
     async def get(
-        self, endpoint: str, params: Dict[str, Any] | None = None
+        self,
+        endpoint: str,
+        params: Dict[str, Any] | None = None,
+        *,
+        compact: bool = False,
     ) -> Dict[str, Any]:
         """
         Send a GET request to the Kami API.
 
+        Connection errors, timeouts and overloaded responses are retried with backoff
+        according to `RetryPolicy`, within the current `deadline` if there is one.
+
         Args:
             endpoint (str): The API endpoint to send the request to.
             params (Dict[str, Any] | None): Optional query parameters to include in the request.
+            compact (bool): Ask for MessagePack, which requires `msgpack`. On routes
+                that offer it, arrays of numbers come back as read-only NumPy arrays
+                instead of lists.
 
         Returns:
-            Dict[str, Any]: The JSON response from the API.
+            Dict[str, Any]: The JSON response from the API. Responses served from the
+                cache or shared with concurrent callers are the same object for every
+                caller and must not be mutated.
         """
+        cache_key = make_cache_key(endpoint, params)
+        if compact:
+            if not MSGPACK_AVAILABLE:
+                raise RuntimeError("Compact responses need `pip install kami[compact]`")
+            cache_key = make_cache_key(cache_key, _COMPACT_KEY)
+        if self.cache is not None:
+            hit, cached = self.cache.get(cache_key)
+            if hit:
+                return cached
+        if self.etags is not None:
+            hit, cached = self.etags.fresh(cache_key)
+            if hit:
+                return cached
+        if self.inflight is None:
+            return await self._get(endpoint, params, cache_key, compact)
+        remaining = remaining_time()
+        if remaining is None:
+            return await self.inflight.do(
+                cache_key, lambda: self._get(endpoint, params, cache_key, compact)
+            )
+        # The shared request runs under the deadline of the caller that started it,
+        # bound the wait of every caller by its own deadline.
         try:
-            await self._ensure_session()
-            if self.session is None:
-                raise ValueError("Session is not initialized.")
-            url = f"{self.url}/{endpoint}"
-            async with self.session.get(
-                url, headers=self.headers, params=params
-            ) as response:
-                return await response.json()
+            async with asyncio.timeout(max(remaining, 0)):
+                return await self.inflight.do(
+                    cache_key, lambda: self._get(endpoint, params, cache_key, compact)
+                )
+        except TimeoutError as e:
+            message = f"Timed out waiting for Kami API: {endpoint}"
+            logger.error(message)
+            raise RuntimeError(message) from e
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: Dict[str, Any] | None,
+        cache_key: str,
+        compact: bool = False,
+    ) -> Dict[str, Any]:
+        try:
+            result = await self._request(
+                "GET", endpoint, params=params, compact=compact
+            )
+            if self.cache is not None and result.get("success", True):
+                self.cache.set(cache_key, result)
+            return result
+        except CircuitOpenError:
+            raise
         except aiohttp.ClientError as e:
             message = f"Error connecting to Kami API: {e}"
             logger.error(message)
+            if self.metrics is not None:
+                self.metrics.increment("errors", endpoint)
             raise RuntimeError(f"Error connecting to Kami API: {e}")
+        except asyncio.TimeoutError as e:
+            message = f"Timed out waiting for Kami API: {endpoint}"
+            logger.error(message)
+            if self.metrics is not None:
+                self.metrics.increment("timeouts", endpoint)
+            raise RuntimeError(message) from e
         except json.decoder.JSONDecodeError as e:
             logger.error(f"Error decoding JSON response: {e}")
+            if self.metrics is not None:
+                self.metrics.increment("errors", endpoint)
             raise e
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
@@ -87,6 +300,8 @@ class Kami:
         """
         Send a POST request to the Kami API.
 
+        Only retried if the connection could not be established, see `RetryPolicy`.
+
         Args:
             endpoint (str): The API endpoint to send the request to.
             data (Dict[str, Any] | None): Optional data to include in the request body.
@@ -95,38 +310,368 @@ class Kami:
             Dict[str, Any]: The JSON response from the API.
         """
         try:
-            await self._ensure_session()
-            if self.session is None:
-                raise ValueError("Session is not initialized.")
-            url = f"{self.url}/{endpoint}"
-            async with self.session.post(
-                url, headers=self.headers, json=data
-            ) as response:
-                return await response.json()
+            return await self._request("POST", endpoint, json=data)
+        except CircuitOpenError:
+            raise
         except aiohttp.ClientError as e:
             message = f"Error connecting to Kami API: {e}"
             logger.error(message)
+            if self.metrics is not None:
+                self.metrics.increment("errors", endpoint)
             raise RuntimeError(message)
+        except asyncio.TimeoutError as e:
+            message = f"Timed out waiting for Kami API: {endpoint}"
+            logger.error(message)
+            if self.metrics is not None:
+                self.metrics.increment("timeouts", endpoint)
+            raise RuntimeError(message) from e
         except json.decoder.JSONDecodeError as e:
             logger.error(f"Error decoding JSON response: {e}")
+            if self.metrics is not None:
+                self.metrics.increment("errors", endpoint)
             raise e
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             raise e
 
-    async def get_metagraph(self, netuid: int) -> SubnetMetagraph:
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        await self._ensure_session()
+        if self.session is None:
+            raise ValueError("Session is not initialized.")
+        url = f"{self.url}/{endpoint}"
+        policy = self.retry
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request(endpoint)
+            final = attempt >= policy.max_retries
+            try:
+                status, result = await self._send(
+                    method, endpoint, url, method == "GET" and not final, **kwargs
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError, _RetryableStatus) as e:
+                remaining = remaining_time()
+                # Running out of the caller's budget says nothing about Kami's health.
+                if breaker is not None and (remaining is None or remaining > 0):
+                    breaker.record_failure(endpoint)
+                # A POST that reached Kami may have been submitted, only retry it if
+                # the connection was never established.
+                retryable = method == "GET" or isinstance(
+                    e, aiohttp.ClientConnectorError
+                )
+                if final or not retryable:
+                    raise
+                delay = policy.delay(attempt)
+                if remaining is not None and delay >= remaining:
+                    if isinstance(e, _RetryableStatus):
+                        # No time for another attempt, so this response is the last.
+                        return e.decode()[1]
+                    raise
+                logger.warning(
+                    f"Retrying {method} {endpoint} in {delay:.2f}s after: {e!r}"
+                )
+                if self.metrics is not None:
+                    self.metrics.increment("retries", endpoint)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if breaker is not None:
+                if status in policy.retry_statuses:
+                    breaker.record_failure(endpoint)
+                else:
+                    breaker.record_success(endpoint)
+            return result
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        retry_status: bool,
+        compact: bool = False,
+        **kwargs: Any,
+    ) -> Tuple[int, Any]:
+        assert self.session is not None
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            total = self.config.total_timeout
+            kwargs["timeout"] = aiohttp.ClientTimeout(
+                total=remaining if total is None else min(total, remaining),
+                connect=self.config.connect_timeout,
+                sock_read=self.config.read_timeout,
+            )
+        headers = self.headers
+        key = None
+        validator: Validator | None = None
+        if compact:
+            headers = {**headers, "Accept": _COMPACT_ACCEPT}
+        if method == "GET" and self.etags is not None:
+            key = make_cache_key(endpoint, kwargs.get("params"))
+            if compact:
+                key = make_cache_key(key, _COMPACT_KEY)
+            validator = self.etags.get(key)
+            if validator is not None:
+                headers = {**headers, "If-None-Match": validator.etag}
+        metrics = self.metrics
+        if metrics is None:
+            async with self.session.request(
+                method, url, headers=headers, **kwargs
+            ) as response:
+                raw = await response.read()
+            if retry_status and response.status in self.retry.retry_statuses:
+                raise _RetryableStatus(
+                    response.status,
+                    lambda: self._decode(response, raw, key, validator),
+                )
+            return self._decode(response, raw, key, validator)
+
+        trace = RequestTrace()
+        started = time.perf_counter()
+        async with self.session.request(
+            method, url, headers=headers, trace_request_ctx=trace, **kwargs
+        ) as response:
+            raw = await response.read()
+        received = time.perf_counter()
+        if retry_status and response.status in self.retry.retry_statuses:
+            metrics.increment("requests", endpoint)
+            raise _RetryableStatus(
+                response.status, lambda: self._decode(response, raw, key, validator)
+            )
+        status, result = self._decode(response, raw, key, validator)
+        if response.status == 304:
+            metrics.increment("not_modified", endpoint)
+        metrics.record_request(
+            endpoint, trace, started, received, time.perf_counter(), len(raw)
+        )
+        return status, result
+
+    def _decode(
+        self,
+        response: aiohttp.ClientResponse,
+        raw: bytes,
+        key: str | None,
+        validator: Validator | None,
+    ) -> Tuple[int, Any]:
+        if key is None or self.etags is None:
+            return response.status, self._loads(response, raw)
+        cache_control = response.headers.get("Cache-Control")
+        if response.status == 304 and validator is not None:
+            return 200, self.etags.refresh(key, validator, cache_control)
+        result = self._loads(response, raw)
+        etag = response.headers.get("ETag")
+        if etag is not None and response.status == 200:
+            self.etags.set(key, etag, result, cache_control)
+        return response.status, result
+
+    @staticmethod
+    def _loads(response: aiohttp.ClientResponse, raw: bytes) -> Any:
+        if response.content_type == MSGPACK_CONTENT_TYPE:
+            return loads_msgpack(raw)
+        return loads(raw)
+
+    def _validate(self, endpoint: str, parse: Callable[[Any], R], data: Any) -> R:
+        if self.metrics is None:
+            return parse(data)
+        started = time.perf_counter()
+        result = parse(data)
+        self.metrics.observe(endpoint, "validate", time.perf_counter() - started)
+        return result
+
+    def export_metrics(self) -> str:
+        """
+        Render the client's metrics, including response cache and request coalescing
+        stats, in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics snapshot.
+        """
+        if self.metrics is None:
+            raise RuntimeError("Metrics are disabled, pass `metrics=Metrics()` to Kami")
+        return self.metrics.to_prometheus(cache=self.cache, inflight=self.inflight)
+
+    @staticmethod
+    def _data(result: Dict[str, Any], endpoint: str) -> Any:
+        if not result.get("success", True):
+            raise RuntimeError(f"Kami API error on {endpoint}: {result.get('error')}")
+        return result.get("data", {})
+
+    def _invalidate_metagraph(self, netuid: int):
+        if self.cache is not None:
+            self.cache.invalidate(f"chain/subnet-metagraph/{netuid}")
+
+    async def get_metagraph(
+        self, netuid: int, columnar: bool = False, block: int | None = None
+    ) -> SubnetMetagraph | ColumnarMetagraph:
         """
         Get the metagraph for a given netuid.
 
         Args:
             netuid (int): The netuid to get the metagraph for.
+            columnar (bool): If True, decode per-UID fields into NumPy arrays and
+                return a `ColumnarMetagraph` instead of a `SubnetMetagraph`.
+            block (int | None): Read the metagraph as of this block instead of the
+                latest one. Served from the `store` without a request if it holds
+                a snapshot of that block.
 
         Returns:
-            SubnetMetagraph: The subnet metagraph object.
+            SubnetMetagraph | ColumnarMetagraph: The subnet metagraph object.
         """
-        get_metagraph = await self.get(f"chain/subnet-metagraph/{netuid}")
-        metagraph = get_metagraph.get("data", {})
-        return SubnetMetagraph.model_validate(metagraph)
+        if block is not None and self.store is not None:
+            stored = await asyncio.to_thread(self.store.load_metagraph, netuid, block)
+            if stored is not None:
+                return stored if columnar else stored.to_metagraph()
+        endpoint, metagraph = await self._get_metagraph_data(netuid, block)
+        result: SubnetMetagraph | ColumnarMetagraph
+        if columnar:
+            result = self._validate(
+                endpoint, ColumnarMetagraph.from_response, metagraph
+            )
+        else:
+            result = self._validate(endpoint, SubnetMetagraph.model_validate, metagraph)
+        self._observe_block(result.block)
+        if self.store is not None:
+            await self._store_metagraph(result)
+        return result
+
+    async def _get_metagraph_data(
+        self, netuid: int, block: int | None = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        # The one request, and so the one cache entry, behind every metagraph read.
+        endpoint = f"chain/subnet-metagraph/{netuid}"
+        params = None if block is None else {"block": block}
+        result = await self.get(endpoint, params, compact=self.compact)
+        return endpoint, result.get("data", {})
+
+    def _observe_block(self, block: int):
+        if self.latest_block is None or block > self.latest_block:
+            self.latest_block = block
+
+    async def _store_metagraph(self, metagraph: SubnetMetagraph | ColumnarMetagraph):
+        assert self.store is not None
+        if self.store.has_metagraph(metagraph.netuid, metagraph.block):
+            return
+        try:
+            await asyncio.to_thread(self.store.save_metagraph, metagraph)
+        except Exception as e:
+            logger.warning(f"Failed to store metagraph of netuid {metagraph.netuid}: {e}")
+
+    async def _store_hyperparameters(
+        self,
+        netuid: int,
+        hyperparameters: SubnetHyperparameters,
+        block: int | None = None,
+    ):
+        assert self.store is not None
+        latest = block is None
+        if block is None:
+            # Latest hyperparameters are stored at the latest block seen, only when
+            # they change.
+            if (
+                self.latest_block is None
+                or self._stored_hyperparameters.get(netuid) == hyperparameters
+            ):
+                return
+            block = self.latest_block
+        try:
+            await asyncio.to_thread(
+                self.store.save_hyperparameters, netuid, block, hyperparameters
+            )
+            if latest:
+                self._stored_hyperparameters[netuid] = hyperparameters
+        except Exception as e:
+            logger.warning(f"Failed to store hyperparameters of netuid {netuid}: {e}")
+
+    def get_metagraphs(
+        self, netuids: Iterable[int], concurrency: int = 8, columnar: bool = False
+    ) -> AsyncIterator[NetuidResult[SubnetMetagraph | ColumnarMetagraph]]:
+        """
+        Get the metagraphs of several netuids concurrently.
+
+        Results are yielded as each metagraph arrives, not in the order of `netuids`.
+        A netuid that fails is yielded with its `error` set and does not stop the
+        others. Use `contextlib.aclosing` to cancel outstanding requests when
+        breaking out of the loop early.
+
+        Args:
+            netuids (Iterable[int]): The netuids to get the metagraphs for.
+            concurrency (int): Maximum number of requests in flight at once.
+            columnar (bool): If True, yield `ColumnarMetagraph` objects.
+
+        Returns:
+            AsyncIterator[NetuidResult[SubnetMetagraph | ColumnarMetagraph]]: One result per netuid.
+        """
+        return fan_out(
+            netuids,
+            lambda netuid: self.get_metagraph(netuid, columnar=columnar),
+            concurrency,
+        )
+
+    def iter_metagraphs(
+        self,
+        netuid: int,
+        start: int,
+        end: int,
+        step: int = 1,
+        concurrency: int = 8,
+        columnar: bool = True,
+    ) -> AsyncIterator[SubnetMetagraph | ColumnarMetagraph]:
+        """
+        Get the metagraphs of a netuid at every `step`-th block from `start` to `end`,
+        e.g. for backtesting.
+
+        Blocks are fetched concurrently but yielded in ascending block order. With a
+        `store`, stored blocks are read from disk and fetched ones are stored, so a
+        block is only ever fetched once. A failing block raises when it is reached
+        and cancels the requests running ahead of it.
+
+            async for metagraph in kami.iter_metagraphs(1, 5_000_000, 5_007_200, 360):
+                ...
+
+        Args:
+            netuid (int): The netuid to get the metagraphs for.
+            start (int): The first block.
+            end (int): The last block, included.
+            step (int): Distance between blocks, e.g. the subnet's tempo.
+            concurrency (int): Maximum number of requests in flight at once.
+            columnar (bool): If True, yield `ColumnarMetagraph` objects.
+
+        Returns:
+            AsyncIterator[SubnetMetagraph | ColumnarMetagraph]: One metagraph per block.
+        """
+        if step <= 0:
+            raise ValueError("step must be greater than 0")
+        return fan_out_ordered(
+            range(start, end + 1, step),
+            lambda block: self.get_metagraph(netuid, columnar=columnar, block=block),
+            concurrency,
+        )
+
+    async def get_metagraph_index(self, netuid: int) -> MetagraphIndex:
+        """
+        Get a `MetagraphIndex` over the latest metagraph of a netuid.
+
+        The metagraph is read like `get_metagraph` reads it and shares its cache
+        entry. The index is rebuilt only when the metagraph's block changes, so with
+        a response cache repeated lookups cost a cache hit and a dict lookup.
+
+        Args:
+            netuid (int): The netuid to index.
+
+        Returns:
+            MetagraphIndex: Hotkey, coldkey and UID lookups over the metagraph.
+        """
+        endpoint, data = await self._get_metagraph_data(netuid)
+        index = self._indexes.get(netuid)
+        if index is not None and index.block == data.get("block"):
+            return index
+        metagraph = self._validate(endpoint, SubnetMetagraph.model_validate, data)
+        self._observe_block(metagraph.block)
+        index = MetagraphIndex(metagraph)
+        self._indexes[netuid] = index
+        return index
 
     async def get_hotkeys(self, netuid: int) -> list[str]:
         """
@@ -167,22 +712,127 @@ class Kami:
                     int: The current finalized block number.
         """
         result = await self.get("chain/latest-block")
-        latest_block = result.get("data", {}).get("blockNumber", "")
-        return int(latest_block)
+        latest_block = int(result.get("data", {}).get("blockNumber", ""))
+        self._observe_block(latest_block)
+        if self.cache is not None:
+            self.cache.observe_block(latest_block)
+        return latest_block
+
+    def subscribe_blocks(
+        self,
+        finalised: bool = True,
+        maxsize: int = 64,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        max_backfill: int = 64,
+    ) -> BlockStream:
+        """
+        Subscribe to new blocks over the Kami websocket.
+
+        Args:
+            finalised (bool): Subscribe to finalised blocks if True, new blocks otherwise.
+            maxsize (int): Maximum number of blocks queued for the consumer.
+            overflow (OverflowPolicy | str): What to do when the queue is full:
+                "drop-oldest", "coalesce-to-latest" or "block".
+            max_backfill (int): Largest gap of missed finalised blocks to backfill.
+
+        Returns:
+            BlockStream: An async iterator of `BlockEvent`s. Use it as an async context
+                manager to close the subscription.
+        """
+        connector_factory = None
+        if self.config.unix_socket is not None:
+            connector_factory = self.config.connector
+        return BlockStream(
+            self.url,
+            finalised=finalised,
+            maxsize=maxsize,
+            overflow=overflow,
+            max_backfill=max_backfill,
+            connector_factory=connector_factory,
+        )
+
+    def subscribe_metagraph(
+        self, netuids: Iterable[int], columnar: bool = False, maxsize: int = 64
+    ) -> MetagraphStream:
+        """
+        Subscribe to metagraph updates pushed by Kami on every finalised block.
+
+        Kami sends a full snapshot per subnet, then only the fields and UIDs that
+        changed, which the stream applies to a local copy. Unlike polling
+        `get_metagraph` on every block, each subnet is read once per block on the
+        Kami host however many clients subscribe to it.
+
+        Args:
+            netuids (Iterable[int]): The subnets to subscribe to.
+            columnar (bool): Decode metagraphs into `ColumnarMetagraph`s.
+            maxsize (int): Maximum number of updates queued for the consumer.
 
-    async def get_subnet_hyperparameters(self, netuid: int) -> SubnetHyperparameters:
+        Returns:
+            MetagraphStream: An async iterator of `MetagraphUpdate`s. Use it as an
+                async context manager to close the subscription.
+        """
+        connector_factory = None
+        if self.config.unix_socket is not None:
+            connector_factory = self.config.connector
+        return MetagraphStream(
+            self.url,
+            netuids,
+            columnar=columnar,
+            maxsize=maxsize,
+            connector_factory=connector_factory,
+        )
+
+    async def get_subnet_hyperparameters(
+        self, netuid: int, block: int | None = None
+    ) -> SubnetHyperparameters:
         """
         Get the subnet hyperparameters for a given netuid.
 
         Args:
             netuid (int): The netuid to get the hyperparameters for.
+            block (int | None): Read the hyperparameters as of this block instead of
+                the latest ones. Served from the `store` without a request if it
+                holds them for exactly that block.
 
         Returns:
             SubnetHyperparameters: The subnet hyperparameters object.
         """
-        result = await self.get(f"chain/subnet-hyperparameters/{netuid}")
-        hyperparameters = result.get("data", {})
-        return SubnetHyperparameters.model_validate(hyperparameters)
+        if (
+            block is not None
+            and self.store is not None
+            and self.store.has_hyperparameters(netuid, block)
+        ):
+            stored = await asyncio.to_thread(
+                self.store.load_hyperparameters, netuid, block
+            )
+            if stored is not None:
+                return stored
+        endpoint = f"chain/subnet-hyperparameters/{netuid}"
+        params = None if block is None else {"block": block}
+        result = await self.get(endpoint, params)
+        hyperparameters = self._validate(
+            endpoint, SubnetHyperparameters.model_validate, result.get("data", {})
+        )
+        if self.store is not None:
+            await self._store_hyperparameters(netuid, hyperparameters, block)
+        return hyperparameters
+
+    def get_subnet_hyperparameters_many(
+        self, netuids: Iterable[int], concurrency: int = 8
+    ) -> AsyncIterator[NetuidResult[SubnetHyperparameters]]:
+        """
+        Get the subnet hyperparameters of several netuids concurrently.
+
+        Results are yielded as they arrive; see `get_metagraphs`.
+
+        Args:
+            netuids (Iterable[int]): The netuids to get the hyperparameters for.
+            concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            AsyncIterator[NetuidResult[SubnetHyperparameters]]: One result per netuid.
+        """
+        return fan_out(netuids, self.get_subnet_hyperparameters, concurrency)
 
     async def is_hotkey_registered(
         self, netuid: int, hotkey: str, block: int | None = None
@@ -193,20 +843,20 @@ class Kami:
         Args:
             netuid (int): The netuid to check.
             hotkey (str): The hotkey to check.
-            block (int | None): Optional block number to check at. If None, uses the latest block.
+            block (int | None): Optional block number to check at. If None, uses the
+                latest block, answered from `get_metagraph_index` if there is a
+                response cache to keep the metagraph in.
 
         Returns:
             bool: True if the hotkey is registered, False otherwise.
         """
-        result = dict[str, bool]()
-        if block is None:
-            result = await self.get(
-                f"chain/check-hotkey?netuid={netuid}&hotkey={hotkey}"
-            )
-        else:
-            result = await self.get(
-                f"chain/check-hotkey?netuid={netuid}&hotkey={hotkey}&block={block}"
-            )
+        if block is None and self.cache is not None:
+            index = await self.get_metagraph_index(netuid)
+            return hotkey in index
+        endpoint = f"chain/check-hotkey?netuid={netuid}&hotkey={hotkey}"
+        if block is not None:
+            endpoint += f"&block={block}"
+        result = await self.get(endpoint)
         return result.get("data", {}).get("isHotkeyValid", False)
 
     async def serve_axon(self, payload: ServeAxonPayload) -> Dict[str, Any]:
@@ -219,14 +869,57 @@ class Kami:
         Returns:
             Dict[str, Any]: The JSON response from the API.
         """
-        return await self.post("chain/serve-axon", data=payload.model_dump())
+        result = await self.post("chain/serve-axon", data=payload.model_dump())
+        self._invalidate_metagraph(payload.netuid)
+        return result
+
+    async def _encrypt_commit(
+        self,
+        payload: SetWeightsPayload,
+        hyperparameters: SubnetHyperparameters,
+        block: int,
+    ) -> PreparedCommit:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.commit_executor,
+            encrypt_commit,
+            payload,
+            hyperparameters,
+            block,
+        )
+
+    async def prepare_commit(self, payload: SetWeightsPayload) -> PreparedCommit | None:
+        """
+        Encrypt a commit-reveal weights commit ahead of `set_weights`.
+
+        The commit is kept and used by the next `set_weights` call with the same
+        payload, as long as that call happens in the same epoch. Call this as soon as
+        scores are ready, e.g. at the start of an epoch, to take the encryption off
+        the submission path.
+
+        Args:
+            payload (SetWeightsPayload): The payload that will be passed to `set_weights`.
+
+        Returns:
+            PreparedCommit | None: The prepared commit, or None if commit-reveal is not
+                enabled on the subnet.
+        """
+        hyperparameters, block = await asyncio.gather(
+            self.get_subnet_hyperparameters(payload.netuid), self.get_current_block()
+        )
+        if not hyperparameters.commitRevealWeightsEnabled:
+            return None
+        prepared = await self._encrypt_commit(payload, hyperparameters, block)
+        self._prepared_commits[payload.netuid] = prepared
+        return prepared
 
     async def set_weights(self, payload: SetWeightsPayload) -> Dict[str, Any]:
         """
         Set weights for neurons in the network.
 
         Handles both standard weight setting and commit-reveal weight setting
-        based on subnet hyperparameters.
+        based on subnet hyperparameters. Commits are encrypted in `commit_executor`,
+        or taken from `prepare_commit` if one was prepared for this payload and epoch.
 
         Args:
             payload (SetWeightsPayload): The payload containing weights information.
@@ -234,42 +927,42 @@ class Kami:
         Returns:
             Dict[str, Any]: The JSON response from the API.
         """
-        get_hpams = await self.get_subnet_hyperparameters(payload.netuid)
+        # Only commit-reveal needs the block, fetch it alongside the hyperparameters
+        # and cancel it if it turns out to be unused.
+        block = asyncio.ensure_future(self.get_current_block())
+        try:
+            get_hpams = await self.get_subnet_hyperparameters(payload.netuid)
+            if get_hpams.commitRevealWeightsEnabled:
+                current_block = await block
+        finally:
+            block.cancel()
         if get_hpams.commitRevealWeightsEnabled:
             tempo = get_hpams.tempo
             reveal_period = get_hpams.commitRevealPeriod
-            if tempo == 0 or reveal_period == 0:
-                raise ValueError(
-                    "Tempo and reveal round must be greater than 0 for commit reveal weights."
-                )
-
             print(
                 f"Commit reveal weights enabled: tempo: {tempo}, reveal_period: {reveal_period}"
             )
 
-            # Encrypt `commit_hash` with t-lock and `get reveal_round`
-            commit_for_reveal, reveal_round = get_encrypted_commit(  # type: ignore
-                uids=payload.dests,
-                weights=payload.weights,
-                version_key=payload.version_key,
-                tempo=tempo,
-                current_block=await self.get_current_block(),
-                netuid=payload.netuid,
-                subnet_reveal_period_epochs=reveal_period,
-            )
+            prepared = self._prepared_commits.pop(payload.netuid, None)
+            if prepared is None or not prepared.is_valid_for(
+                payload, get_hpams, current_block
+            ):
+                prepared = await self._encrypt_commit(payload, get_hpams, current_block)
 
-            print(f"Commit for reveal: {commit_for_reveal}")
-            print(f"Reveal round: {reveal_round}")
+            print(f"Commit for reveal: {prepared.commit}")
+            print(f"Reveal round: {prepared.reveal_round}")
 
             cr_payload: dict[str, int | str] = {
                 "netuid": payload.netuid,
-                "commit": commit_for_reveal.hex(),  # type: ignore
-                "reveal_round": reveal_round,
+                "commit": prepared.commit.hex(),
+                "reveal_round": prepared.reveal_round,
             }
 
-            return await self.post("chain/set-commit-reveal-weights", data=cr_payload)
-
-        return await self.post("chain/set-weights", data=payload.model_dump())
+            result = await self.post("chain/set-commit-reveal-weights", data=cr_payload)
+        else:
+            result = await self.post("chain/set-weights", data=payload.model_dump())
+        self._invalidate_metagraph(payload.netuid)
+        return result
 
     async def get_keyring_pair_info(self) -> KeyringPairInfo:
         """
@@ -282,9 +975,13 @@ class Kami:
     async def check_if_axon_served(self, axon_payload: ServeAxonPayload) -> bool:
         keyring_pair_info = await self.get_keyring_pair_info()
         hotkey = keyring_pair_info.keyringPair.address
-        metagraph = await self.get_metagraph(axon_payload.netuid)
-        uid = metagraph.hotkeys.index(hotkey)
-        current_axon: AxonInfo = metagraph.axons[uid]
+        index = await self.get_metagraph_index(axon_payload.netuid)
+        current_axon = index.axon_of(hotkey)
+        if current_axon is None:
+            logger.info(
+                f"Hotkey {hotkey} is not registered on netuid {axon_payload.netuid}"
+            )
+            return False
         current_axon_ip: str = current_axon.ip
         current_axon_port = current_axon.port
 
@@ -308,4 +1005,135 @@ class Kami:
         result = await self.get("substrate/available-runtime-apis")
         return result.get("data", {})
 
+    async def get_runtime_spec_version(self) -> int:
+        """
+        Get the runtime spec version of the chain.
+        """
+        result = await self.get("substrate/runtime-spec-version")
+        return int(self._data(result, "substrate/runtime-spec-version")["specVersion"])
 
+    async def health_check(self) -> SubstrateHealth:
+        """
+        Check that Kami is connected and its runtime metadata is up to date.
+
+        Returns:
+            SubstrateHealth: The latest block and the runtime spec versions seen by Kami.
+
+        Raises:
+            RuntimeError: If Kami reports itself as unhealthy, e.g. after a runtime upgrade.
+        """
+        result = await self.get("substrate/health")
+        return SubstrateHealth.model_validate(self._data(result, "substrate/health"))
+
+    async def get_account_nonce(self, account: str) -> int:
+        """
+        Get the nonce of an account.
+
+        Args:
+            account (str): The SS58 address of the account.
+
+        Returns:
+            int: The account nonce.
+        """
+        endpoint = f"substrate/account-nonce/{account}"
+        result = await self.get(endpoint)
+        return int(self._data(result, endpoint)["accountNonce"])
+
+    async def sign_message(self, message: str) -> str:
+        """
+        Sign a message with Kami's keyring pair.
+
+        Args:
+            message (str): The message to sign.
+
+        Returns:
+            str: The `0x`-prefixed hex sr25519 signature.
+        """
+        endpoint = "substrate/sign-message/sign"
+        result = await self.post(endpoint, data={"message": message})
+        return self._data(result, endpoint)["signature"]
+
+    async def verify_message(
+        self, message: str, signature: str, signee_address: str, local: bool = False
+    ) -> bool:
+        """
+        Verify the signature of a message.
+
+        Args:
+            message (str): The signed message.
+            signature (str): The `0x`-prefixed hex signature.
+            signee_address (str): The signer's SS58 address.
+            local (bool): Check the sr25519 signature in-process instead of asking Kami.
+                Requires the `sr25519` extra.
+
+        Returns:
+            bool: True if the signature is valid.
+        """
+        if local:
+            return verify_signature(message, signature, signee_address)
+        endpoint = "substrate/sign-message/verify"
+        result = await self.post(
+            endpoint,
+            data={
+                "message": message,
+                "signature": signature,
+                "signeeAddress": signee_address,
+            },
+        )
+        return bool(self._data(result, endpoint)["valid"])
+
+    async def sign_many(self, messages: Iterable[str], concurrency: int = 32) -> List[str]:
+        """
+        Sign many messages with at most `concurrency` requests in flight.
+
+        Args:
+            messages (Iterable[str]): The messages to sign.
+            concurrency (int): Maximum number of concurrent sign requests.
+
+        Returns:
+            List[str]: The signatures, in the order of `messages`.
+        """
+        return await _gather_bounded(messages, self.sign_message, concurrency)
+
+    async def verify_many(
+        self,
+        items: Iterable[Tuple[str, str, str]],
+        concurrency: int = 32,
+        local: bool = False,
+    ) -> List[bool]:
+        """
+        Verify many signatures with at most `concurrency` requests in flight.
+
+        Args:
+            items (Iterable[Tuple[str, str, str]]): `(message, signature, signee_address)`
+                tuples.
+            concurrency (int): Maximum number of concurrent verify requests.
+            local (bool): Check the signatures in-process instead of asking Kami.
+
+        Returns:
+            List[bool]: Whether each signature is valid, in the order of `items`.
+        """
+        if local:
+            return [verify_signature(*item) for item in items]
+        return await _gather_bounded(
+            items, lambda item: self.verify_message(*item), concurrency
+        )
+
+    async def set_timelocked_weights(
+        self, payload: TimelockedWeightsPayload
+    ) -> Dict[str, Any]:
+        """
+        Submit weights that are already timelock-encrypted, e.g. with
+        `bittensor_commit_reveal.get_encrypted_commit`.
+
+        Args:
+            payload (TimelockedWeightsPayload): The encrypted commit and its reveal round.
+
+        Returns:
+            Dict[str, Any]: The JSON response from the API.
+        """
+        result = await self.post(
+            "chain/set-timelocked-weights", data=payload.model_dump()
+        )
+        self._invalidate_metagraph(payload.netuid)
+        return result
@@ -0,0 +1,315 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List
+
+import aiohttp
+from loguru import logger
+
+from kami.columnar import ColumnarMetagraph
+from kami.types import SubnetMetagraph
+
+
+def diff_metagraph(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the `metagraph-delta` event Kami sends for two metagraph payloads.
+
+    Args:
+        previous (Dict[str, Any]): The metagraph payload the delta applies to.
+        current (Dict[str, Any]): The new metagraph payload.
+
+    Returns:
+        Dict[str, Any]: Changed scalar `fields`, and for every changed list in
+            `arrays` its new `length` and changed `[index, value]` pairs.
+    """
+    fields: Dict[str, Any] = {}
+    arrays: Dict[str, Any] = {}
+    for key, value in current.items():
+        old = previous.get(key)
+        if isinstance(value, list) and isinstance(old, list):
+            changes = [
+                [index, entry]
+                for index, entry in enumerate(value)
+                if index >= len(old) or entry != old[index]
+            ]
+            if changes or len(value) != len(old):
+                arrays[key] = {"length": len(value), "changes": changes}
+        elif value != old:
+            fields[key] = value
+    return {
+        "netuid": current["netuid"],
+        "block": current["block"],
+        "baseBlock": previous["block"],
+        "fields": fields,
+        "arrays": arrays,
+    }
+
+
+def apply_metagraph_delta(
+    payload: Dict[str, Any], delta: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Apply a `metagraph-delta` event to the metagraph payload it was computed against.
+
+    `payload` is not modified; unchanged lists are shared with the result.
+
+    Args:
+        payload (Dict[str, Any]): The metagraph payload at `delta["baseBlock"]`.
+        delta (Dict[str, Any]): The delta, see `diff_metagraph`.
+
+    Returns:
+        Dict[str, Any]: The metagraph payload at `delta["block"]`.
+    """
+    result = dict(payload)
+    result.update(delta.get("fields", {}))
+    for key, change in delta.get("arrays", {}).items():
+        length = change["length"]
+        values = list(result.get(key) or [])[:length]
+        values.extend([None] * (length - len(values)))
+        for index, value in change["changes"]:
+            values[index] = value
+        result[key] = values
+    return result
+
+
+@dataclass
+class MetagraphUpdate:
+    netuid: int
+    block: int
+    # The metagraph payload after the update, as returned by `chain/subnet-metagraph`.
+    payload: Dict[str, Any]
+    # The delta that produced it, None for a full snapshot.
+    delta: Dict[str, Any] | None
+    # Wall-clock time the update reached the client.
+    received_at: float
+    columnar: bool = False
+
+    @property
+    def is_snapshot(self) -> bool:
+        return self.delta is None
+
+    @property
+    def metagraph(self) -> SubnetMetagraph | ColumnarMetagraph:
+        """
+        The decoded metagraph, a `ColumnarMetagraph` if the stream is columnar.
+        """
+        if self.columnar:
+            return ColumnarMetagraph.from_response(self.payload)
+        return SubnetMetagraph.model_validate(self.payload)
+
+
+@dataclass
+class MetagraphStreamStats:
+    snapshots: int = 0
+    deltas: int = 0
+    # Deltas that did not apply to the local copy, answered by a new snapshot.
+    resyncs: int = 0
+    # Updates dropped from the queue because the consumer fell behind.
+    dropped: int = 0
+    reconnects: int = 0
+
+
+_CLOSED = object()
+
+
+class MetagraphStream:
+    """
+    Async iterator over metagraph updates pushed by the Kami websocket.
+
+    Kami reads each subscribed subnet once per finalised block for all its
+    subscribers and sends only the fields and UIDs that changed. The stream keeps a
+    local copy of every subnet's metagraph, applies each delta to it as it arrives
+    and yields a `MetagraphUpdate` with the result. A delta that does not apply to
+    the local copy, e.g. after a missed event, requests a new snapshot, and so does
+    every reconnect.
+
+    Usually created through `Kami.subscribe_metagraph`. Connects on first use:
+
+        async with kami.subscribe_metagraph([1, 2], columnar=True) as updates:
+            async for update in updates:
+                print(update.netuid, update.block, update.metagraph.totalStake.sum())
+
+    Deltas are applied when they arrive, not when they are consumed, so dropping
+    queued updates when the consumer falls behind never corrupts the local copy.
+
+    Args:
+        url (str): Base URL of the Kami server.
+        netuids (Iterable[int]): The subnets to subscribe to.
+        columnar (bool): Decode metagraphs into `ColumnarMetagraph`s instead of
+            `SubnetMetagraph`s.
+        maxsize (int): Maximum number of updates queued for the consumer; the oldest
+            are dropped when it is full.
+        connector_factory (Callable[[], aiohttp.BaseConnector] | None): Creates the
+            connector of the websocket's HTTP session, e.g. for Unix domain sockets.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        netuids: Iterable[int],
+        columnar: bool = False,
+        maxsize: int = 64,
+        connector_factory: Callable[[], aiohttp.BaseConnector] | None = None,
+    ):
+        self.netuids: List[int] = sorted(set(netuids))
+        if not self.netuids:
+            raise ValueError("netuids must not be empty")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        self.url = url
+        self.columnar = columnar
+        self.connector_factory = connector_factory
+        self.stats = MetagraphStreamStats()
+        # Local copy of every subnet's metagraph payload.
+        self.payloads: Dict[int, Dict[str, Any]] = {}
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+        self._http_session: aiohttp.ClientSession | None = None
+        self._client: Any = None
+        self._connected_once = False
+        self._closed = False
+        self._reconnect_task: asyncio.Future[None] | None = None
+
+    async def __aenter__(self) -> "MetagraphStream":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.close()
+
+    def __aiter__(self) -> "MetagraphStream":
+        return self
+
+    async def __anext__(self) -> MetagraphUpdate:
+        if self._client is None and not self._closed:
+            await self.connect()
+        update = await self._queue.get()
+        if update is _CLOSED:
+            self._queue.put_nowait(_CLOSED)
+            raise StopAsyncIteration
+        return update
+
+    def latest(self, netuid: int) -> SubnetMetagraph | ColumnarMetagraph | None:
+        """
+        Decode the local copy of a subnet's metagraph, None before its snapshot.
+        """
+        payload = self.payloads.get(netuid)
+        if payload is None:
+            return None
+        if self.columnar:
+            return ColumnarMetagraph.from_response(payload)
+        return SubnetMetagraph.model_validate(payload)
+
+    async def connect(self):
+        """
+        Connect to the websocket and subscribe to the metagraphs.
+        """
+        if self._client is not None:
+            return
+        import socketio
+
+        kwargs: Dict[str, Any] = {}
+        if self.connector_factory is not None:
+            self._http_session = aiohttp.ClientSession(
+                connector=self.connector_factory()
+            )
+            kwargs["http_session"] = self._http_session
+        client = socketio.AsyncClient(reconnection=True, handle_sigint=False, **kwargs)
+        client.on("connect", self._on_connect)
+        client.on("disconnect", self._on_disconnect)
+        client.on("metagraph-snapshot", self._on_snapshot)
+        client.on("metagraph-delta", self._on_delta)
+        client.on("metagraph-subscription-error", self._on_subscription_error)
+        self._client = client
+        await client.connect(self.url, transports=["websocket"])
+
+    async def close(self):
+        """
+        Disconnect and end iteration once the queued updates are consumed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._client is not None:
+            await self._client.disconnect()
+        if self._http_session is not None:
+            await self._http_session.close()
+        while True:
+            try:
+                self._queue.put_nowait(_CLOSED)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+
+    async def _on_connect(self):
+        if self._connected_once:
+            self.stats.reconnects += 1
+            logger.info("Reconnected to Kami websocket, resubscribing to metagraphs")
+        self._connected_once = True
+        await self._client.emit("subscribe-metagraph", self.netuids)
+
+    async def _on_disconnect(self, reason: str | None = None):
+        if self._closed:
+            return
+        logger.warning(f"Disconnected from Kami websocket: {reason}")
+        # See `BlockStream`, the client doesn't reconnect after a server disconnect.
+        if reason == self._client.reason.SERVER_DISCONNECT:
+            self._reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    async def _reconnect(self):
+        await asyncio.sleep(1)
+        if self._closed or self._client.connected:
+            return
+        try:
+            await self._client.connect(self.url, transports=["websocket"], retry=True)
+        except Exception as e:
+            logger.error(f"Failed to reconnect to Kami websocket: {e}")
+
+    async def _on_subscription_error(self, data: Dict[str, Any]):
+        logger.error(f"Metagraph subscription error: {data}")
+
+    async def _on_snapshot(self, data: Dict[str, Any]):
+        netuid = data["netuid"]
+        current = self.payloads.get(netuid)
+        if current is not None and current["block"] > data["block"]:
+            return
+        self.payloads[netuid] = data
+        self.stats.snapshots += 1
+        self._put(netuid, data, None)
+
+    async def _on_delta(self, delta: Dict[str, Any]):
+        netuid = delta["netuid"]
+        payload = self.payloads.get(netuid)
+        # The snapshot is still on its way, it already includes this delta.
+        if payload is None or delta["block"] <= payload["block"]:
+            return
+        if delta["baseBlock"] != payload["block"]:
+            logger.warning(
+                f"Metagraph delta for netuid {netuid} applies to block "
+                f"{delta['baseBlock']}, have {payload['block']}, resubscribing"
+            )
+            self.stats.resyncs += 1
+            del self.payloads[netuid]
+            await self._client.emit("subscribe-metagraph", [netuid])
+            return
+        updated = apply_metagraph_delta(payload, delta)
+        self.payloads[netuid] = updated
+        self.stats.deltas += 1
+        self._put(netuid, updated, delta)
+
+    def _put(self, netuid: int, payload: Dict[str, Any], delta: Dict[str, Any] | None):
+        if self._closed:
+            return
+        update = MetagraphUpdate(
+            netuid=netuid,
+            block=payload["block"],
+            payload=payload,
+            delta=delta,
+            received_at=time.time(),
+            columnar=self.columnar,
+        )
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.stats.dropped += 1
+        self._queue.put_nowait(update)
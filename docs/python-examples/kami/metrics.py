@@ -0,0 +1,322 @@
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import aiohttp
+
+from kami.cache import BaseCache, endpoint_family
+from kami.singleflight import SingleFlight
+
+# Phases of a request, in the order they happen.
+PHASES: Tuple[str, ...] = ("connect", "transfer", "decode", "validate")
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_SIZE_BUCKETS: Tuple[float, ...] = tuple(float(4**n) for n in range(4, 13))
+
+# Endpoints whose last path segment is a parameter that is not a number.
+_PARAMETRIZED = ("substrate/account-nonce",)
+
+ObserveCallback = Callable[[str, str, float], None]
+
+
+def endpoint_label(endpoint: str) -> str:
+    """
+    Endpoint label used for metrics, with path and query parameters stripped so
+    that e.g. every netuid shares one label.
+    """
+    family = endpoint_family(endpoint)
+    for prefix in _PARAMETRIZED:
+        if family.startswith(prefix):
+            return prefix
+    return family
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with Prometheus semantics: a value is counted in the
+    first bucket whose upper bound is greater than or equal to it.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        # The last count is the implicit `+Inf` bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        `(upper_bound, cumulative_count)` per bucket, ending with `inf`.
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Upper bound of the bucket holding the `q` quantile, e.g. `0.99` for p99.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float("inf")
+
+
+class RequestTrace:
+    """
+    Per-request state filled in by the `aiohttp` trace hooks of `Metrics`.
+    """
+
+    __slots__ = ("connect",)
+
+    def __init__(self):
+        # Seconds spent waiting for a pooled connection and opening a new one.
+        self.connect = 0.0
+
+
+async def _on_wait_start(session: Any, context: Any, params: Any):
+    context.wait_started = time.perf_counter()
+
+
+async def _on_wait_end(session: Any, context: Any, params: Any):
+    trace = context.trace_request_ctx
+    if isinstance(trace, RequestTrace):
+        trace.connect += time.perf_counter() - context.wait_started
+
+
+class Metrics:
+    """
+    Per-endpoint, per-phase latency histograms and counters for a `Kami` client.
+
+    Pass an instance as `Kami(metrics=...)`. Without one the client records nothing
+    and pays only a `None` check per request.
+
+    Phases are `connect` (waiting for a pooled connection and opening a new one),
+    `transfer` (sending the request and reading the body, excluding `connect`),
+    `decode` (JSON parsing) and `validate` (building pydantic models or arrays).
+    Response sizes are recorded per endpoint and counters track requests, errors
+    and timeouts.
+
+    Args:
+        latency_buckets (Sequence[float]): Upper bounds in seconds of the phase
+            histograms.
+        size_buckets (Sequence[float]): Upper bounds in bytes of the response size
+            histograms.
+        callback (ObserveCallback | None): Called with `(endpoint, name, value)` for
+            every observation, where `name` is a phase or `response_bytes`, e.g. to
+            forward them to StatsD or `prometheus_client`.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+        callback: ObserveCallback | None = None,
+    ):
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.callback = callback
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.response_size: Dict[str, Histogram] = {}
+        self.counters: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, endpoint: str, phase: str, seconds: float):
+        """
+        Record the duration of a request phase.
+        """
+        endpoint = endpoint_label(endpoint)
+        key = (endpoint, phase)
+        histogram = self.latency.get(key)
+        if histogram is None:
+            histogram = self.latency[key] = Histogram(self.latency_buckets)
+        histogram.observe(seconds)
+        if self.callback is not None:
+            self.callback(endpoint, phase, seconds)
+
+    def observe_size(self, endpoint: str, size: int):
+        """
+        Record the size in bytes of a response body.
+        """
+        endpoint = endpoint_label(endpoint)
+        histogram = self.response_size.get(endpoint)
+        if histogram is None:
+            histogram = self.response_size[endpoint] = Histogram(self.size_buckets)
+        histogram.observe(size)
+        if self.callback is not None:
+            self.callback(endpoint, "response_bytes", size)
+
+    def increment(self, name: str, endpoint: str, value: int = 1):
+        """
+        Increment the counter `name`, e.g. `requests` or `errors`, of an endpoint.
+        """
+        key = (name, endpoint_label(endpoint))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        `aiohttp` trace hooks that measure the `connect` phase of requests sent with
+        a `RequestTrace` as `trace_request_ctx`.
+        """
+        config = aiohttp.TraceConfig()
+        config.on_connection_queued_start.append(_on_wait_start)
+        config.on_connection_queued_end.append(_on_wait_end)
+        config.on_connection_create_start.append(_on_wait_start)
+        config.on_connection_create_end.append(_on_wait_end)
+        return config
+
+    def record_request(
+        self,
+        endpoint: str,
+        trace: RequestTrace,
+        started: float,
+        received: float,
+        decoded: float,
+        size: int,
+    ):
+        """
+        Record a completed request from `time.perf_counter()` timestamps taken
+        before sending it, after reading the body and after decoding it.
+        """
+        self.increment("requests", endpoint)
+        if trace.connect:
+            self.observe(endpoint, "connect", trace.connect)
+        self.observe(endpoint, "transfer", received - started - trace.connect)
+        self.observe(endpoint, "decode", decoded - received)
+        self.observe_size(endpoint, size)
+
+    def to_prometheus(
+        self,
+        cache: BaseCache | None = None,
+        inflight: SingleFlight | None = None,
+        prefix: str = "kami_client",
+    ) -> str:
+        """
+        Render a snapshot in the Prometheus text exposition format.
+
+        Args:
+            cache (BaseCache | None): Adds per-endpoint hit, miss and eviction
+                counters if it keeps `CacheStats`, like `ResponseCache`.
+            inflight (SingleFlight | None): Adds request coalescing counters.
+            prefix (str): Prefix of every metric name.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines: List[str] = []
+
+        def histogram(
+            name: str,
+            description: str,
+            series: Dict[Any, Histogram],
+            labels: Callable[[Any], str],
+        ):
+            if not series:
+                return
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for key in sorted(series):
+                values = series[key]
+                label = labels(key)
+                for bound, total in values.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{prefix}_{name}_bucket{{{label},le="{le}"}} {total}')
+                lines.append(f"{prefix}_{name}_sum{{{label}}} {values.sum!r}")
+                lines.append(f"{prefix}_{name}_count{{{label}}} {values.count}")
+
+        def counter(
+            name: str, description: str, samples: Dict[str, int], kind: str = "counter"
+        ):
+            if not samples:
+                return
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for label in sorted(samples):
+                lines.append(f"{prefix}_{name}{label} {samples[label]}")
+
+        histogram(
+            "phase_seconds",
+            "Duration of each request phase.",
+            self.latency,
+            lambda key: f'endpoint="{_escape(key[0])}",phase="{key[1]}"',
+        )
+        histogram(
+            "response_bytes",
+            "Size of response bodies.",
+            self.response_size,
+            lambda key: f'endpoint="{_escape(key)}"',
+        )
+        names = sorted({name for name, _ in self.counters})
+        for name in names:
+            counter(
+                f"{name}_total",
+                f"Number of {name}.",
+                {
+                    f'{{endpoint="{_escape(endpoint)}"}}': value
+                    for (counter_name, endpoint), value in self.counters.items()
+                    if counter_name == name
+                },
+            )
+
+        stats = getattr(cache, "stats", None)
+        if isinstance(stats, dict):
+            for field in ("hits", "misses", "evictions"):
+                counter(
+                    f"cache_{field}_total",
+                    f"Response cache {field}.",
+                    {
+                        f'{{endpoint="{_escape(family)}"}}': getattr(value, field)
+                        for family, value in stats.items()
+                    },
+                )
+        if inflight is not None:
+            counter(
+                "coalesce_started_total",
+                "GET requests sent on behalf of concurrent callers.",
+                {"": inflight.started},
+            )
+            counter(
+                "coalesce_shared_total",
+                "GET calls served by joining a request already in flight.",
+                {"": inflight.shared},
+            )
+            counter(
+                "coalesce_inflight",
+                "GET requests currently in flight.",
+                {"": len(inflight)},
+                kind="gauge",
+            )
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,16 @@
+import ipaddress
+
+
+def ip_to_int(ip: str) -> int:
+    """
+    Convert an IPv4 or IPv6 address into the integer form used on chain, e.g. in
+    `ServeAxonPayload.ip`. Matches `bittensor.utils.networking.ip_to_int` without
+    importing bittensor.
+
+    Args:
+        ip (str): The address, e.g. "192.168.0.1" or "2001:db8::1".
+
+    Returns:
+        int: The address as an integer.
+    """
+    return int(ipaddress.ip_address(ip))
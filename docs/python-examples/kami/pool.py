@@ -0,0 +1,360 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import Enum
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, List, Sequence
+
+import aiohttp
+from loguru import logger
+
+from kami.blocks import BlockStream, OverflowPolicy
+from kami.cache import BaseCache
+from kami.config import ConnectionConfig
+from kami.kami import Kami
+from kami.metagraph_stream import MetagraphStream
+from kami.metrics import Metrics
+from kami.retry import CircuitOpenError, RetryPolicy, deadline, remaining_time
+from kami.store import SnapshotStore
+from kami.types import SubstrateHealth
+
+# Errors after which a request is tried on another replica.
+_FAILOVER_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError)
+
+
+class ReadStrategy(str, Enum):
+    """
+    How `KamiPool` picks the replica that serves a read.
+    """
+
+    # Fewest requests in flight, then the fastest health check.
+    LEAST_LOADED = "least-loaded"
+    # Highest latest block, then the fewest requests in flight.
+    MOST_RECENT = "most-recent"
+
+
+@dataclass
+class Replica:
+    """
+    One Kami instance of a `KamiPool` and what the pool knows about it.
+    """
+
+    client: Kami
+    healthy: bool = True
+    latest_block: int | None = None
+    spec_version: int | None = None
+    # Moving average of the health check round trip, in seconds.
+    latency: float | None = None
+    inflight: int = 0
+    checked_at: float | None = None
+    last_error: str | None = None
+
+    @property
+    def url(self) -> str:
+        return self.client.url
+
+
+class KamiPool(Kami):
+    """
+    A `Kami` client spread over several Kami instances, e.g. one per subtensor node.
+
+    Every replica is health-checked through `substrate/health` every
+    `health_interval` seconds. Reads go to a healthy replica within `max_block_lag`
+    blocks of the most up-to-date one, chosen by `read_strategy`, and fail over to
+    the next replica on connection errors, timeouts and open circuits. Writes such
+    as `set_weights` and `serve_axon` are pinned to one primary, the first healthy
+    replica in `urls` order, and only move when it becomes unhealthy; a write is
+    only retried on another replica if the connection could not be established.
+
+    Caching, request coalescing, the snapshot store, commit encryption and
+    `deadline`s apply to the pool as a whole, retries and circuit breaking to each
+    replica.
+
+        async with KamiPool(["http://10.0.0.2:8882", "http://10.0.0.3:8882"]) as kami:
+            metagraph = await kami.get_metagraph(1)
+
+    Args:
+        urls (Sequence[str]): Base URLs of the Kami instances, in primary preference
+            order.
+        read_strategy (ReadStrategy | str): "least-loaded" or "most-recent".
+        health_interval (float): Seconds between health checks.
+        health_timeout (float): Time budget of one health check.
+        max_block_lag (int): Replicas further behind the most recent latest block are
+            only used for reads if no other replica is healthy.
+        cache (BaseCache | None): Shared response cache, see `Kami`.
+        coalesce (bool): Merge concurrent identical GET requests, see `Kami`.
+        commit_executor (Executor | None): Runs the commit-reveal encryption, see
+            `Kami`.
+        compact (bool): Ask for MessagePack metagraphs, see `Kami`.
+        config (ConnectionConfig | None): Connection settings of every replica.
+        metrics (Metrics | None): Shared metrics, see `Kami`.
+        retry (RetryPolicy | None): Retry and circuit breaker settings of every
+            replica.
+        revalidate (bool): Send conditional requests, see `Kami`. Each replica keeps
+            its own ETags.
+        store (SnapshotStore | None): Shared snapshot store, see `Kami`.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        read_strategy: ReadStrategy | str = ReadStrategy.LEAST_LOADED,
+        health_interval: float = 5.0,
+        health_timeout: float = 2.0,
+        max_block_lag: int = 2,
+        cache: BaseCache | None = None,
+        coalesce: bool = True,
+        commit_executor: Executor | None = None,
+        compact: bool = True,
+        config: ConnectionConfig | None = None,
+        metrics: Metrics | None = None,
+        retry: RetryPolicy | None = None,
+        revalidate: bool = True,
+        store: SnapshotStore | None = None,
+    ):
+        if not urls:
+            raise ValueError("KamiPool requires at least one URL")
+        super().__init__(
+            cache=cache,
+            coalesce=coalesce,
+            commit_executor=commit_executor,
+            compact=compact,
+            config=config,
+            metrics=metrics,
+            retry=retry,
+            revalidate=False,
+            url=urls[0],
+            store=store,
+        )
+        self.read_strategy = ReadStrategy(read_strategy)
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.max_block_lag = max_block_lag
+        self.replicas: List[Replica] = [
+            Replica(
+                client=Kami(
+                    coalesce=False,
+                    config=self.config,
+                    metrics=metrics,
+                    retry=self.retry,
+                    revalidate=revalidate,
+                    url=url,
+                )
+            )
+            for url in dict.fromkeys(urls)
+        ]
+        self._primary = self.replicas[0]
+        self._health_task: asyncio.Task[None] | None = None
+        self._started = asyncio.Lock()
+
+    async def __aenter__(self) -> "KamiPool":
+        await self.start()
+        return self
+
+    @property
+    def primary(self) -> Replica:
+        """
+        The replica that currently receives writes.
+        """
+        return self._primary
+
+    async def start(self):
+        """
+        Run the first health check and start checking in the background. Called on
+        first use if not called explicitly.
+        """
+        if self._health_task is not None:
+            return
+        async with self._started:
+            if self._health_task is not None:
+                return
+            await self.check_health()
+            self._health_task = asyncio.ensure_future(self._health_loop())
+
+    async def close(self):
+        """
+        Stop health checks and close every replica's session.
+        """
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        await super().close()
+        await asyncio.gather(*(replica.client.close() for replica in self.replicas))
+
+    async def check_health(self):
+        """
+        Health-check every replica once and re-elect the primary if needed.
+        """
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+        blocks = [
+            replica.latest_block
+            for replica in self.replicas
+            if replica.healthy and replica.latest_block is not None
+        ]
+        if blocks and self.cache is not None:
+            self.cache.observe_block(max(blocks))
+        self._elect_primary()
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"Kami pool health check failed: {e}")
+
+    async def _check(self, replica: Replica):
+        started = time.perf_counter()
+        try:
+            with deadline(self.health_timeout):
+                result = await replica.client._request("GET", "substrate/health")
+            health = SubstrateHealth.model_validate(
+                self._data(result, "substrate/health")
+            )
+        except Exception as e:
+            if replica.healthy:
+                logger.warning(f"Kami replica {replica.url} is unhealthy: {e!r}")
+            replica.healthy = False
+            replica.last_error = repr(e)
+            replica.checked_at = time.monotonic()
+            return
+
+        elapsed = time.perf_counter() - started
+        if not replica.healthy:
+            logger.info(f"Kami replica {replica.url} is healthy again")
+        replica.healthy = True
+        replica.last_error = None
+        replica.latest_block = health.latestBlock
+        replica.spec_version = health.runtimeSpecVersionDuringHealthCheck
+        replica.latency = (
+            elapsed if replica.latency is None else 0.8 * replica.latency + 0.2 * elapsed
+        )
+        replica.checked_at = time.monotonic()
+
+    def _elect_primary(self):
+        if self._primary.healthy:
+            return
+        for replica in self.replicas:
+            if replica.healthy:
+                logger.warning(
+                    f"Kami primary {self._primary.url} is unhealthy, "
+                    f"moving writes to {replica.url}"
+                )
+                self._primary = replica
+                return
+
+    def _is_fresh(self, replica: Replica, best_block: int | None) -> bool:
+        if best_block is None or replica.latest_block is None:
+            return True
+        return replica.latest_block >= best_block - self.max_block_lag
+
+    def _pick_reader(self, tried: Dict[str, Replica]) -> Replica | None:
+        candidates = [replica for replica in self.replicas if replica.url not in tried]
+        if not candidates:
+            return None
+        healthy = [replica for replica in candidates if replica.healthy]
+        best_block = max(
+            (
+                replica.latest_block
+                for replica in healthy
+                if replica.latest_block is not None
+            ),
+            default=None,
+        )
+        fresh = [replica for replica in healthy if self._is_fresh(replica, best_block)]
+        # Fall back to lagging, then to unhealthy replicas rather than failing.
+        pool = fresh or healthy or candidates
+        if self.read_strategy is ReadStrategy.MOST_RECENT:
+            return min(
+                pool,
+                key=lambda replica: (
+                    -(replica.latest_block or 0),
+                    replica.inflight,
+                    replica.latency or 0.0,
+                ),
+            )
+        return min(
+            pool, key=lambda replica: (replica.inflight, replica.latency or 0.0)
+        )
+
+    def _mark_failed(self, replica: Replica, error: BaseException):
+        if replica.healthy:
+            logger.warning(f"Kami replica {replica.url} failed: {error!r}")
+        replica.healthy = False
+        replica.last_error = repr(error)
+        self._elect_primary()
+
+    async def _call(
+        self, replica: Replica, method: str, endpoint: str, **kwargs: Any
+    ) -> Any:
+        replica.inflight += 1
+        try:
+            return await replica.client._request(method, endpoint, **kwargs)
+        finally:
+            replica.inflight -= 1
+
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        await self.start()
+        if method != "GET":
+            return await self._write(method, endpoint, **kwargs)
+
+        tried: Dict[str, Replica] = {}
+        while True:
+            replica = self._pick_reader(tried)
+            if replica is None:
+                raise RuntimeError(f"No Kami replica could serve {endpoint}")
+            tried[replica.url] = replica
+            try:
+                return await self._call(replica, method, endpoint, **kwargs)
+            except _FAILOVER_ERRORS as e:
+                self._mark_failed(replica, e)
+                remaining = remaining_time()
+                if len(tried) == len(self.replicas) or (
+                    remaining is not None and remaining <= 0
+                ):
+                    raise
+
+    async def _write(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        tried: Dict[str, Replica] = {}
+        while True:
+            replica = self._primary
+            if replica.url in tried:
+                raise RuntimeError(f"No healthy Kami replica for {endpoint}")
+            tried[replica.url] = replica
+            try:
+                return await self._call(replica, method, endpoint, **kwargs)
+            except (aiohttp.ClientConnectorError, CircuitOpenError) as e:
+                # Nothing reached Kami, the write can move to the next primary.
+                self._mark_failed(replica, e)
+            except _FAILOVER_ERRORS as e:
+                self._mark_failed(replica, e)
+                raise
+
+    def subscribe_blocks(
+        self,
+        finalised: bool = True,
+        maxsize: int = 64,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        max_backfill: int = 64,
+    ) -> BlockStream:
+        """
+        Subscribe to new blocks over the websocket of the current primary, see
+        `Kami.subscribe_blocks`.
+        """
+        return self._primary.client.subscribe_blocks(
+            finalised=finalised,
+            maxsize=maxsize,
+            overflow=overflow,
+            max_backfill=max_backfill,
+        )
+
+    def subscribe_metagraph(
+        self, netuids: Iterable[int], columnar: bool = False, maxsize: int = 64
+    ) -> MetagraphStream:
+        """
+        Subscribe to metagraph updates over the websocket of the current primary,
+        see `Kami.subscribe_metagraph`.
+        """
+        return self._primary.client.subscribe_metagraph(
+            netuids, columnar=columnar, maxsize=maxsize
+        )
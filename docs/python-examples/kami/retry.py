@@ -0,0 +1,169 @@
+import contextlib
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Tuple
+
+from pydantic import BaseModel
+
+from kami.metrics import endpoint_label
+
+# Absolute `time.monotonic()` deadline of the current task, if any.
+_deadline: ContextVar[float | None] = ContextVar("kami_deadline", default=None)
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised without contacting Kami while the circuit of an endpoint is open.
+    """
+
+
+class RetryPolicy(BaseModel):
+    """
+    Retry, backoff and circuit breaker settings of a `Kami` client, named after the
+    retry settings of the Kami server's substrate connection.
+
+    GET requests are retried on connection errors, timeouts and `retry_statuses`.
+    POST requests are only retried when the connection could not be established,
+    since a request that reached Kami may already have been submitted to the chain.
+    Delays use full jitter: a random value between 0 and
+    `min(max_retry_delay, initial_retry_delay * backoff_factor ** attempt)`.
+
+    After `failure_threshold` consecutive failures of an endpoint its circuit opens
+    and calls fail fast with `CircuitOpenError` for `reset_timeout` seconds; then a
+    single probe request is let through to close it again.
+    """
+
+    # Retries
+    max_retries: int = 3
+    initial_retry_delay: float = 0.1
+    backoff_factor: float = 2.0
+    max_retry_delay: float = 2.0
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    # Circuit breaker, disabled if `failure_threshold` is 0
+    failure_threshold: int = 5
+    reset_timeout: float = 5.0
+
+    def delay(
+        self, attempt: int, rng: Callable[[], float] = random.random
+    ) -> float:
+        """
+        Backoff in seconds before retry number `attempt` (0 for the first retry).
+        """
+        cap = min(
+            self.max_retry_delay,
+            self.initial_retry_delay * self.backoff_factor**attempt,
+        )
+        return cap * rng()
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    opened_at: float | None = None
+    # When the half-open probe was let through, if one is in flight.
+    probe_started: float | None = None
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker, see `RetryPolicy`. Endpoints are grouped like
+    metrics labels, so every netuid of an endpoint shares a circuit.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open a circuit.
+        reset_timeout (float): Seconds a circuit stays open before a probe.
+        clock (Callable[[], float]): Monotonic time source, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def state(self, endpoint: str) -> str:
+        """
+        `closed`, `open` or `half-open`.
+        """
+        circuit = self._circuits.get(endpoint_label(endpoint))
+        if circuit is None or circuit.opened_at is None:
+            return "closed"
+        if self.clock() - circuit.opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def before_request(self, endpoint: str):
+        """
+        Raise `CircuitOpenError` unless a request to `endpoint` may be sent.
+        """
+        label = endpoint_label(endpoint)
+        circuit = self._circuits.get(label)
+        if circuit is None or circuit.opened_at is None:
+            return
+        now = self.clock()
+        remaining = self.reset_timeout - (now - circuit.opened_at)
+        probing = (
+            circuit.probe_started is not None
+            and now - circuit.probe_started < self.reset_timeout
+        )
+        if remaining > 0 or probing:
+            raise CircuitOpenError(f"Circuit open for Kami API: {label}, failing fast")
+        # Half-open: let this request through as the probe. A probe that never
+        # reports back, e.g. because it was cancelled, is replaced after a timeout.
+        circuit.probe_started = now
+
+    def record_success(self, endpoint: str):
+        circuit = self._circuits.get(endpoint_label(endpoint))
+        if circuit is not None:
+            circuit.failures = 0
+            circuit.opened_at = None
+            circuit.probe_started = None
+
+    def record_failure(self, endpoint: str):
+        label = endpoint_label(endpoint)
+        circuit = self._circuits.get(label)
+        if circuit is None:
+            circuit = self._circuits[label] = _Circuit()
+        circuit.failures += 1
+        if (
+            circuit.probe_started is not None
+            or circuit.failures >= self.failure_threshold
+        ):
+            circuit.opened_at = self.clock()
+            circuit.probe_started = None
+
+
+def remaining_time() -> float | None:
+    """
+    Seconds left until the deadline of the current task, or None if there is none.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound every Kami request made inside the block, including retries and backoff,
+    to `seconds` from now. Nested deadlines can only shorten the budget, and tasks
+    started inside the block inherit it.
+
+        with deadline(10):
+            await kami.set_weights(payload)
+    """
+    current = _deadline.get()
+    new = time.monotonic() + seconds
+    token = _deadline.set(new if current is None else min(current, new))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
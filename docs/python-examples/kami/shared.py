@@ -0,0 +1,295 @@
+import json
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Set, Tuple
+
+import numpy as np
+from numpy.lib.format import descr_to_dtype, dtype_to_descr
+
+from kami.columnar import (
+    AXON_DTYPE,
+    BOOL_COLUMNS,
+    FLOAT_COLUMNS,
+    INT_COLUMNS,
+    ColumnarMetagraph,
+    _from_metadata,
+    _metadata,
+)
+
+_STRING_COLUMNS = ("hotkeys", "coldkeys")
+# Column data starts on cache line boundaries.
+_ALIGNMENT = 64
+# Control segment: the current generation, 0 until the first publish.
+_CONTROL = struct.Struct("<Q")
+# Data segment prefix: the length of the JSON header that follows it.
+_HEADER_SIZE = struct.Struct("<Q")
+# Segments created by publishers in this process, tracked for cleanup on exit.
+_OWNED: Set[str] = set()
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _segment_name(name: str, generation: int) -> str:
+    return f"{name}-{generation}"
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Open an existing segment without handing it to this process's resource tracker,
+    which would otherwise unlink it when the process exits.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    segment = SharedMemory(name=name)
+    # Before 3.13 attaching always registers the segment. The tracker keeps a set
+    # per process, so leave segments a publisher here owns registered.
+    if name not in _OWNED:
+        tracked = segment._name  # type: ignore[attr-defined]
+        resource_tracker.unregister(tracked, "shared_memory")
+    return segment
+
+
+def _view(
+    segment: SharedMemory, descr: Any, shape: List[int], offset: int
+) -> np.ndarray:
+    """
+    A NumPy view of part of a segment. Unlike `np.ndarray(buffer=...)`, the view holds
+    a buffer export, so the segment refuses to close while the view is alive.
+    """
+    dtype = descr_to_dtype(descr)
+    count = int(np.prod(shape))
+    if count == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.frombuffer(segment.buf, dtype=dtype, count=count, offset=offset).reshape(
+        shape
+    )
+
+
+def _columns(metagraph: ColumnarMetagraph) -> Dict[str, np.ndarray]:
+    columns = {
+        name: np.ascontiguousarray(getattr(metagraph, name))
+        for name in FLOAT_COLUMNS + INT_COLUMNS + BOOL_COLUMNS
+    }
+    for name in _STRING_COLUMNS:
+        columns[name] = np.asarray(getattr(metagraph, name), dtype=str)
+    columns["axons"] = np.ascontiguousarray(metagraph.axons, dtype=AXON_DTYPE)
+    return columns
+
+
+class SharedMetagraphPublisher:
+    """
+    Publish metagraphs into shared memory for `SharedMetagraphReader`s in other
+    processes, e.g. the workers of a `multiprocessing` scoring pool.
+
+    Every `publish` writes the metagraph into a new, immutable segment named
+    `{name}-{generation}` and then bumps the generation counter in the `{name}`
+    control segment. The previous segment is unlinked, which only frees it once
+    every reader has moved on, so readers never see a half-written metagraph and
+    never block the publisher.
+
+        publisher = SharedMetagraphPublisher("kami-sn1")
+        tracker.subscribe(lambda delta: publisher.publish(delta.metagraph))
+
+    If the control segment already exists, e.g. after the publisher restarted, it is
+    reused and generations continue from its counter.
+
+    Args:
+        name (str): Name of the control segment, shared with the readers. Keep it
+            short, some platforms limit segment names to 31 characters.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        # The publisher owns its segments, so unlike readers it keeps them tracked.
+        try:
+            self._control = SharedMemory(name=name, create=True, size=_CONTROL.size)
+            _CONTROL.pack_into(self._control.buf, 0, 0)
+        except FileExistsError:
+            self._control = SharedMemory(name=name)
+        _OWNED.add(name)
+        (self.generation,) = _CONTROL.unpack_from(self._control.buf, 0)
+        self._segment: SharedMemory | None = None
+        if self.generation:
+            try:
+                self._segment = self._own(_segment_name(name, self.generation))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _own(name: str, size: int = 0) -> SharedMemory:
+        segment = SharedMemory(name=name, create=size > 0, size=size)
+        _OWNED.add(name)
+        return segment
+
+    @staticmethod
+    def _unlink(segment: SharedMemory):
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+        _OWNED.discard(segment.name)
+
+    def __enter__(self) -> "SharedMetagraphPublisher":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def publish(self, metagraph: ColumnarMetagraph) -> int:
+        """
+        Publish a new metagraph generation.
+
+        Args:
+            metagraph (ColumnarMetagraph): The metagraph, e.g. from
+                `Kami.get_metagraph(netuid, columnar=True)`.
+
+        Returns:
+            int: The generation of the published metagraph.
+        """
+        columns = _columns(metagraph)
+        # Column name -> (dtype descr, shape, offset from the start of the data).
+        layout: Dict[str, Tuple[Any, List[int], int]] = {}
+        offset = 0
+        for name, values in columns.items():
+            offset = _aligned(offset)
+            layout[name] = (dtype_to_descr(values.dtype), list(values.shape), offset)
+            offset += values.nbytes
+        header = json.dumps({"meta": _metadata(metagraph), "layout": layout}).encode()
+        data_start = _aligned(_HEADER_SIZE.size + len(header))
+
+        generation = self.generation + 1
+        segment = self._own(
+            _segment_name(self.name, generation), size=max(1, data_start + offset)
+        )
+        _HEADER_SIZE.pack_into(segment.buf, 0, len(header))
+        segment.buf[_HEADER_SIZE.size : _HEADER_SIZE.size + len(header)] = header
+        for name, values in columns.items():
+            descr, shape, column_offset = layout[name]
+            _view(segment, descr, shape, data_start + column_offset)[...] = values
+
+        _CONTROL.pack_into(self._control.buf, 0, generation)
+        previous, self._segment, self.generation = self._segment, segment, generation
+        if previous is not None:
+            previous.close()
+            self._unlink(previous)
+        return generation
+
+    def close(self, unlink: bool = True):
+        """
+        Close the segments, and unlink them so no new reader can attach.
+        """
+        for segment in (self._segment, self._control):
+            if segment is None:
+                continue
+            segment.close()
+            if unlink:
+                self._unlink(segment)
+        self._segment = None
+
+
+class SharedMetagraphReader:
+    """
+    Read the metagraph published by a `SharedMetagraphPublisher` without copying it.
+
+    Per-UID columns of the returned `ColumnarMetagraph` are read-only NumPy views of
+    the shared segment. `get()` only maps a new segment when the publisher's
+    generation changed, so calling it at the start of every task is cheap:
+
+        def init_worker():
+            global reader
+            reader = SharedMetagraphReader("kami-sn1")
+
+        def score(uid):
+            metagraph = reader.get()
+            return metagraph.totalStake[uid]
+
+    Segments of older generations stay mapped while views of them are alive and
+    are released on a later `get()` once they are not.
+
+    Args:
+        name (str): Name of the publisher's control segment.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._control = _attach(name)
+        self._generation = 0
+        self._metagraph: ColumnarMetagraph | None = None
+        self._segment: SharedMemory | None = None
+        self._stale: List[SharedMemory] = []
+
+    def __enter__(self) -> "SharedMetagraphReader":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    @property
+    def generation(self) -> int:
+        """
+        The publisher's current generation, 0 if nothing was published yet.
+        """
+        return _CONTROL.unpack_from(self._control.buf, 0)[0]
+
+    def get(self) -> ColumnarMetagraph | None:
+        """
+        The latest published metagraph, or None if nothing was published yet.
+        """
+        while True:
+            generation = self.generation
+            if generation == self._generation:
+                return self._metagraph
+            try:
+                segment = _attach(_segment_name(self.name, generation))
+            except FileNotFoundError:
+                # Superseded and unlinked between reading the counter and attaching.
+                continue
+            break
+
+        metagraph = self._map(segment)
+        if self._segment is not None:
+            self._stale.append(self._segment)
+        self._segment, self._generation = segment, generation
+        self._metagraph = metagraph
+        self._release_stale()
+        return metagraph
+
+    @staticmethod
+    def _map(segment: SharedMemory) -> ColumnarMetagraph:
+        (size,) = _HEADER_SIZE.unpack_from(segment.buf, 0)
+        header = json.loads(
+            bytes(segment.buf[_HEADER_SIZE.size : _HEADER_SIZE.size + size])
+        )
+        data_start = _aligned(_HEADER_SIZE.size + size)
+        columns: Dict[str, Any] = {}
+        for name, (descr, shape, offset) in header["layout"].items():
+            view = _view(segment, descr, shape, data_start + offset)
+            view.flags.writeable = False
+            columns[name] = view.tolist() if name in _STRING_COLUMNS else view
+        return _from_metadata(header["meta"], columns)
+
+    def _release_stale(self):
+        still_mapped = []
+        for segment in self._stale:
+            try:
+                segment.close()
+            except BufferError:
+                # Views of this generation are still referenced somewhere.
+                still_mapped.append(segment)
+        self._stale = still_mapped
+
+    def close(self):
+        """
+        Drop the latest metagraph and unmap every segment that has no live views.
+        """
+        self._metagraph = None
+        if self._segment is not None:
+            self._stale.append(self._segment)
+            self._segment = None
+        self._generation = 0
+        self._release_stale()
+        self._control.close()
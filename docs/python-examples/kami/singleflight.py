@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls that share a key.
+
+    The first caller for a key starts the call as a task; callers arriving while it
+    is still running await the same task instead of starting their own. The task is
+    shielded, so cancelling one caller does not cancel the call for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future[Any]] = {}
+        self.started = 0
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn()` once for all concurrent callers with the same `key`.
+
+        Args:
+            key (Hashable): Identifies calls that may be merged.
+            fn (Callable[[], Awaitable[T]]): Starts the call; only invoked by the first caller.
+
+        Returns:
+            T: The shared result. Exceptions are raised to every caller.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(call)
+
+    def cancel(self):
+        """
+        Cancel every call that is still running.
+        """
+        for call in list(self._calls.values()):
+            call.cancel()
+
+    def _forget(self, key: Hashable, call: "asyncio.Future[Any]"):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled.
+        if not call.cancelled():
+            call.exception()
@@ -0,0 +1,274 @@
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from kami.columnar import (
+    AXON_DTYPE,
+    BOOL_COLUMNS,
+    FLOAT_COLUMNS,
+    INT_COLUMNS,
+    ColumnarMetagraph,
+    _from_metadata,
+    _metadata,
+)
+from kami.types import SubnetHyperparameters, SubnetMetagraph
+
+# Per-UID columns stored as one `.npy` file each.
+NUMERIC_COLUMNS: Tuple[str, ...] = FLOAT_COLUMNS + INT_COLUMNS + BOOL_COLUMNS
+_STRING_COLUMNS = ("hotkeys", "coldkeys")
+_META = "meta.json"
+
+
+def _write_atomically(target: Path, write: Any, overwrite: bool = False):
+    """
+    Run `write(tmp_dir)` and move the directory into place, so readers never see a
+    partially written snapshot.
+
+    With `overwrite`, an existing `target` is only moved aside once the new snapshot
+    is complete. Readers see the old snapshot, then briefly none, then the new one,
+    and memory maps of the old one stay valid. If the new snapshot cannot be moved
+    into place, the old one is moved back and the error is raised.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+    try:
+        write(tmp)
+        if overwrite and target.exists():
+            # A directory can only replace an empty one.
+            old = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+            os.replace(target, old)
+            try:
+                os.replace(tmp, target)
+            except OSError:
+                # Put the old snapshot back rather than leave none.
+                os.replace(old, target)
+                raise
+            shutil.rmtree(old, ignore_errors=True)
+        else:
+            os.replace(tmp, target)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        # Another writer may have saved the same snapshot first, only an overwrite
+        # has to replace it.
+        if overwrite or not target.exists():
+            raise
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+class SnapshotStore:
+    """
+    On-disk store of metagraph and hyperparameter snapshots keyed by (netuid, block).
+
+    Every metagraph snapshot is a directory of `.npy` files, one per per-UID column
+    (`emission.npy`, `totalStake.npy`, `axons.npy`, ...), plus a small `meta.json`
+    with the subnet-level fields. Columns are memory-mapped on load, so opening a
+    snapshot is nearly free and analyses that read one column never touch the rest:
+
+        store = SnapshotStore("~/.kami/snapshots")
+        for block, stake in store.history(1, "totalStake"):
+            ...
+
+    Layout::
+
+        {root}/metagraph/{netuid}/{block}/{column}.npy
+        {root}/hyperparameters/{netuid}/{block}.json
+
+    Args:
+        root (str | os.PathLike): Directory of the store, created if missing.
+        mmap (bool): Memory-map numeric columns read-only instead of loading them.
+    """
+
+    def __init__(self, root: str | os.PathLike, mmap: bool = True):
+        self.root = Path(root).expanduser()
+        self.mmap = mmap
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _metagraph_dir(self, netuid: int, block: int) -> Path:
+        return self.root / "metagraph" / str(netuid) / str(block)
+
+    def _hyperparameters_path(self, netuid: int, block: int) -> Path:
+        return self.root / "hyperparameters" / str(netuid) / f"{block}.json"
+
+    @staticmethod
+    def _numbered(directory: Path, suffix: str = "") -> List[int]:
+        if not directory.is_dir():
+            return []
+        numbers = []
+        for entry in directory.iterdir():
+            name = entry.name
+            if suffix:
+                if not name.endswith(suffix):
+                    continue
+                name = name[: -len(suffix)]
+            if name.isdigit():
+                numbers.append(int(name))
+        return sorted(numbers)
+
+    def netuids(self) -> List[int]:
+        """
+        Netuids with at least one stored metagraph.
+        """
+        return self._numbered(self.root / "metagraph")
+
+    def blocks(self, netuid: int) -> List[int]:
+        """
+        Blocks of the stored metagraphs of a netuid, in ascending order.
+        """
+        return self._numbered(self.root / "metagraph" / str(netuid))
+
+    def has_metagraph(self, netuid: int, block: int) -> bool:
+        return (self._metagraph_dir(netuid, block) / _META).is_file()
+
+    def save_metagraph(
+        self, metagraph: SubnetMetagraph | ColumnarMetagraph, overwrite: bool = False
+    ) -> Path:
+        """
+        Store a metagraph snapshot under its netuid and block.
+
+        Args:
+            metagraph (SubnetMetagraph | ColumnarMetagraph): The snapshot to store.
+            overwrite (bool): Replace an existing snapshot of the same block.
+
+        Returns:
+            Path: The snapshot directory.
+        """
+        if not isinstance(metagraph, ColumnarMetagraph):
+            metagraph = ColumnarMetagraph.from_response(metagraph.model_dump())
+        target = self._metagraph_dir(metagraph.netuid, metagraph.block)
+        if target.exists() and not overwrite:
+            return target
+
+        meta = _metadata(metagraph)
+
+        def write(directory: Path):
+            for name in NUMERIC_COLUMNS:
+                np.save(directory / f"{name}.npy", getattr(metagraph, name))
+            for name in _STRING_COLUMNS:
+                values = np.asarray(getattr(metagraph, name), dtype=str)
+                np.save(directory / f"{name}.npy", values)
+            np.save(directory / "axons.npy", metagraph.axons.astype(AXON_DTYPE))
+            # Written last: its presence marks a complete snapshot.
+            (directory / _META).write_text(json.dumps(meta))
+
+        _write_atomically(target, write, overwrite)
+        return target
+
+    def _load_column(self, directory: Path, name: str) -> np.ndarray:
+        return np.load(directory / f"{name}.npy", mmap_mode="r" if self.mmap else None)
+
+    def load_metagraph(
+        self, netuid: int, block: int | None = None
+    ) -> ColumnarMetagraph | None:
+        """
+        Load a stored metagraph snapshot.
+
+        Args:
+            netuid (int): The netuid.
+            block (int | None): The block of the snapshot, or None for the latest one.
+
+        Returns:
+            ColumnarMetagraph | None: The snapshot, or None if it is not stored. Numeric
+                columns are read-only memory maps if `mmap` is set.
+        """
+        if block is None:
+            complete = [
+                stored
+                for stored in reversed(self.blocks(netuid))
+                if self.has_metagraph(netuid, stored)
+            ]
+            if not complete:
+                return None
+            block = complete[0]
+        directory = self._metagraph_dir(netuid, block)
+        meta_path = directory / _META
+        if not meta_path.is_file():
+            return None
+        meta = json.loads(meta_path.read_text())
+
+        columns: Dict[str, Any] = {
+            name: self._load_column(directory, name) for name in NUMERIC_COLUMNS
+        }
+        for name in _STRING_COLUMNS:
+            columns[name] = np.load(directory / f"{name}.npy").tolist()
+        columns["axons"] = self._load_column(directory, "axons")
+        return _from_metadata(meta, columns)
+
+    def history(
+        self,
+        netuid: int,
+        column: str,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Read one per-UID column, e.g. `totalStake` or `emission`, across stored
+        snapshots without loading anything else.
+
+        Args:
+            netuid (int): The netuid.
+            column (str): A numeric per-UID column, see `NUMERIC_COLUMNS`.
+            start (int | None): First block to include.
+            end (int | None): Last block to include.
+
+        Returns:
+            Iterator[Tuple[int, np.ndarray]]: `(block, values)` in ascending block order.
+        """
+        if column not in NUMERIC_COLUMNS:
+            raise ValueError(f"Unknown numeric column: {column}")
+        for block in self.blocks(netuid):
+            if (start is not None and block < start) or (end is not None and block > end):
+                continue
+            directory = self._metagraph_dir(netuid, block)
+            if (directory / _META).is_file():
+                yield block, self._load_column(directory, column)
+
+    def save_hyperparameters(
+        self, netuid: int, block: int, hyperparameters: SubnetHyperparameters
+    ) -> Path:
+        """
+        Store the hyperparameters of a netuid as seen at `block`.
+        """
+        path = self._hyperparameters_path(netuid, block)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        with os.fdopen(fd, "w") as file:
+            file.write(hyperparameters.model_dump_json())
+        os.replace(tmp, path)
+        return path
+
+    def has_hyperparameters(self, netuid: int, block: int) -> bool:
+        """
+        Whether hyperparameters were stored at exactly `block`.
+        """
+        return self._hyperparameters_path(netuid, block).is_file()
+
+    def load_hyperparameters(
+        self, netuid: int, block: int | None = None
+    ) -> SubnetHyperparameters | None:
+        """
+        Load stored hyperparameters, the most recent at or before `block` if given,
+        otherwise the latest.
+        """
+        directory = self.root / "hyperparameters" / str(netuid)
+        blocks = self._numbered(directory, ".json")
+        if block is not None:
+            blocks = [stored for stored in blocks if stored <= block]
+        if not blocks:
+            return None
+        path = self._hyperparameters_path(netuid, blocks[-1])
+        return SubnetHyperparameters.model_validate_json(path.read_text())
+
+    def prune(self, netuid: int, keep: int):
+        """
+        Delete all but the `keep` most recent metagraph snapshots of a netuid.
+        """
+        blocks = self.blocks(netuid)
+        for block in blocks[: max(0, len(blocks) - keep)]:
+            shutil.rmtree(self._metagraph_dir(netuid, block), ignore_errors=True)
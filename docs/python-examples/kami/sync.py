@@ -0,0 +1,180 @@
+import asyncio
+import contextlib
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Iterator, TypeVar
+
+from kami.kami import Kami
+from kami.retry import deadline, remaining_time
+
+R = TypeVar("R")
+
+
+class SyncIterator(Iterator[Any]):
+    """
+    Blocking iterator over an async iterator that lives on a `SyncKami` loop, e.g.
+    the result of `get_metagraphs` or `subscribe_blocks`.
+
+    Close it, or use it as a context manager, when stopping early so outstanding
+    requests are cancelled and subscriptions are closed.
+    """
+
+    def __init__(self, owner: "SyncKami", iterator: Any):
+        self._owner = owner
+        self._iterator = iterator
+        self._closed = False
+
+    def __iter__(self) -> "SyncIterator":
+        return self
+
+    def __next__(self) -> Any:
+        if self._closed:
+            raise StopIteration
+
+        async def step() -> Any:
+            return await self._iterator.__anext__()
+
+        try:
+            return self._owner._run(step())
+        except StopAsyncIteration:
+            self._closed = True
+            raise StopIteration
+
+    def __enter__(self) -> "SyncIterator":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        close = getattr(self._iterator, "aclose", None) or getattr(
+            self._iterator, "close", None
+        )
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                self._owner._run(_await(result))
+
+
+async def _await(awaitable: Awaitable[R]) -> R:
+    return await awaitable
+
+
+class SyncKami:
+    """
+    Blocking facade over `Kami` for synchronous code.
+
+    One event loop runs in a background thread for the lifetime of the facade and
+    owns the `Kami` client, so its pooled HTTP session, cache and request coalescing
+    are shared by every call instead of being rebuilt per `asyncio.run`. Every `Kami`
+    method is available with the same arguments and blocks until its result is
+    ready; methods that return async iterators return a `SyncIterator`. Calls from
+    several threads run concurrently on the loop.
+
+        with SyncKami() as kami:
+            metagraph = kami.get_metagraph(1)
+            for result in kami.get_metagraphs(range(8)):
+                ...
+
+    A `deadline` active in the calling thread bounds the call.
+
+    Args:
+        timeout (float | None): Maximum seconds a call may block, None for no limit.
+            The call is cancelled on the loop when it runs out.
+        **kwargs: Passed to `Kami`, e.g. `cache`, `config` or `url`.
+    """
+
+    def __init__(self, timeout: float | None = None, **kwargs: Any):
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="kami-loop", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+
+        async def create() -> Kami:
+            return Kami(**kwargs)
+
+        try:
+            self.kami: Kami = self._run(create())
+        except BaseException:
+            self._stop()
+            raise
+
+    def __enter__(self) -> "SyncKami":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def _run(self, coroutine: Coroutine[Any, Any, R]) -> R:
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError(
+                "SyncKami cannot be called from its own event loop, use `kami` instead"
+            )
+        if self._closed:
+            coroutine.close()
+            raise RuntimeError("SyncKami is closed")
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+        except BaseException:
+            # E.g. KeyboardInterrupt while waiting, don't leave the call running.
+            future.cancel()
+            raise
+
+    def _call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        remaining = remaining_time()
+
+        async def invoke() -> Any:
+            with contextlib.ExitStack() as scope:
+                if remaining is not None:
+                    scope.enter_context(deadline(remaining))
+                result = method(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+
+        result = self._run(invoke())
+        if hasattr(result, "__anext__"):
+            return SyncIterator(self, result)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name == "kami":
+            raise AttributeError(name)
+        attribute = getattr(self.kami, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def blocking(*args: Any, **kwargs: Any) -> Any:
+            return self._call(attribute, *args, **kwargs)
+
+        return blocking
+
+    def _stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def close(self):
+        """
+        Close the client's session and stop the background loop.
+        """
+        if self._closed:
+            return
+        try:
+            self._run(self.kami.close())
+        finally:
+            self._closed = True
+            self._stop()
@@ -0,0 +1,740 @@
+import asyncio
+import hashlib
+import json
+import math
+import random
+from collections import Counter
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+import socketio
+from aiohttp import web
+from loguru import logger
+
+from kami.decoding import MSGPACK_CONTENT_TYPE
+from kami.kami import Kami
+from kami.metagraph_stream import diff_metagraph
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+# Synthetic metagraphs kept serialized, per (netuid, block).
+_METAGRAPH_CACHE_SIZE = 64
+_CONTENT_TYPES = {"json": "application/json", "msgpack": MSGPACK_CONTENT_TYPE}
+_SPEC_VERSION = 273
+
+
+def make_metagraph_payload(
+    num_uids: int = 256, netuid: int = 1, block: int = 5_000_000, seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Build a `chain/subnet-metagraph/{netuid}` payload with `num_uids` neurons.
+
+    Args:
+        num_uids (int): Number of UIDs in the subnet.
+        netuid (int): The netuid of the subnet.
+        block (int): The block the metagraph was read at.
+        seed (int): Seed for the random generator, for reproducible payloads.
+
+    Returns:
+        Dict[str, Any]: The metagraph payload.
+    """
+    rng = random.Random(seed)
+    hotkeys = [f"5Hotkey{netuid:03d}{uid:05d}{'x' * 33}"[:48] for uid in range(num_uids)]
+    coldkeys = [f"5Coldkey{netuid:03d}{uid:05d}{'y' * 32}"[:48] for uid in range(num_uids)]
+
+    def floats() -> list[float]:
+        return [rng.random() for _ in range(num_uids)]
+
+    return {
+        "netuid": netuid,
+        "name": f"subnet-{netuid}",
+        "symbol": "α",
+        "identity": {
+            "subnetName": f"subnet-{netuid}",
+            "githubRepo": "",
+            "subnetContact": "",
+            "subnetUrl": "",
+            "discord": "",
+            "description": "",
+            "additional": "",
+        },
+        "networkRegisteredAt": 1000,
+        "ownerHotkey": hotkeys[0],
+        "ownerColdkey": coldkeys[0],
+        "block": block,
+        "tempo": 360,
+        "lastStep": block - 100,
+        "blocksSinceLastStep": 100,
+        "subnetEmission": 0,
+        "alphaIn": 1000.0,
+        "alphaOut": 2000.0,
+        "taoIn": 500.0,
+        "alphaOutEmission": 1.0,
+        "alphaInEmission": 0.5,
+        "taoInEmission": 0.1,
+        "pendingAlphaEmission": 10.0,
+        "pendingRootEmission": 0.0,
+        "subnetVolume": 12345.0,
+        "movingPrice": {"bits": 0},
+        "rho": 10,
+        "kappa": 32767,
+        "minAllowedWeights": 1,
+        "maxAllowedWeights": 65535,
+        "weightsVersion": 0,
+        "weightsRateLimit": 100,
+        "activityCutoff": 5000,
+        "maxValidators": 64,
+        "numUids": num_uids,
+        "maxUids": num_uids,
+        "burn": 1_000_000,
+        "difficulty": 10_000_000,
+        "registrationAllowed": True,
+        "powRegistrationAllowed": False,
+        "immunityPeriod": 5000,
+        "minDifficulty": 10_000_000,
+        "maxDifficulty": "0xffffffffffffffff",
+        "minBurn": 500_000,
+        "maxBurn": 100_000_000_000,
+        "adjustmentAlpha": "0xd9999999999999",
+        "adjustmentInterval": 360,
+        "targetRegsPerInterval": 1,
+        "maxRegsPerBlock": 1,
+        "servingRateLimit": 50,
+        "commitRevealWeightsEnabled": False,
+        "commitRevealPeriod": 1,
+        "liquidAlphaEnabled": False,
+        "alphaHigh": 58982,
+        "alphaLow": 45875,
+        "bondsMovingAvg": 900000,
+        "hotkeys": hotkeys,
+        "coldkeys": coldkeys,
+        "identities": [None] * num_uids,
+        "axons": [
+            {
+                "block": block - rng.randrange(10_000),
+                "version": 1,
+                "ip": f"10.{uid // 65536 % 256}.{uid // 256 % 256}.{uid % 256}",
+                "port": 8091,
+                "ipType": 4,
+                "protocol": 4,
+                "placeholder1": 0,
+                "placeholder2": 0,
+            }
+            for uid in range(num_uids)
+        ],
+        "active": [rng.random() > 0.1 for _ in range(num_uids)],
+        "validatorPermit": [uid < 64 for uid in range(num_uids)],
+        "pruningScore": [rng.randrange(65536) for _ in range(num_uids)],
+        "lastUpdate": [block - rng.randrange(1000) for _ in range(num_uids)],
+        "emission": floats(),
+        "dividends": floats(),
+        "incentives": floats(),
+        "consensus": floats(),
+        "trust": floats(),
+        "rank": floats(),
+        "blockAtRegistration": [rng.randrange(block) for _ in range(num_uids)],
+        "alphaStake": floats(),
+        "taoStake": floats(),
+        "totalStake": floats(),
+        "taoDividendsPerHotkey": [[hotkey, rng.random()] for hotkey in hotkeys],
+        "alphaDividendsPerHotkey": [[hotkey, rng.random()] for hotkey in hotkeys],
+    }
+
+
+def make_hyperparameters_payload(**overrides: Any) -> Dict[str, Any]:
+    """
+    Build a `chain/subnet-hyperparameters/{netuid}` payload.
+
+    Args:
+        **overrides: Fields to change, e.g. `commitRevealWeightsEnabled=True`.
+
+    Returns:
+        Dict[str, Any]: The hyperparameters payload.
+    """
+    payload = {
+        "rho": 10,
+        "kappa": 32767,
+        "immunityPeriod": 5000,
+        "minAllowedWeights": 1,
+        "maxWeightsLimit": 65535,
+        "tempo": 360,
+        "minDifficulty": 10_000_000,
+        "maxDifficulty": "0xffffffffffffffff",
+        "difficulty": 10_000_000,
+        "weightsVersion": 0,
+        "weightsRateLimit": 100,
+        "adjustmentInterval": 360,
+        "activityCutoff": 5000,
+        "registrationAllowed": True,
+        "targetRegsPerInterval": 1,
+        "minBurn": 500_000,
+        "maxBurn": 100_000_000_000,
+        "bondsMovingAvg": 900000,
+        "maxRegsPerBlock": 1,
+        "servingRateLimit": 50,
+        "maxValidators": 64,
+        "adjustmentAlpha": "0xd9999999999999",
+        "commitRevealPeriod": 1,
+        "commitRevealWeightsEnabled": False,
+        "alphaHigh": 58982,
+        "alphaLow": 45875,
+        "liquidAlphaEnabled": False,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _hash(*parts: Any) -> str:
+    return "0x" + hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def _block_info(number: int) -> Dict[str, Any]:
+    return {
+        "blockNumber": number,
+        "parentHash": _hash("block", number - 1),
+        "stateRoot": _hash("state", number),
+        "extrinsicsRoot": _hash("extrinsics", number),
+    }
+
+
+def _block_room(finalised: bool) -> str:
+    return "blocks:finalized" if finalised else "blocks:best"
+
+
+def _envelope(data: Any) -> Dict[str, Any]:
+    return {"statusCode": 200, "success": True, "data": data, "error": None}
+
+
+def _json(body: bytes | Dict[str, Any], status: int = 200) -> web.Response:
+    if isinstance(body, dict):
+        body = json.dumps(body).encode()
+    return web.Response(body=body, status=status, content_type="application/json")
+
+
+def _prefers_msgpack(request: web.Request) -> bool:
+    # Like Kami, JSON wins ties and wildcards.
+    quality: Dict[str, float] = {}
+    for part in request.headers.get("Accept", "").split(","):
+        media, *params = part.split(";")
+        value = 1.0
+        for param in params:
+            name, _, q = param.strip().partition("=")
+            if name == "q":
+                value = float(q)
+        quality[media.strip()] = value
+    json_quality = max(quality.get("application/json", 0), quality.get("*/*", 0))
+    return quality.get(MSGPACK_CONTENT_TYPE, 0) > json_quality
+
+
+def _typed(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _typed(entry) for key, entry in value.items()}
+    if not isinstance(value, list):
+        return value
+    numbers = all(
+        isinstance(entry, (int, float))
+        and not isinstance(entry, bool)
+        and math.isfinite(entry)
+        for entry in value
+    )
+    if not value or not numbers:
+        return [_typed(entry) for entry in value]
+    import msgpack
+
+    # Kami packs arrays of whole numbers as int64, like JavaScript sees them.
+    if all(float(entry).is_integer() and abs(entry) < 2**53 for entry in value):
+        return msgpack.ExtType(2, np.asarray(value, dtype="<i8").tobytes())
+    return msgpack.ExtType(1, np.asarray(value, dtype="<f8").tobytes())
+
+
+def _pack(value: Any) -> bytes:
+    import msgpack
+
+    return msgpack.packb(_typed(value))
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _error(status: int, message: str) -> web.Response:
+    return _json(
+        {
+            "statusCode": status,
+            "success": False,
+            "data": None,
+            "error": {"type": HTTPStatus(status).phrase, "message": message},
+        },
+        status=status,
+    )
+
+
+class FakeKami:
+    """
+    In-process stand-in for the Kami server, for tests and offline load tests.
+
+    Serves the REST endpoints the client uses and the `subscribe-blocks`/`new-block`
+    Socket.IO events from an aiohttp server on a local port, with synthetic payloads
+    or responses recorded from a real Kami by `record_fixtures`. Every request can be
+    delayed and failed on purpose:
+
+        async with FakeKami(latency=0.005, jitter=0.01, error_rate=0.01) as fake:
+            async with Kami(url=fake.url) as kami:
+                metagraph = await kami.get_metagraph(1)
+
+    Blocks only advance when `produce_block` is called, or every `block_interval`
+    seconds if set. Metagraphs and hyperparameters carry Kami's block-hash ETags and
+    answer matching conditional requests with 304, counted in `not_modified`.
+    Metagraphs are sent as MessagePack to clients that prefer it.
+
+    Args:
+        netuids (Iterable[int]): Subnets served with synthetic metagraphs.
+        num_uids (int): Number of UIDs in each synthetic metagraph.
+        block (int): The initial latest block.
+        latency (float): Seconds every REST response is delayed by.
+        jitter (float): Maximum extra delay in seconds, drawn uniformly per request.
+        error_rate (float): Fraction of REST requests answered with `error_status`.
+        error_status (int): HTTP status of injected errors.
+        fixtures (str | Path | None): Directory of recorded responses, see
+            `record_fixtures`. GET requests with a recorded response are answered with
+            it, the others with synthetic payloads.
+        hyperparameters (Dict[str, Any] | None): Overrides of the synthetic subnet
+            hyperparameters, e.g. `{"commitRevealWeightsEnabled": True}`.
+        block_interval (float | None): Seconds between blocks produced in the
+            background, None to only produce blocks on demand.
+        seed (int): Seed for the payloads, jitter and injected errors.
+    """
+
+    def __init__(
+        self,
+        netuids: Iterable[int] = (1,),
+        num_uids: int = 256,
+        block: int = 5_000_000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        fixtures: str | Path | None = None,
+        hyperparameters: Dict[str, Any] | None = None,
+        block_interval: float | None = None,
+        seed: int = 0,
+    ):
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must not be negative")
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.netuids = set(netuids)
+        self.num_uids = num_uids
+        self.block = block
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fixtures = Path(fixtures) if fixtures is not None else None
+        self.hyperparameters = make_hyperparameters_payload(**(hyperparameters or {}))
+        self.block_interval = block_interval
+        self.seed = seed
+        # Requests received per endpoint, including failed ones.
+        self.requests: Counter[str] = Counter()
+        # Conditional requests answered with 304 Not Modified, per endpoint.
+        self.not_modified: Counter[str] = Counter()
+        # Extrinsics submitted through POST endpoints, as (endpoint, body).
+        self.extrinsics: List[Tuple[str, Dict[str, Any]]] = []
+        # Socket.IO sessions subscribed to blocks.
+        self.subscribers: Set[str] = set()
+        # Socket.IO sessions subscribed to each subnet's metagraph.
+        self.metagraph_subscribers: Dict[int, Set[str]] = {}
+        # Metagraph payload last sent to the subscribers of each subnet.
+        self._published: Dict[int, Dict[str, Any]] = {}
+        self.url = ""
+        self._rng = random.Random(seed)
+        self._fail_next: List[int] = []
+        self._metagraphs: Dict[Tuple[int, int], Tuple[Dict[str, Any], bytes]] = {}
+        self._packed: Dict[Tuple[int, int], bytes] = {}
+        self._recorded: Dict[Path, bytes | None] = {}
+        self._runner: web.AppRunner | None = None
+        self._producer: asyncio.Task[None] | None = None
+        self.sio = socketio.AsyncServer(async_mode="aiohttp", logger=False)
+        self.sio.on("subscribe-blocks", self._subscribe_blocks)
+        self.sio.on("subscribe-metagraph", self._subscribe_metagraph)
+        self.sio.on("unsubscribe-metagraph", self._unsubscribe_metagraph)
+        self.sio.on("disconnect", self._disconnect)
+
+    async def __aenter__(self) -> "FakeKami":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.stop()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start serving, on a free port unless `port` is given.
+
+        Returns:
+            str: The base URL to pass to `Kami(url=...)`.
+        """
+        app = web.Application(middlewares=[self._inject])
+        self.sio.attach(app)
+        get, post = app.router.add_get, app.router.add_post
+        get("/chain/latest-block", self._latest_block)
+        get("/chain/subnet-metagraph/{netuid}", self._metagraph)
+        get("/chain/subnet-hyperparameters/{netuid}", self._hyperparameters)
+        get("/chain/check-hotkey", self._check_hotkey)
+        get("/substrate/health", self._health)
+        get("/substrate/runtime-spec-version", self._spec_version)
+        get("/substrate/keyring-pair-info", self._keyring_pair_info)
+        get("/substrate/account-nonce/{account}", self._account_nonce)
+        for endpoint in (
+            "chain/set-weights",
+            "chain/set-commit-reveal-weights",
+            "chain/set-timelocked-weights",
+            "chain/serve-axon",
+        ):
+            post(f"/{endpoint}", self._extrinsic)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self.url = f"http://{host}:{bound}"
+        if self.block_interval is not None:
+            self._producer = asyncio.create_task(self._produce_blocks())
+        return self.url
+
+    async def stop(self):
+        """
+        Disconnect websocket clients and stop serving.
+        """
+        if self._producer is not None:
+            self._producer.cancel()
+            self._producer = None
+        if self._runner is not None:
+            await self.sio.shutdown()
+            await self._runner.cleanup()
+            self._runner = None
+
+    def fail_next(self, count: int = 1, status: int | None = None):
+        """
+        Answer the next `count` REST requests with an error.
+
+        Args:
+            count (int): Number of requests to fail.
+            status (int | None): HTTP status of the errors, `error_status` if None.
+        """
+        self._fail_next.extend([status or self.error_status] * count)
+
+    async def produce_block(self, skip: int = 0) -> int:
+        """
+        Advance the chain, emit `new-block` to every block subscriber and a
+        `metagraph-delta` to the subscribers of every subnet.
+
+        Args:
+            skip (int): Blocks to advance by without emitting them first, to
+                simulate missed blocks.
+
+        Returns:
+            int: The new latest block.
+        """
+        self.block += skip + 1
+        block = _block_info(self.block)
+        await self.sio.emit("new-block", block, room=["blocks:finalized", "blocks:best"])
+        for netuid, sids in self.metagraph_subscribers.items():
+            previous = self._published.get(netuid)
+            if not sids or previous is None:
+                self._published.pop(netuid, None)
+                continue
+            current, _ = self._synthetic_metagraph(netuid, self.block)
+            self._published[netuid] = current
+            await self.sio.emit(
+                "metagraph-delta",
+                diff_metagraph(previous, current),
+                room=f"metagraph:{netuid}",
+            )
+        return self.block
+
+    async def wait_for_subscribers(self, count: int = 1, timeout: float = 5.0):
+        """
+        Wait until at least `count` clients are subscribed to blocks.
+
+        Raises:
+            TimeoutError: If they did not subscribe within `timeout` seconds.
+        """
+        async with asyncio.timeout(timeout):
+            while len(self.subscribers) < count:
+                await asyncio.sleep(0.005)
+
+    async def _produce_blocks(self):
+        assert self.block_interval is not None
+        while True:
+            await asyncio.sleep(self.block_interval)
+            await self.produce_block()
+
+    async def _subscribe_blocks(self, sid: str, finalised: bool = True):
+        # Like Kami, subscribing again replaces the previous subscription.
+        await self.sio.leave_room(sid, _block_room(not finalised))
+        await self.sio.enter_room(sid, _block_room(finalised))
+        self.subscribers.add(sid)
+        await self.sio.emit(
+            "subscription-confirmed",
+            {"message": "Successfully subscribed to new blocks"},
+            to=sid,
+        )
+
+    async def _subscribe_metagraph(self, sid: str, netuids: Any):
+        if not isinstance(netuids, list) or not set(netuids) <= self.netuids:
+            await self.sio.emit(
+                "metagraph-subscription-error",
+                {"message": f"Unknown netuids: {netuids}"},
+                to=sid,
+            )
+            return
+        for netuid in netuids:
+            await self.sio.enter_room(sid, f"metagraph:{netuid}")
+            self.metagraph_subscribers.setdefault(netuid, set()).add(sid)
+            if netuid not in self._published:
+                payload, _ = self._synthetic_metagraph(netuid, self.block)
+                self._published[netuid] = payload
+            await self.sio.emit("metagraph-snapshot", self._published[netuid], to=sid)
+        await self.sio.emit(
+            "metagraph-subscription-confirmed",
+            {"message": "Successfully subscribed to metagraphs", "netuids": netuids},
+            to=sid,
+        )
+
+    async def _unsubscribe_metagraph(self, sid: str, netuids: List[int]):
+        for netuid in netuids:
+            await self.sio.leave_room(sid, f"metagraph:{netuid}")
+            self.metagraph_subscribers.get(netuid, set()).discard(sid)
+
+    async def _disconnect(self, sid: str, reason: Any = None):
+        self.subscribers.discard(sid)
+        for sids in self.metagraph_subscribers.values():
+            sids.discard(sid)
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler: Handler) -> Any:
+        if request.path.startswith("/socket.io"):
+            return await handler(request)
+        endpoint = request.path.strip("/")
+        self.requests[endpoint] += 1
+        delay = self.latency
+        if self.jitter:
+            delay += self._rng.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self._fail_next:
+            status = self._fail_next.pop(0)
+            return _error(status, f"Injected error on {endpoint}")
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return _error(self.error_status, f"Injected error on {endpoint}")
+        if request.method == "GET" and self.fixtures is not None:
+            recorded = await self._load_fixture(endpoint, request.query.get("block"))
+            if recorded is not None:
+                return _json(recorded)
+        return await handler(request)
+
+    async def _load_fixture(self, endpoint: str, block: str | None) -> bytes | None:
+        assert self.fixtures is not None
+        name = endpoint if block is None else f"{endpoint}@{block}"
+        path = (self.fixtures / f"{name}.json").resolve()
+        if not path.is_relative_to(self.fixtures.resolve()):
+            return None
+        if path not in self._recorded:
+            self._recorded[path] = await asyncio.to_thread(_read_if_exists, path)
+        return self._recorded[path]
+
+    def _synthetic_metagraph(
+        self, netuid: int, block: int
+    ) -> Tuple[Dict[str, Any], bytes]:
+        key = (netuid, block)
+        cached = self._metagraphs.get(key)
+        if cached is not None:
+            return cached
+        payload = make_metagraph_payload(
+            self.num_uids, netuid=netuid, block=block, seed=self.seed + netuid
+        )
+        if len(self._metagraphs) >= _METAGRAPH_CACHE_SIZE:
+            self._metagraphs.pop(next(iter(self._metagraphs)))
+        self._metagraphs[key] = payload, json.dumps(_envelope(payload)).encode()
+        return self._metagraphs[key]
+
+    def _netuid(self, request: web.Request) -> int | None:
+        value = request.match_info.get("netuid") or request.query.get("netuid", "")
+        if not value.isdigit() or int(value) not in self.netuids:
+            return None
+        return int(value)
+
+    def _block(self, request: web.Request) -> int:
+        block = request.query.get("block")
+        return self.block if block is None else int(block)
+
+    async def _latest_block(self, request: web.Request) -> web.Response:
+        return _json(_envelope(_block_info(self.block)))
+
+    def _revalidated(
+        self,
+        request: web.Request,
+        block: int,
+        body: Callable[[str], bytes],
+        compact: bool = False,
+    ) -> web.Response:
+        # Like Kami, tag responses read at a block with the block hash, per format,
+        # and only offer MessagePack on `compact` routes.
+        endpoint = request.path.strip("/")
+        format = "msgpack" if compact and _prefers_msgpack(request) else "json"
+        suffix = "" if format == "json" else f"+{format}"
+        etag = f'"{endpoint}@{_hash("block", block)}{suffix}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if compact:
+            headers["Vary"] = "Accept"
+        if _etag_matches(request.headers.get("If-None-Match"), etag):
+            self.not_modified[endpoint] += 1
+            return web.Response(status=304, headers=headers)
+        return web.Response(
+            body=body(format),
+            headers=headers,
+            content_type=_CONTENT_TYPES[format],
+        )
+
+    def _encoded_metagraph(self, netuid: int, block: int, format: str) -> bytes:
+        payload, encoded = self._synthetic_metagraph(netuid, block)
+        if format == "json":
+            return encoded
+        key = (netuid, block)
+        if key not in self._packed:
+            if len(self._packed) >= _METAGRAPH_CACHE_SIZE:
+                self._packed.pop(next(iter(self._packed)))
+            self._packed[key] = _pack(_envelope(payload))
+        return self._packed[key]
+
+    async def _metagraph(self, request: web.Request) -> web.Response:
+        netuid = self._netuid(request)
+        if netuid is None:
+            return _error(404, f"Subnet {request.match_info['netuid']} does not exist")
+        block = self._block(request)
+        return self._revalidated(
+            request,
+            block,
+            lambda format: self._encoded_metagraph(netuid, block, format),
+            compact=True,
+        )
+
+    async def _hyperparameters(self, request: web.Request) -> web.Response:
+        if self._netuid(request) is None:
+            return _error(404, f"Subnet {request.match_info['netuid']} does not exist")
+        return self._revalidated(
+            request,
+            self._block(request),
+            lambda format: json.dumps(_envelope(self.hyperparameters)).encode(),
+        )
+
+    async def _check_hotkey(self, request: web.Request) -> web.Response:
+        netuid = self._netuid(request)
+        if netuid is None:
+            return _error(400, "Invalid netuid")
+        payload, _ = self._synthetic_metagraph(netuid, self._block(request))
+        valid = request.query.get("hotkey") in payload["hotkeys"]
+        return _json(_envelope({"isHotkeyValid": valid}))
+
+    async def _health(self, request: web.Request) -> web.Response:
+        return _json(
+            _envelope(
+                {
+                    "latestBlock": self.block,
+                    "runtimeSpecVersionDuringKamiInitialization": _SPEC_VERSION,
+                    "runtimeSpecVersionDuringHealthCheck": _SPEC_VERSION,
+                }
+            )
+        )
+
+    async def _spec_version(self, request: web.Request) -> web.Response:
+        return _json(_envelope({"specVersion": _SPEC_VERSION}))
+
+    async def _keyring_pair_info(self, request: web.Request) -> web.Response:
+        netuid = min(self.netuids) if self.netuids else 0
+        payload, _ = self._synthetic_metagraph(netuid, self.block)
+        hotkey = payload["hotkeys"][0] if payload["hotkeys"] else ""
+        digest = hashlib.sha256(hotkey.encode()).digest()
+        key = {str(i): byte for i, byte in enumerate(digest)}
+        return _json(
+            _envelope(
+                {
+                    "keyringPair": {
+                        "address": hotkey,
+                        "addressRaw": key,
+                        "isLocked": False,
+                        "meta": {},
+                        "publicKey": key,
+                        "type": "sr25519",
+                    },
+                    "walletColdkey": payload["ownerColdkey"],
+                }
+            )
+        )
+
+    async def _account_nonce(self, request: web.Request) -> web.Response:
+        return _json(_envelope({"accountNonce": len(self.extrinsics)}))
+
+    async def _extrinsic(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        endpoint = request.path.strip("/")
+        self.extrinsics.append((endpoint, body))
+        return _json(_envelope(_hash("extrinsic", len(self.extrinsics))))
+
+
+def _read_if_exists(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _write_fixture(path: Path, result: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result))
+
+
+async def record_fixtures(
+    kami: Kami,
+    directory: str | Path,
+    netuids: Iterable[int],
+    endpoints: Iterable[str] = (),
+) -> List[Path]:
+    """
+    Record responses of a real Kami to serve them from `FakeKami(fixtures=...)`.
+
+    Each response is written to `{directory}/{endpoint}.json`, e.g.
+    `chain/subnet-metagraph/1.json`; a response for a pinned block is served from
+    `{endpoint}@{block}.json`.
+
+    Args:
+        kami (Kami): Client connected to the Kami to record from.
+        directory (str | Path): Where to write the fixtures.
+        netuids (Iterable[int]): Subnets to record the metagraph and hyperparameters of.
+        endpoints (Iterable[str]): Further GET endpoints to record.
+
+    Returns:
+        List[Path]: The files written.
+    """
+    directory = Path(directory)
+    recorded = ["chain/latest-block", "substrate/health"]
+    for netuid in netuids:
+        recorded.append(f"chain/subnet-metagraph/{netuid}")
+        recorded.append(f"chain/subnet-hyperparameters/{netuid}")
+    recorded.extend(endpoints)
+    paths = []
+    for endpoint in recorded:
+        result = await kami.get(endpoint)
+        if not result.get("success", True):
+            logger.warning(f"Not recording failed response of {endpoint}")
+            continue
+        path = directory / f"{endpoint}.json"
+        await asyncio.to_thread(_write_fixture, path, result)
+        paths.append(path)
+    return paths
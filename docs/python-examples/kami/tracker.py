@@ -0,0 +1,241 @@
+import inspect
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List
+
+import numpy as np
+from loguru import logger
+
+from kami.blocks import BlockEvent
+from kami.columnar import BOOL_COLUMNS, FLOAT_COLUMNS, INT_COLUMNS, ColumnarMetagraph
+from kami.index import MetagraphIndex
+
+if TYPE_CHECKING:
+    from kami.kami import Kami
+
+STAKE_COLUMNS = ("alphaStake", "taoStake", "totalStake")
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+@dataclass
+class MetagraphDelta:
+    """
+    Per-UID changes between two metagraph snapshots of a subnet.
+
+    Every UID set is a sorted `int64` array. A UID that gets a new neuron is listed in
+    `registered` only; its other fields are not reported again in `changed`.
+    """
+
+    netuid: int
+    block: int
+    previous_block: int | None
+    metagraph: ColumnarMetagraph
+    # UIDs that hold a new neuron: new UIDs, or a deregistered neuron replaced.
+    registered: np.ndarray = field(default_factory=lambda: _EMPTY)
+    # UIDs that no longer exist because the subnet shrank.
+    deregistered: np.ndarray = field(default_factory=lambda: _EMPTY)
+    # UIDs whose hotkey changed without a new registration.
+    hotkey_swaps: np.ndarray = field(default_factory=lambda: _EMPTY)
+    axon_changes: np.ndarray = field(default_factory=lambda: _EMPTY)
+    stake_changes: np.ndarray = field(default_factory=lambda: _EMPTY)
+    # Per-UID column name -> UIDs whose value changed.
+    changed: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def changes_identity(self) -> bool:
+        """
+        Whether any UID's hotkey, coldkey or axon changed, i.e. whether a
+        `MetagraphIndex` over the previous snapshot is out of date.
+        """
+        coldkeys = self.changed.get("coldkeys", _EMPTY)
+        return bool(
+            self.registered.size
+            or self.deregistered.size
+            or self.hotkey_swaps.size
+            or self.axon_changes.size
+            or coldkeys.size
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.registered.size
+            or self.deregistered.size
+            or self.hotkey_swaps.size
+            or any(uids.size for uids in self.changed.values())
+        )
+
+
+def _changed_uids(old: np.ndarray, new: np.ndarray, skip: np.ndarray) -> np.ndarray:
+    size = min(len(old), len(new))
+    uids = np.flatnonzero(old[:size] != new[:size])
+    return np.setdiff1d(uids, skip, assume_unique=True)
+
+
+def diff_metagraphs(
+    previous: ColumnarMetagraph | None, current: ColumnarMetagraph
+) -> MetagraphDelta:
+    """
+    Compute the per-UID delta from `previous` to `current`.
+
+    Args:
+        previous (ColumnarMetagraph | None): The last snapshot, or None if there is none,
+            in which case every UID is reported as registered.
+        current (ColumnarMetagraph): The new snapshot.
+
+    Returns:
+        MetagraphDelta: The changes between the two snapshots.
+    """
+    new_size = len(current.hotkeys)
+    if previous is None:
+        return MetagraphDelta(
+            netuid=current.netuid,
+            block=current.block,
+            previous_block=None,
+            metagraph=current,
+            registered=np.arange(new_size, dtype=np.int64),
+        )
+
+    old_size = len(previous.hotkeys)
+    common = min(old_size, new_size)
+    old_hotkeys = np.asarray(previous.hotkeys[:common])
+    new_hotkeys = np.asarray(current.hotkeys[:common])
+    hotkey_changed = old_hotkeys != new_hotkeys
+    # A new registration resets the registration block, even when the same hotkey
+    # registers again; a hotkey swap keeps it.
+    reregistered = (
+        previous.blockAtRegistration[:common] != current.blockAtRegistration[:common]
+    )
+    registered = np.concatenate(
+        [
+            np.flatnonzero(reregistered),
+            np.arange(old_size, new_size, dtype=np.int64),
+        ]
+    )
+    hotkey_swaps = np.flatnonzero(hotkey_changed & ~reregistered)
+
+    changed: Dict[str, np.ndarray] = {}
+    for name in FLOAT_COLUMNS + INT_COLUMNS + BOOL_COLUMNS:
+        changed[name] = _changed_uids(
+            getattr(previous, name), getattr(current, name), registered
+        )
+    changed["coldkeys"] = _changed_uids(
+        np.asarray(previous.coldkeys), np.asarray(current.coldkeys), registered
+    )
+    changed["axons"] = _changed_uids(previous.axons, current.axons, registered)
+
+    return MetagraphDelta(
+        netuid=current.netuid,
+        block=current.block,
+        previous_block=previous.block,
+        metagraph=current,
+        registered=registered,
+        deregistered=np.arange(new_size, old_size, dtype=np.int64),
+        hotkey_swaps=hotkey_swaps,
+        axon_changes=changed["axons"],
+        stake_changes=np.unique(
+            np.concatenate([changed[name] for name in STAKE_COLUMNS])
+        ),
+        changed=changed,
+    )
+
+
+DeltaCallback = Callable[[MetagraphDelta], Awaitable[None] | None]
+
+
+class MetagraphTracker:
+    """
+    Keep the latest metagraph of a subnet and publish per-UID deltas.
+
+    Call `update()` once per block, or hand `run()` a stream of blocks such as
+    `Kami.subscribe_blocks()`. Subscribers only receive non-empty deltas, so
+    downstream scoring can update incrementally instead of recomputing over every UID.
+
+    `index` is a `MetagraphIndex` over the latest snapshot for synchronous lookups,
+    e.g. authenticating requests by hotkey. It is rebuilt only when a hotkey,
+    coldkey or axon changes.
+
+    If the client has a `SnapshotStore`, the tracker starts from the latest stored
+    snapshot, so after a restart the first delta only covers what changed meanwhile.
+
+    Args:
+        kami (Kami): The client used to fetch metagraphs.
+        netuid (int): The subnet to track.
+    """
+
+    def __init__(self, kami: "Kami", netuid: int):
+        self.kami = kami
+        self.netuid = netuid
+        self.snapshot: ColumnarMetagraph | None = None
+        self.index: MetagraphIndex | None = None
+        if kami.store is not None:
+            self.snapshot = kami.store.load_metagraph(netuid)
+            if self.snapshot is not None:
+                self.index = MetagraphIndex(self.snapshot)
+        self._subscribers: List[DeltaCallback] = []
+
+    def subscribe(self, callback: DeltaCallback) -> Callable[[], None]:
+        """
+        Register a sync or async callback for every non-empty delta.
+
+        Returns:
+            Callable[[], None]: Removes the callback again.
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    async def update(self, block: int | None = None) -> MetagraphDelta | None:
+        """
+        Fetch the metagraph and publish what changed since the last snapshot.
+
+        Args:
+            block (int | None): The block that triggered the update, if known. Lets a
+                response cache drop metagraphs older than this block.
+
+        Returns:
+            MetagraphDelta | None: The delta, or None if the metagraph is unchanged.
+        """
+        if block is not None and self.kami.cache is not None:
+            self.kami.cache.observe_block(block)
+        current = await self.kami.get_metagraph(self.netuid, columnar=True)
+        assert isinstance(current, ColumnarMetagraph)
+        if self.snapshot is not None and current.block <= self.snapshot.block:
+            return None
+
+        delta = diff_metagraphs(self.snapshot, current)
+        self.snapshot = current
+        if self.index is None or delta.changes_identity:
+            self.index = MetagraphIndex(current)
+        else:
+            self.index.block = current.block
+            self.index.metagraph = current
+        if delta.is_empty:
+            return None
+        for callback in list(self._subscribers):
+            result = callback(delta)
+            if inspect.isawaitable(result):
+                await result
+        return delta
+
+    async def run(self, blocks: AsyncIterable[Any]):
+        """
+        Update the snapshot for every block produced by `blocks`.
+
+        Items may be block numbers, `BlockEvent`s from `Kami.subscribe_blocks`, or
+        block info dicts with a `blockNumber` key. A failed update is logged and
+        retried on the next block.
+        """
+        async for block in blocks:
+            if isinstance(block, BlockEvent):
+                if block.backfilled:
+                    # Only the current metagraph can be fetched, skip straight to it.
+                    continue
+                number = block.block.blockNumber
+            elif isinstance(block, dict):
+                number = block.get("blockNumber")
+            else:
+                number = block
+            try:
+                await self.update(int(number) if number is not None else None)
+            except Exception as e:
+                logger.error(f"Failed to update metagraph for netuid {self.netuid}: {e}")
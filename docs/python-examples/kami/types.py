@@ -70,6 +70,19 @@ class CommitRevealPayload(BaseModel):
     reveal_round: int
 
 
+class TimelockedWeightsPayload(BaseModel):
+    netuid: int
+    commit: str
+    revealRound: int
+    commitRevealVersion: int = 4
+
+
+class SubstrateHealth(BaseModel):
+    latestBlock: int
+    runtimeSpecVersionDuringKamiInitialization: int
+    runtimeSpecVersionDuringHealthCheck: int
+
+
 class MovingPrice(BaseModel):
     bits: int
 
@@ -105,7 +118,7 @@ class AxonInfo(BaseModel):
     placeholder2: int
 
 
-class SubnetMetagraph(BaseModel):
+class SubnetMetagraphInfo(BaseModel):
     netuid: int
     name: str
     symbol: str
@@ -160,6 +173,22 @@ class SubnetMetagraph(BaseModel):
     alphaHigh: int
     alphaLow: int
     bondsMovingAvg: int
+
+    @field_validator(
+        "difficulty", "minDifficulty", "maxDifficulty", "adjustmentAlpha", mode="before"
+    )
+    def validate_hex_number(cls, v: Any) -> Any:
+        if isinstance(v, str) and v.startswith("0x"):
+            return int(v, 16)
+        elif isinstance(v, int):
+            return v
+        return v
+
+    class Config:
+        arbitrary_types_allowed = False
+
+
+class SubnetMetagraph(SubnetMetagraphInfo):
     hotkeys: List[str]
     coldkeys: List[str]
     identities: List[IdentitiesInfo | None]
@@ -181,19 +210,6 @@ class SubnetMetagraph(BaseModel):
     taoDividendsPerHotkey: List[Tuple[str, float]]
     alphaDividendsPerHotkey: List[Tuple[str, float]]
 
-    @field_validator(
-        "difficulty", "minDifficulty", "maxDifficulty", "adjustmentAlpha", mode="before"
-    )
-    def validate_hex_number(cls, v: Any) -> Any:
-        if isinstance(v, str) and v.startswith("0x"):
-            return int(v, 16)
-        elif isinstance(v, int):
-            return v
-        return v
-
-    class Config:
-        arbitrary_types_allowed = False
-
 class KeyringPair(BaseModel):
     address: str
     addressRaw: dict[str, int]
@@ -205,3 +221,10 @@ class KeyringPair(BaseModel):
 class KeyringPairInfo(BaseModel):
     keyringPair: KeyringPair
     walletColdkey: str
+
+
+class BlockInfo(BaseModel):
+    blockNumber: int
+    parentHash: str | None = None
+    stateRoot: str | None = None
+    extrinsicsRoot: str | None = None
@@ -0,0 +1,165 @@
+from typing import Tuple
+
+import numpy as np
+
+from kami.types import SetWeightsPayload, SubnetHyperparameters
+
+U16_MAX = 65535
+
+
+def normalize_max_weight(weights: np.ndarray, limit: float = 0.1) -> np.ndarray:
+    """
+    Normalize weights to sum to 1 while capping every weight at `limit`.
+
+    The largest weights are clipped to a common cutoff chosen so that, after
+    renormalizing, none of them exceeds `limit`.
+
+    Args:
+        weights (np.ndarray): Non-negative weights.
+        limit (float): Maximum share a single weight may get.
+
+    Returns:
+        np.ndarray: The normalized weights.
+    """
+    epsilon = 1e-7
+    weights = np.array(weights, dtype=np.float64)
+    size = weights.shape[0]
+    if weights.sum() == 0 or size * limit <= 1:
+        return np.ones_like(weights) / size
+
+    values = np.sort(weights)
+    estimation = values / values.sum()
+    if estimation.max() <= limit:
+        return weights / weights.sum()
+
+    cumsum = np.cumsum(estimation)
+    estimation_sum = (size - 1 - np.arange(size)) * estimation
+    n_values = int((estimation / (estimation_sum + cumsum + epsilon) < limit).sum())
+    cutoff_scale = (limit * cumsum[n_values - 1] - epsilon) / (
+        1 - (limit * (size - n_values))
+    )
+    cutoff = cutoff_scale * values.sum()
+    weights[weights > cutoff] = cutoff
+    return weights / weights.sum()
+
+
+def process_weights(
+    scores: np.ndarray,
+    min_allowed_weights: int,
+    max_weight_limit: float,
+    exclude_quantile: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Apply a subnet's weight rules to per-UID scores.
+
+    Zero scores are dropped. If fewer than `min_allowed_weights` UIDs are left, a
+    small weight is spread over every UID to meet the minimum. Otherwise scores
+    below `exclude_quantile` are dropped, as long as `min_allowed_weights` UIDs remain.
+    The result is normalized with `normalize_max_weight`.
+
+    Args:
+        scores (np.ndarray): Non-negative score of every UID, indexed by UID.
+        min_allowed_weights (int): The subnet's `minAllowedWeights`.
+        max_weight_limit (float): Maximum share of a single UID, i.e. the subnet's
+            `maxWeightsLimit / U16_MAX`.
+        exclude_quantile (float): Quantile of the lowest non-zero scores to drop.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The UIDs and their normalized float weights.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.ndim != 1:
+        raise ValueError("scores must be a 1-dimensional array")
+    if not np.all(np.isfinite(scores)):
+        raise ValueError("scores must be finite")
+    if scores.size and scores.min() < 0:
+        raise ValueError("scores must be non-negative")
+
+    size = scores.shape[0]
+    non_zero_uids = np.flatnonzero(scores > 0)
+    non_zero_weights = scores[non_zero_uids]
+
+    if non_zero_uids.size == 0 or size < min_allowed_weights:
+        return np.arange(size), np.ones(size) / size
+
+    if non_zero_uids.size < min_allowed_weights:
+        weights = np.full(size, 1e-5)
+        weights[non_zero_uids] += non_zero_weights
+        return np.arange(size), normalize_max_weight(weights, limit=max_weight_limit)
+
+    non_zero_size = non_zero_weights.size
+    max_exclude = max(0, non_zero_size - min_allowed_weights) / non_zero_size
+    quantile = min(exclude_quantile, max_exclude)
+    lowest = np.quantile(non_zero_weights, quantile)
+    keep = non_zero_weights >= lowest
+    return non_zero_uids[keep], normalize_max_weight(
+        non_zero_weights[keep], limit=max_weight_limit
+    )
+
+
+def quantize_weights(
+    uids: np.ndarray, weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert float weights into the `u16` weights submitted to the chain.
+
+    Weights are scaled so the largest becomes `U16_MAX`, rounded half to even like
+    Python's `round`, and UIDs whose weight rounds to zero are dropped.
+
+    Args:
+        uids (np.ndarray): The UIDs.
+        weights (np.ndarray): Non-negative float weights of `uids`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The remaining UIDs and their `uint16` weights.
+    """
+    uids = np.asarray(uids, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    if uids.shape != weights.shape:
+        raise ValueError("uids and weights must have the same length")
+    if weights.size and weights.min() < 0:
+        raise ValueError("weights must be non-negative")
+    if uids.size and uids.min() < 0:
+        raise ValueError("uids must be non-negative")
+    if weights.sum() == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint16)
+
+    quantized = np.rint(weights / weights.max() * U16_MAX)
+    keep = quantized != 0
+    return uids[keep], quantized[keep].astype(np.uint16)
+
+
+def build_set_weights_payload(
+    scores: np.ndarray,
+    hyperparameters: SubnetHyperparameters,
+    netuid: int,
+    version_key: int,
+    exclude_quantile: float = 0.0,
+) -> SetWeightsPayload:
+    """
+    Build a ready-to-submit `SetWeightsPayload` from per-UID float scores.
+
+    Args:
+        scores (np.ndarray): Non-negative score of every UID, indexed by UID.
+        hyperparameters (SubnetHyperparameters): The subnet's hyperparameters, from
+            `Kami.get_subnet_hyperparameters`.
+        netuid (int): The netuid to set weights on.
+        version_key (int): The weights version key.
+        exclude_quantile (float): Quantile of the lowest non-zero scores to drop.
+
+    Returns:
+        SetWeightsPayload: The payload for `Kami.set_weights`.
+    """
+    uids, weights = process_weights(
+        scores,
+        min_allowed_weights=hyperparameters.minAllowedWeights,
+        max_weight_limit=hyperparameters.maxWeightsLimit / U16_MAX,
+        exclude_quantile=exclude_quantile,
+    )
+    dests, quantized = quantize_weights(uids, weights)
+    return SetWeightsPayload(
+        netuid=netuid,
+        dests=dests.tolist(),
+        weights=quantized.tolist(),
+        version_key=version_key,
+    )
@@ -0,0 +1,46 @@
+"""
+Async Python WebSocket client for Kami metagraph subscription
+Uses Kami.subscribe_metagraph, an async iterator over metagraph updates. Kami sends
+a full metagraph once, then only the fields and UIDs that changed on each finalized
+block, which the client applies to its local copy.
+
+Install dependencies:
+pip install python-socketio[asyncio-client]
+"""
+
+import asyncio
+
+from dotenv import load_dotenv
+
+from kami import Kami
+
+
+async def main():
+    load_dotenv()
+    kami = Kami()
+
+    async with kami.subscribe_metagraph([1, 2], columnar=True) as updates:
+        print("Listening for metagraph updates... (Press Ctrl+C to stop)")
+        async for update in updates:
+            metagraph = update.metagraph
+            print(f"📈 Netuid {update.netuid} at block {update.block}:")
+            if update.is_snapshot:
+                print(f"   Snapshot with {len(metagraph.hotkeys)} UIDs")
+            else:
+                changed = {
+                    name: len(change["changes"])
+                    for name, change in update.delta["arrays"].items()
+                }
+                print(f"   Changed fields: {sorted(update.delta['fields'])}")
+                print(f"   Changed UIDs per column: {changed}")
+            print(f"   Total stake:  {metagraph.totalStake.sum():.2f}")
+            print("-" * 50)
+
+    await kami.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nShutting down...")
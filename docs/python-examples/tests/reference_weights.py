@@ -0,0 +1,85 @@
+"""
+Loop-based reference implementation of the weight rules, transcribed from
+bittensor's `process_weights_for_netuid` and `convert_weights_and_uids_for_emit`.
+
+Used to check `kami.weights` against and as the benchmark baseline.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+U16_MAX = 65535
+
+
+def normalize_max_weight(x: np.ndarray, limit: float = 0.1) -> np.ndarray:
+    epsilon = 1e-7
+    weights = x.copy()
+    values = np.sort(weights)
+    if x.sum() == 0 or x.shape[0] * limit <= 1:
+        return np.ones_like(x) / x.shape[0]
+    estimation = values / values.sum()
+    if estimation.max() <= limit:
+        return weights / weights.sum()
+    cumsum = np.cumsum(estimation, 0)
+    estimation_sum = np.array(
+        [(len(values) - i - 1) * estimation[i] for i in range(len(values))]
+    )
+    n_values = (estimation / (estimation_sum + cumsum + epsilon) < limit).sum()
+    cutoff_scale = (limit * cumsum[n_values - 1] - epsilon) / (
+        1 - (limit * (len(estimation) - n_values))
+    )
+    cutoff = cutoff_scale * values.sum()
+    weights[weights > cutoff] = cutoff
+    return weights / weights.sum()
+
+
+def process_weights(
+    scores: List[float],
+    min_allowed_weights: int,
+    max_weight_limit: float,
+    quantile: float = 0.0,
+) -> Tuple[List[int], List[float]]:
+    n = len(scores)
+    non_zero_uids = [uid for uid in range(n) if scores[uid] > 0]
+    non_zero_weights = [scores[uid] for uid in non_zero_uids]
+    if len(non_zero_uids) == 0 or n < min_allowed_weights:
+        return list(range(n)), [1 / n] * n
+    if len(non_zero_uids) < min_allowed_weights:
+        weights = [1e-5] * n
+        for uid, weight in zip(non_zero_uids, non_zero_weights):
+            weights[uid] += weight
+        normalized = normalize_max_weight(np.array(weights), limit=max_weight_limit)
+        return list(range(n)), normalized.tolist()
+    max_exclude = max(0, len(non_zero_weights) - min_allowed_weights) / len(
+        non_zero_weights
+    )
+    exclude_quantile = min([quantile, max_exclude])
+    lowest_quantile = np.quantile(np.array(non_zero_weights), exclude_quantile)
+    kept = [
+        (uid, weight)
+        for uid, weight in zip(non_zero_uids, non_zero_weights)
+        if lowest_quantile <= weight
+    ]
+    normalized = normalize_max_weight(
+        np.array([weight for _, weight in kept]), limit=max_weight_limit
+    )
+    return [uid for uid, _ in kept], normalized.tolist()
+
+
+def convert_weights_and_uids_for_emit(
+    uids: List[int], weights: List[float]
+) -> Tuple[List[int], List[int]]:
+    if min(weights) < 0:
+        raise ValueError("weights must be non-negative")
+    if sum(weights) == 0:
+        return [], []
+    max_weight = float(max(weights))
+    weights = [float(value) / max_weight for value in weights]
+    weight_uids, weight_vals = [], []
+    for weight_i, uid_i in zip(weights, uids):
+        uint16_val = round(float(weight_i) * int(U16_MAX))
+        if uint16_val != 0:
+            weight_vals.append(uint16_val)
+            weight_uids.append(uid_i)
+    return weight_uids, weight_vals
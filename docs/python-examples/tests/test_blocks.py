@@ -0,0 +1,86 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from kami.blocks import BlockStream, OverflowPolicy
+from kami.testing import FakeKami
+
+
+async def produce(fake: FakeKami, stream: BlockStream, count: int, skip: int = 0):
+    # The first of the `count` blocks comes after `skip` missed ones.
+    received = stream.stats.received + count
+    for i in range(count):
+        await fake.produce_block(skip=skip if i == 0 else 0)
+    async with asyncio.timeout(5):
+        while stream.stats.received < received:
+            await asyncio.sleep(0.005)
+
+
+async def drain(stream: BlockStream) -> List[int]:
+    numbers = []
+    while not stream._queue.empty():
+        numbers.append((await anext(stream)).block.blockNumber)
+    return numbers
+
+
+@pytest.mark.parametrize(
+    "overflow,expected,dropped",
+    [
+        (OverflowPolicy.DROP_OLDEST, [105, 106, 107], 4),
+        # The fourth block clears the full queue, the seventh clears it again.
+        (OverflowPolicy.COALESCE, [107], 6),
+    ],
+)
+def test_full_queue_drops_blocks(overflow, expected, dropped):
+    async def main():
+        async with FakeKami(block=100) as fake:
+            async with BlockStream(fake.url, maxsize=3, overflow=overflow) as stream:
+                await fake.wait_for_subscribers()
+                await produce(fake, stream, 7)
+                return await drain(stream), stream.stats
+
+    numbers, stats = asyncio.run(main())
+    assert numbers == expected
+    assert stats.dropped == dropped and stats.delivered == len(expected)
+
+
+def test_block_policy_keeps_every_block_in_order():
+    async def main():
+        async with FakeKami(block=100) as fake:
+            async with BlockStream(
+                fake.url, maxsize=2, overflow=OverflowPolicy.BLOCK
+            ) as stream:
+                await fake.wait_for_subscribers()
+                await produce(fake, stream, 3)
+                # A gap is backfilled behind the blocks already waiting.
+                await produce(fake, stream, 2, skip=2)
+                assert stream._queue.qsize() == 2
+                numbers = [(await anext(stream)).block.blockNumber for _ in range(7)]
+                return numbers, stream.stats
+
+    numbers, stats = asyncio.run(main())
+    assert numbers == list(range(101, 108))
+    assert stats.dropped == 0 and stats.backfilled == 2
+
+
+def test_resubscribes_and_backfills_after_a_server_disconnect():
+    async def main():
+        async with FakeKami(block=100) as fake:
+            async with BlockStream(fake.url) as stream:
+                await fake.wait_for_subscribers()
+                await produce(fake, stream, 1)
+                (sid,) = fake.subscribers
+                await fake.sio.disconnect(sid)
+                # Produced while disconnected, so never sent to the stream.
+                await fake.produce_block()
+                await fake.wait_for_subscribers()
+                await produce(fake, stream, 1)
+                events = [await anext(stream) for _ in range(3)]
+                return events, stream.stats, fake.subscribers - {sid}
+
+    events, stats, subscribers = asyncio.run(main())
+    assert [event.block.blockNumber for event in events] == [101, 102, 103]
+    assert [event.backfilled for event in events] == [False, True, False]
+    assert stats.reconnects == 1
+    assert len(subscribers) == 1
@@ -0,0 +1,110 @@
+import pytest
+
+from kami.cache import ResponseCache, endpoint_family, make_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def metagraph(block: int) -> dict:
+    return {"statusCode": 200, "data": {"netuid": 1, "block": block}}
+
+
+def test_keys_and_families():
+    assert make_cache_key("/chain/check-hotkey", {"netuid": 1, "hotkey": "5F"}) == (
+        "chain/check-hotkey?hotkey=5F&netuid=1"
+    )
+    assert make_cache_key("chain/subnet-metagraph/1?block=5", {"a": 1}) == (
+        "chain/subnet-metagraph/1?block=5&a=1"
+    )
+    assert endpoint_family("chain/subnet-metagraph/12") == "chain/subnet-metagraph"
+    assert endpoint_family("chain/check-hotkey?netuid=1") == "chain/check-hotkey"
+
+
+def test_entries_expire_after_their_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"chain/subnet-metagraph": 12.0}, clock=clock)
+    cache.set("chain/subnet-metagraph/1", metagraph(100))
+    clock.now = 11.9
+    assert cache.get("chain/subnet-metagraph/1") == (True, metagraph(100))
+    clock.now = 12.0
+    assert cache.get("chain/subnet-metagraph/1") == (False, None)
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_uncached_families_are_never_stored():
+    cache = ResponseCache(ttls={"chain/subnet-metagraph": 0.0})
+    cache.set("chain/subnet-metagraph/1", metagraph(100))
+    cache.set("chain/latest-block", {"data": {"blockNumber": 100}})
+    assert len(cache) == 0
+    assert cache.get("chain/latest-block") == (False, None)
+    # Uncacheable lookups don't count as misses either.
+    assert cache.misses == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2)
+    cache.set("chain/subnet-metagraph/1", metagraph(100))
+    cache.set("chain/subnet-metagraph/2", metagraph(100))
+    assert cache.get("chain/subnet-metagraph/1")[0]
+    cache.set("chain/subnet-metagraph/3", metagraph(100))
+    assert not cache.get("chain/subnet-metagraph/2")[0]
+    assert cache.get("chain/subnet-metagraph/1")[0]
+    assert cache.get("chain/subnet-metagraph/3")[0]
+    assert cache.stats["chain/subnet-metagraph"].evictions == 1
+
+
+@pytest.mark.parametrize("block_invalidation", [True, False])
+def test_newer_blocks_invalidate_block_tagged_entries(block_invalidation):
+    cache = ResponseCache(block_invalidation=block_invalidation)
+    cache.set("chain/subnet-metagraph/1", metagraph(100))
+    cache.set("chain/subnet-hyperparameters/1", {"data": {"tempo": 360}})
+    cache.observe_block(100)
+    assert cache.get("chain/subnet-metagraph/1")[0]
+    cache.observe_block(101)
+    # Older blocks never move the latest block back.
+    cache.observe_block(99)
+    assert cache.latest_block == 101
+    assert cache.get("chain/subnet-metagraph/1")[0] is not block_invalidation
+    # Responses without a block only expire by TTL.
+    assert cache.get("chain/subnet-hyperparameters/1")[0]
+
+
+def test_block_pinned_entries_survive_new_blocks():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    key = make_cache_key("chain/subnet-metagraph/1", {"block": 90})
+    cache.set(key, metagraph(90))
+    cache.observe_block(100)
+    assert cache.get(key) == (True, metagraph(90))
+    clock.now = 12.0
+    assert cache.get(key) == (False, None)
+
+
+def test_invalidate_by_endpoint_and_family():
+    cache = ResponseCache()
+    cache.set("chain/subnet-metagraph/1", metagraph(100))
+    cache.set("chain/subnet-metagraph/2", metagraph(100))
+    cache.set("chain/subnet-hyperparameters/1", {"data": {"tempo": 360}})
+    cache.set("chain/check-hotkey?hotkey=5F&netuid=1", {"data": True})
+
+    cache.invalidate("/chain/subnet-metagraph/1")
+    assert not cache.get("chain/subnet-metagraph/1")[0]
+    assert cache.get("chain/subnet-metagraph/2")[0]
+    cache.invalidate("chain/check-hotkey")
+    assert not cache.get("chain/check-hotkey?hotkey=5F&netuid=1")[0]
+    cache.invalidate("chain/subnet-metagraph")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        ResponseCache(maxsize=0)
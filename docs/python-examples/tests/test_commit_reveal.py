@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from kami.commit_reveal import commit_epoch, encrypt_commit
+from kami.kami import Kami
+from kami.testing import FakeKami
+from kami.types import SetWeightsPayload, SubnetHyperparameters
+
+HYPERPARAMETERS = {
+    name: 1
+    for name in (
+        "rho kappa immunityPeriod minAllowedWeights maxWeightsLimit minDifficulty "
+        "maxDifficulty difficulty weightsVersion weightsRateLimit adjustmentInterval "
+        "activityCutoff targetRegsPerInterval minBurn maxBurn bondsMovingAvg "
+        "maxRegsPerBlock servingRateLimit maxValidators adjustmentAlpha alphaHigh "
+        "alphaLow"
+    ).split()
+}
+
+
+def make_hyperparameters(**overrides) -> SubnetHyperparameters:
+    fields = dict(
+        HYPERPARAMETERS,
+        tempo=360,
+        commitRevealPeriod=1,
+        commitRevealWeightsEnabled=True,
+        registrationAllowed=True,
+        liquidAlphaEnabled=False,
+    )
+    fields.update(overrides)
+    return SubnetHyperparameters(**fields)
+
+
+PAYLOAD = SetWeightsPayload(netuid=1, dests=[0, 1], weights=[100, 65535], version_key=1)
+
+
+def test_commit_epoch():
+    assert commit_epoch(359, netuid=1, tempo=360) == 1
+    assert commit_epoch(358, netuid=1, tempo=360) == 0
+    assert commit_epoch(720, netuid=1, tempo=360) == 2
+
+
+def test_prepared_commit_is_valid_within_epoch():
+    hyperparameters = make_hyperparameters()
+    prepared = encrypt_commit(PAYLOAD, hyperparameters, block=400)
+    assert prepared.epoch == 1
+    assert prepared.is_valid_for(PAYLOAD, hyperparameters, block=600)
+    assert not prepared.is_valid_for(PAYLOAD, hyperparameters, block=800)
+    other = PAYLOAD.model_copy(update={"weights": [65535, 100]})
+    assert not prepared.is_valid_for(other, hyperparameters, block=400)
+    assert not prepared.is_valid_for(
+        PAYLOAD, make_hyperparameters(commitRevealPeriod=2), block=400
+    )
+
+
+def test_encrypt_commit_rejects_zero_tempo():
+    with pytest.raises(ValueError):
+        encrypt_commit(PAYLOAD, make_hyperparameters(tempo=0), block=400)
+
+
+@pytest.mark.parametrize("commit_reveal", [False, True])
+def test_set_weights_fetches_the_block_alongside_the_hyperparameters(commit_reveal):
+    async def main():
+        hyperparameters = {"commitRevealWeightsEnabled": commit_reveal}
+        async with FakeKami(hyperparameters=hyperparameters, latency=0.1) as fake:
+            async with Kami(url=fake.url) as kami:
+                set_weights = asyncio.create_task(kami.set_weights(PAYLOAD))
+                await asyncio.sleep(0.05)
+                # Both requests are in flight before either one is answered.
+                assert fake.requests["chain/subnet-hyperparameters/1"] == 1
+                assert fake.requests["chain/latest-block"] == 1
+                await set_weights
+        return fake
+
+    fake = asyncio.run(main())
+    assert fake.extrinsics[0][0] == (
+        "chain/set-commit-reveal-weights" if commit_reveal else "chain/set-weights"
+    )
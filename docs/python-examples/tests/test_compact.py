@@ -0,0 +1,53 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from kami.columnar import ColumnarMetagraph
+from kami.kami import Kami
+from kami.testing import FakeKami, _pack
+
+msgpack = pytest.importorskip("msgpack")
+
+from kami.decoding import loads_msgpack  # noqa: E402
+
+
+def test_numeric_arrays_decode_into_typed_arrays():
+    raw = _pack({"ints": [1, 2, -3], "floats": [0.5, 2.0], "mixed": [1, "a"], "e": []})
+    decoded = loads_msgpack(raw)
+    assert decoded["ints"].dtype == np.int64 and decoded["ints"].tolist() == [1, 2, -3]
+    assert decoded["floats"].dtype == np.float64
+    assert decoded["mixed"] == [1, "a"] and decoded["e"] == []
+    assert not decoded["floats"].flags.writeable
+
+
+def test_compact_client_matches_json_client():
+    async def main():
+        async with FakeKami(num_uids=32, block=100) as fake:
+            async with Kami(url=fake.url) as compact, Kami(
+                url=fake.url, compact=False
+            ) as plain:
+                generic = await compact.get("chain/subnet-metagraph/1")
+                response = await compact.get("chain/subnet-metagraph/1", compact=True)
+                hyperparameters = await compact.get(
+                    "chain/subnet-hyperparameters/1", compact=True
+                )
+                columnar = await compact.get_metagraph(1, columnar=True)
+                metagraph = await compact.get_metagraph(1)
+                expected = await plain.get_metagraph(1)
+                # Each format has its own ETag, both revalidate.
+                await plain.get_metagraph(1)
+        # Only requests that opt in get MessagePack, and only where Kami offers it.
+        assert isinstance(generic["data"]["totalStake"], list)
+        assert isinstance(response["data"]["totalStake"], np.ndarray)
+        assert isinstance(hyperparameters["data"]["tempo"], int)
+        assert isinstance(columnar, ColumnarMetagraph)
+        # Columns are copies the caller may modify.
+        columnar.totalStake[0] = -1.0
+        np.testing.assert_array_equal(
+            response["data"]["totalStake"], expected.totalStake
+        )
+        assert metagraph == expected
+        assert fake.not_modified["chain/subnet-metagraph/1"] == 3
+
+    asyncio.run(main())
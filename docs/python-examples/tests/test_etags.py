@@ -0,0 +1,73 @@
+import asyncio
+
+from kami.cache import ETagCache
+from kami.kami import Kami
+from kami.metrics import Metrics
+from kami.testing import FakeKami
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_etag_cache_honors_cache_control():
+    clock = FakeClock()
+    etags = ETagCache(maxsize=2, clock=clock)
+    etags.set("chain/subnet-metagraph/1", '"a"', {"data": 1}, "no-cache")
+    etags.set("chain/subnet-metagraph/2", '"b"', {"data": 2}, "public, max-age=10")
+    etags.set("chain/subnet-metagraph/3", '"c"', {"data": 3}, "no-store")
+
+    assert etags.fresh("chain/subnet-metagraph/1") == (False, None)
+    assert etags.fresh("chain/subnet-metagraph/2") == (True, {"data": 2})
+    assert etags.get("chain/subnet-metagraph/3") is None
+    clock.now = 10.0
+    assert etags.fresh("chain/subnet-metagraph/2") == (False, None)
+
+    validator = etags.get("chain/subnet-metagraph/1")
+    assert validator is not None and validator.etag == '"a"'
+    assert etags.refresh("chain/subnet-metagraph/1", validator) == {"data": 1}
+    assert etags.revalidated == 2
+
+    # The least recently used entry is evicted.
+    etags.set("chain/subnet-hyperparameters/1", '"d"', {"data": 4})
+    assert etags.get("chain/subnet-metagraph/2") is None
+    etags.invalidate("chain/subnet-metagraph")
+    assert len(etags) == 1
+
+
+def test_unchanged_metagraph_comes_back_as_304():
+    async def main():
+        async with FakeKami(num_uids=16, block=100) as fake:
+            async with Kami(url=fake.url, metrics=Metrics()) as kami:
+                first = await kami.get_metagraph(1)
+                second = await kami.get_metagraph(1)
+                hyperparameters = await kami.get_subnet_hyperparameters(1)
+                again = await kami.get_subnet_hyperparameters(1)
+                await fake.produce_block()
+                third = await kami.get_metagraph(1)
+                counters = dict(kami.metrics.counters)
+        assert first.block == second.block == 100 and third.block == 101
+        assert second.hotkeys == first.hotkeys
+        assert again == hyperparameters
+        assert fake.requests["chain/subnet-metagraph/1"] == 3
+        assert fake.not_modified["chain/subnet-metagraph/1"] == 1
+        assert fake.not_modified["chain/subnet-hyperparameters/1"] == 1
+        assert counters[("not_modified", "chain/subnet-metagraph")] == 1
+
+    asyncio.run(main())
+
+
+def test_revalidation_can_be_disabled():
+    async def main():
+        async with FakeKami(num_uids=16, block=100) as fake:
+            async with Kami(url=fake.url, revalidate=False) as kami:
+                await kami.get_metagraph(1)
+                await kami.get_metagraph(1)
+        assert fake.requests["chain/subnet-metagraph/1"] == 2
+        assert not fake.not_modified
+
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+import asyncio
+import random
+
+import pytest
+
+from benchmarks.payloads import make_metagraph_payload
+from kami.cache import ResponseCache, make_cache_key
+from kami.columnar import ColumnarMetagraph
+from kami.kami import Kami
+from kami.store import SnapshotStore
+from kami.types import SubnetMetagraph
+
+URL = "http://127.0.0.1:8882"
+
+
+class FakeChain:
+    """
+    Serves `chain/subnet-metagraph/{netuid}?block=N` with random latency and records
+    the requests and the peak concurrency.
+    """
+
+    def __init__(self):
+        self.requests: list[int] = []
+        self.running = 0
+        self.peak = 0
+        self.rng = random.Random(0)
+
+    async def get(self, endpoint, params=None, compact=False):
+        block = params["block"]
+        self.requests.append(block)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.rng.random() * 0.01)
+        finally:
+            self.running -= 1
+        return {
+            "success": True,
+            "data": make_metagraph_payload(8, netuid=1, block=block, seed=block),
+        }
+
+
+def make_kami(chain: FakeChain, store: SnapshotStore | None = None) -> Kami:
+    kami = Kami(url=URL, store=store)
+    kami.get = chain.get
+    return kami
+
+
+def test_iter_metagraphs_yields_in_order_with_bounded_concurrency():
+    async def run():
+        chain = FakeChain()
+        kami = make_kami(chain)
+        blocks = [
+            metagraph.block
+            async for metagraph in kami.iter_metagraphs(1, 100, 190, 10, concurrency=3)
+        ]
+        assert blocks == list(range(100, 191, 10))
+        assert sorted(chain.requests) == blocks
+        assert chain.peak <= 3
+
+    asyncio.run(run())
+
+
+def test_iter_metagraphs_reuses_stored_blocks(tmp_path):
+    async def run():
+        chain = FakeChain()
+        kami = make_kami(chain, SnapshotStore(tmp_path))
+        first = [m async for m in kami.iter_metagraphs(1, 100, 104, columnar=False)]
+        assert all(isinstance(m, SubnetMetagraph) for m in first)
+        chain.requests.clear()
+
+        second = [m async for m in kami.iter_metagraphs(1, 100, 106)]
+        assert sorted(chain.requests) == [105, 106]
+        assert all(isinstance(m, ColumnarMetagraph) for m in second)
+        # Stored blocks convert back to the same pydantic metagraph.
+        stored = await kami.get_metagraph(1, block=102)
+        assert stored == first[2]
+
+    asyncio.run(run())
+
+
+def test_iter_metagraphs_raises_on_failed_block():
+    async def run():
+        chain = FakeChain()
+        get = chain.get
+
+        async def failing(endpoint, params=None, compact=False):
+            if params["block"] == 103:
+                raise RuntimeError("boom")
+            return await get(endpoint, params)
+
+        kami = make_kami(chain)
+        kami.get = failing
+        seen = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for metagraph in kami.iter_metagraphs(1, 100, 109, concurrency=2):
+                seen.append(metagraph.block)
+        assert seen == [100, 101, 102]
+
+    asyncio.run(run())
+
+
+def test_iter_metagraphs_rejects_bad_step():
+    with pytest.raises(ValueError):
+        Kami(url=URL).iter_metagraphs(1, 0, 10, step=0)
+
+
+def test_cache_keeps_block_pinned_responses_on_new_blocks():
+    cache = ResponseCache()
+    response = {"success": True, "data": {"block": 100}}
+    pinned = make_cache_key("chain/subnet-metagraph/1", {"block": 100})
+    latest = make_cache_key("chain/subnet-metagraph/1")
+    cache.set(pinned, response)
+    cache.set(latest, response)
+    cache.observe_block(101)
+
+    assert cache.get(pinned) == (True, response)
+    assert cache.get(latest) == (False, None)
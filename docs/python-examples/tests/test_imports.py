@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+from typing import Dict
+
+from kami.networking import ip_to_int
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+# Cumulative time a cold `import kami` may take, in seconds. Generous, so only a
+# heavy import such as bittensor (several seconds) trips it.
+IMPORT_BUDGET = 1.5
+# Imported lazily, only by the calls that need them.
+DEFERRED = ("bittensor", "bittensor_commit_reveal", "socketio", "torch")
+
+
+def import_times() -> Dict[str, int]:
+    """
+    Cumulative import time in microseconds of every module a fresh interpreter
+    loads for `import kami`, from `python -X importtime`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import kami"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_defers_heavy_dependencies():
+    times = import_times()
+    loaded = {module.split(".")[0] for module in times}
+    assert "kami" in loaded
+    assert not loaded & set(DEFERRED)
+
+
+def test_import_is_within_budget():
+    # The fastest of a few runs, so a busy machine doesn't fail the test.
+    fastest = min(import_times()["kami"] for _ in range(3))
+    assert fastest / 1e6 < IMPORT_BUDGET
+
+
+def test_ip_to_int():
+    assert ip_to_int("0.0.0.0") == 0
+    assert ip_to_int("1.2.3.4") == 16909060
+    assert ip_to_int("255.255.255.255") == 2**32 - 1
+    assert ip_to_int("::1") == 1
+    assert ip_to_int("2001:db8::1") == 0x20010DB8000000000000000000000001
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from benchmarks.payloads import make_metagraph_payload
+from kami.cache import ResponseCache
+from kami.columnar import ColumnarMetagraph
+from kami.index import MetagraphIndex
+from kami.kami import Kami
+from kami.testing import FakeKami
+from kami.types import SubnetMetagraph
+
+
+@pytest.fixture(params=["pydantic", "columnar"])
+def metagraph(request):
+    payload = make_metagraph_payload(64, netuid=3)
+    # Give two UIDs the same coldkey.
+    payload["coldkeys"][5] = payload["coldkeys"][2]
+    if request.param == "columnar":
+        return ColumnarMetagraph.from_response(payload)
+    return SubnetMetagraph.model_validate(payload)
+
+
+def test_hotkey_lookup(metagraph):
+    index = MetagraphIndex(metagraph)
+    assert len(index) == 64
+    for uid, hotkey in enumerate(metagraph.hotkeys):
+        assert index.uid(hotkey) == uid
+        assert hotkey in index
+    assert index.uid("unregistered") is None
+    assert "unregistered" not in index
+
+
+def test_coldkey_lookup(metagraph):
+    index = MetagraphIndex(metagraph)
+    assert index.uids(metagraph.coldkeys[2]) == (2, 5)
+    assert index.uids("unknown") == ()
+
+
+def test_axon_lookup(metagraph):
+    index = MetagraphIndex(metagraph)
+    reference = SubnetMetagraph.model_validate(make_metagraph_payload(64, netuid=3))
+    assert index.axon(7) == reference.axons[7]
+    assert index.axon_of(metagraph.hotkeys[7]) == reference.axons[7]
+    assert index.axon_of("unregistered") is None
+    with pytest.raises(IndexError):
+        index.axon(64)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_kami_lookups_share_the_metagraph_with_get_metagraph(compact):
+    async def main():
+        async with FakeKami(num_uids=16, block=100) as fake:
+            cache = ResponseCache()
+            async with Kami(url=fake.url, cache=cache, compact=compact) as kami:
+                metagraph = await kami.get_metagraph(1)
+                index = await kami.get_metagraph_index(1)
+                registered = await kami.is_hotkey_registered(1, metagraph.hotkeys[3])
+                missing = await kami.is_hotkey_registered(1, "5Unknown")
+                assert await kami.get_metagraph_index(1) is index
+        return fake, index, registered, missing
+
+    fake, index, registered, missing = asyncio.run(main())
+    assert fake.requests["chain/subnet-metagraph/1"] == 1
+    assert fake.requests["chain/check-hotkey"] == 0
+    assert index.block == 100 and registered and not missing
+
+
+def test_kami_without_a_cache_checks_one_hotkey():
+    async def main():
+        async with FakeKami(num_uids=16, block=100) as fake:
+            async with Kami(url=fake.url) as kami:
+                hotkey = (await kami.get_metagraph(1)).hotkeys[3]
+                registered = await kami.is_hotkey_registered(1, hotkey)
+        return fake, registered
+
+    fake, registered = asyncio.run(main())
+    assert registered
+    assert fake.requests["chain/subnet-metagraph/1"] == 1
+    assert fake.requests["chain/check-hotkey"] == 1
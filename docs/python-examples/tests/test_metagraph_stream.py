@@ -0,0 +1,99 @@
+import asyncio
+
+import numpy as np
+
+from kami.columnar import ColumnarMetagraph
+from kami.kami import Kami
+from kami.metagraph_stream import (
+    MetagraphStream,
+    apply_metagraph_delta,
+    diff_metagraph,
+)
+from kami.testing import FakeKami, make_metagraph_payload
+
+
+def test_diff_and_apply_round_trip():
+    previous = make_metagraph_payload(16, block=100)
+    current = make_metagraph_payload(16, block=101)
+    current["tempo"] = 99
+    current["totalStake"][3] = 42.0
+    current["axons"][5] = dict(current["axons"][5], port=9000)
+
+    delta = diff_metagraph(previous, current)
+    assert delta["baseBlock"] == 100 and delta["block"] == 101
+    assert delta["fields"]["tempo"] == 99
+    assert "hotkeys" not in delta["arrays"]
+    assert [3, 42.0] in delta["arrays"]["totalStake"]["changes"]
+    assert apply_metagraph_delta(previous, delta) == current
+    # The base payload is left untouched.
+    assert previous == make_metagraph_payload(16, block=100)
+
+
+def test_apply_grows_and_shrinks_uids():
+    small = make_metagraph_payload(8, block=100)
+    large = make_metagraph_payload(12, block=101)
+    assert apply_metagraph_delta(small, diff_metagraph(small, large)) == large
+    assert apply_metagraph_delta(large, diff_metagraph(large, small)) == small
+
+
+def test_stream_applies_pushed_deltas():
+    async def main():
+        async with FakeKami(netuids=[1, 2], num_uids=32, block=100) as fake:
+            async with Kami(url=fake.url) as kami:
+                async with kami.subscribe_metagraph([1, 2], columnar=True) as stream:
+                    snapshots = [await anext(stream) for _ in range(2)]
+                    await fake.produce_block()
+                    await fake.produce_block(skip=1)
+                    deltas = [await anext(stream) for _ in range(4)]
+                    latest = stream.latest(2)
+        assert all(update.is_snapshot for update in snapshots)
+        assert {update.netuid for update in snapshots} == {1, 2}
+        assert [update.block for update in deltas] == [101, 101, 103, 103]
+        assert not any(update.is_snapshot for update in deltas)
+        # Only changed UIDs were sent.
+        changes = deltas[0].delta["arrays"]["lastUpdate"]["changes"]
+        assert 0 < len(changes) <= 32
+        expected = ColumnarMetagraph.from_response(
+            make_metagraph_payload(32, netuid=2, block=103, seed=2)
+        )
+        assert isinstance(latest, ColumnarMetagraph)
+        np.testing.assert_array_equal(latest.totalStake, expected.totalStake)
+        np.testing.assert_array_equal(latest.lastUpdate, expected.lastUpdate)
+        assert latest.hotkeys == expected.hotkeys
+        assert stream.stats.snapshots == 2 and stream.stats.deltas == 4
+
+    asyncio.run(main())
+
+
+def test_stream_resyncs_on_a_delta_it_cannot_apply():
+    async def main():
+        async with FakeKami(num_uids=8, block=100) as fake:
+            stream = MetagraphStream(fake.url, [1])
+            async with stream:
+                await anext(stream)
+                # Pretend a delta was missed.
+                stream.payloads[1] = dict(stream.payloads[1], block=99)
+                await fake.produce_block()
+                update = await anext(stream)
+        assert update.is_snapshot and update.block == 101
+        assert stream.stats.resyncs == 1
+        assert stream.latest(1).block == 101
+
+    asyncio.run(main())
+
+
+def test_slow_consumer_drops_updates_but_keeps_state():
+    async def main():
+        async with FakeKami(num_uids=8, block=100) as fake:
+            async with MetagraphStream(fake.url, [1], maxsize=1) as stream:
+                while not stream.payloads:
+                    await asyncio.sleep(0.005)
+                for _ in range(5):
+                    await fake.produce_block()
+                while stream.stats.deltas < 5:
+                    await asyncio.sleep(0.005)
+                update = await anext(stream)
+        assert update.block == 105 and stream.stats.dropped == 5
+        assert stream.latest(1).block == 105
+
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+from kami.cache import ResponseCache
+from kami.metrics import Histogram, Metrics, RequestTrace, endpoint_label
+from kami.singleflight import SingleFlight
+
+
+def test_endpoint_label():
+    assert endpoint_label("chain/subnet-metagraph/12") == "chain/subnet-metagraph"
+    assert endpoint_label("chain/check-hotkey?netuid=1&hotkey=x") == "chain/check-hotkey"
+    assert endpoint_label("substrate/account-nonce/5E4z3h9y") == "substrate/account-nonce"
+
+
+def test_histogram_buckets():
+    histogram = Histogram([1.0, 2.0])
+    for value in (0.5, 1.0, 1.5, 3.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(1.0, 2), (2.0, 3), (float("inf"), 4)]
+    assert histogram.sum == 6.0
+    assert histogram.count == 4
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(0.75) == 2.0
+    assert Histogram([1.0]).quantile(0.5) is None
+
+
+def test_record_request_and_callback():
+    seen = []
+    metrics = Metrics(
+        latency_buckets=[0.01, 0.1], callback=lambda *args: seen.append(args)
+    )
+    trace = RequestTrace()
+    trace.connect = 0.02
+    metrics.record_request(
+        "chain/subnet-metagraph/1",
+        trace,
+        started=0.0,
+        received=0.05,
+        decoded=0.06,
+        size=10,
+    )
+    phases = {phase: histogram for (_, phase), histogram in metrics.latency.items()}
+    assert abs(phases["transfer"].sum - 0.03) < 1e-9
+    assert abs(phases["decode"].sum - 0.01) < 1e-9
+    assert phases["connect"].count == 1
+    assert metrics.counters[("requests", "chain/subnet-metagraph")] == 1
+    assert [name for _, name, _ in seen] == [
+        "connect",
+        "transfer",
+        "decode",
+        "response_bytes",
+    ]
+
+
+def test_to_prometheus():
+    metrics = Metrics(latency_buckets=[0.01])
+    metrics.observe("chain/subnet-metagraph/1", "decode", 0.005)
+    metrics.increment("errors", "chain/latest-block")
+    cache = ResponseCache()
+    cache.get("chain/subnet-metagraph/1")
+    text = metrics.to_prometheus(cache=cache, inflight=SingleFlight())
+    lines = text.splitlines()
+    assert "# TYPE kami_client_phase_seconds histogram" in lines
+    assert (
+        'kami_client_phase_seconds_bucket{endpoint="chain/subnet-metagraph",'
+        'phase="decode",le="0.01"} 1'
+    ) in lines
+    assert (
+        'kami_client_phase_seconds_bucket{endpoint="chain/subnet-metagraph",'
+        'phase="decode",le="+Inf"} 1'
+    ) in lines
+    assert 'kami_client_errors_total{endpoint="chain/latest-block"} 1' in lines
+    assert 'kami_client_cache_misses_total{endpoint="chain/subnet-metagraph"} 1' in lines
+    assert "kami_client_coalesce_inflight 0" in lines
+    assert Metrics().to_prometheus() == ""
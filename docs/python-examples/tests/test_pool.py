@@ -0,0 +1,171 @@
+import asyncio
+from typing import Dict, List
+
+from aiohttp import web
+
+from kami.pool import KamiPool
+from kami.retry import RetryPolicy
+from kami.store import SnapshotStore
+from kami.testing import FakeKami
+
+NO_RETRY = RetryPolicy(max_retries=0, failure_threshold=0)
+
+
+def envelope(data) -> web.Response:
+    return web.json_response(
+        {"statusCode": 200, "success": True, "data": data, "error": None}
+    )
+
+
+class Stub:
+    """A Kami stub on a free local port that answers health, block and write calls."""
+
+    def __init__(self, name: str, block: int):
+        self.name = name
+        self.block = block
+        self.healthy = True
+        self.requests: List[str] = []
+        self.runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def health(self, request: web.Request) -> web.Response:
+        if not self.healthy:
+            return web.json_response(
+                {"statusCode": 503, "success": False, "data": None, "error": "down"},
+                status=503,
+            )
+        return envelope(
+            {
+                "latestBlock": self.block,
+                "runtimeSpecVersionDuringKamiInitialization": 273,
+                "runtimeSpecVersionDuringHealthCheck": 273,
+            }
+        )
+
+    async def latest_block(self, request: web.Request) -> web.Response:
+        self.requests.append("latest-block")
+        await asyncio.sleep(0.01)
+        return envelope({"blockNumber": self.block, "served_by": self.name})
+
+    async def set_weights(self, request: web.Request) -> web.Response:
+        self.requests.append("set-weights")
+        return envelope(self.name)
+
+    def routes(self, app: web.Application):
+        app.router.add_get("/substrate/health", self.health)
+        app.router.add_get("/chain/latest-block", self.latest_block)
+        app.router.add_post("/chain/set-weights", self.set_weights)
+
+    async def start(self):
+        app = web.Application()
+        self.routes(app)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+
+
+async def start_stubs(*blocks: int) -> List[Stub]:
+    stubs = [Stub(f"stub-{i}", block) for i, block in enumerate(blocks)]
+    await asyncio.gather(*(stub.start() for stub in stubs))
+    return stubs
+
+
+def served_by(responses: List[Dict]) -> List[str]:
+    return [response["data"]["served_by"] for response in responses]
+
+
+def test_reads_are_spread_over_fresh_replicas():
+    async def run():
+        stubs = await start_stubs(100, 100, 90)
+        async with KamiPool([stub.url for stub in stubs], retry=NO_RETRY) as pool:
+            responses = await asyncio.gather(
+                *(pool._request("GET", "chain/latest-block") for _ in range(20))
+            )
+        await asyncio.gather(*(stub.stop() for stub in stubs))
+        return served_by(responses)
+
+    names = asyncio.run(run())
+    assert set(names) == {"stub-0", "stub-1"}
+
+
+def test_most_recent_strategy_prefers_highest_block():
+    async def run():
+        stubs = await start_stubs(100, 101, 99)
+        async with KamiPool(
+            [stub.url for stub in stubs], read_strategy="most-recent", retry=NO_RETRY
+        ) as pool:
+            response = await pool.get("chain/latest-block")
+        await asyncio.gather(*(stub.stop() for stub in stubs))
+        return response
+
+    assert asyncio.run(run())["data"]["served_by"] == "stub-1"
+
+
+def test_reads_fail_over_to_a_live_replica():
+    async def run():
+        stubs = await start_stubs(101, 100)
+        async with KamiPool(
+            [stub.url for stub in stubs], read_strategy="most-recent", retry=NO_RETRY
+        ) as pool:
+            await stubs[0].stop()
+            responses = [
+                await pool._request("GET", "chain/latest-block") for _ in range(3)
+            ]
+            healthy = [replica.healthy for replica in pool.replicas]
+        await stubs[1].stop()
+        return served_by(responses), healthy
+
+    names, healthy = asyncio.run(run())
+    assert names == ["stub-1"] * 3
+    assert healthy == [False, True]
+
+
+def test_writes_are_pinned_to_primary_and_fail_over():
+    async def run():
+        stubs = await start_stubs(100, 100, 100)
+        urls = [stub.url for stub in stubs]
+        async with KamiPool(urls, retry=NO_RETRY, health_interval=3600) as pool:
+            first = [(await pool.post("chain/set-weights"))["data"] for _ in range(3)]
+            stubs[0].healthy = False
+            await pool.check_health()
+            after_unhealthy = (await pool.post("chain/set-weights"))["data"]
+            await stubs[1].stop()
+            try:
+                after_down = (await pool.post("chain/set-weights"))["data"]
+            except RuntimeError:
+                # A write on a dropped keep-alive connection may have reached the
+                # primary, so it is not moved; the next write goes to the new one.
+                after_down = (await pool.post("chain/set-weights"))["data"]
+        await asyncio.gather(stubs[0].stop(), stubs[2].stop())
+        return first, after_unhealthy, after_down
+
+    first, after_unhealthy, after_down = asyncio.run(run())
+    assert first == ["stub-0"] * 3
+    assert after_unhealthy == "stub-1"
+    assert after_down == "stub-2"
+
+
+def test_pool_persists_metagraphs_to_its_store(tmp_path):
+    async def run():
+        store = SnapshotStore(tmp_path)
+        async with FakeKami(block=100) as first, FakeKami(block=100) as second:
+            async with KamiPool(
+                [first.url, second.url], retry=NO_RETRY, store=store
+            ) as pool:
+                await pool.get_metagraph(1, columnar=True)
+                assert pool.store is store
+                # Served from the store, without asking a replica.
+                await pool.get_metagraph(1, block=100)
+            requests = first.requests + second.requests
+        return store, requests
+
+    store, requests = asyncio.run(run())
+    assert store.blocks(1) == [100]
+    assert requests["chain/subnet-metagraph/1"] == 1
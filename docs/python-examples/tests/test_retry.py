@@ -0,0 +1,86 @@
+import pytest
+
+from kami.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    deadline,
+    remaining_time,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_delay_is_capped_exponential_with_full_jitter():
+    policy = RetryPolicy(initial_retry_delay=0.1, backoff_factor=2, max_retry_delay=1)
+    assert policy.delay(0, rng=lambda: 1.0) == pytest.approx(0.1)
+    assert policy.delay(2, rng=lambda: 1.0) == pytest.approx(0.4)
+    assert policy.delay(10, rng=lambda: 1.0) == pytest.approx(1.0)
+    assert policy.delay(3, rng=lambda: 0.5) == pytest.approx(0.4)
+    assert policy.delay(3, rng=lambda: 0.0) == 0.0
+
+
+def test_circuit_opens_after_consecutive_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5, clock=clock)
+    breaker.record_failure("chain/subnet-metagraph/1")
+    breaker.record_success("chain/subnet-metagraph/2")
+    breaker.record_failure("chain/subnet-metagraph/3")
+    assert breaker.state("chain/subnet-metagraph/1") == "closed"
+    breaker.record_failure("chain/subnet-metagraph/1")
+    assert breaker.state("chain/subnet-metagraph/4") == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("chain/subnet-metagraph/1")
+    # Other endpoints are unaffected.
+    breaker.before_request("chain/latest-block")
+
+
+def test_half_open_lets_one_probe_through():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+    breaker.record_failure("chain/latest-block")
+    clock.now = 5
+    assert breaker.state("chain/latest-block") == "half-open"
+    breaker.before_request("chain/latest-block")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("chain/latest-block")
+
+    # A failed probe opens the circuit again.
+    breaker.record_failure("chain/latest-block")
+    assert breaker.state("chain/latest-block") == "open"
+
+    clock.now = 10
+    breaker.before_request("chain/latest-block")
+    breaker.record_success("chain/latest-block")
+    assert breaker.state("chain/latest-block") == "closed"
+    breaker.before_request("chain/latest-block")
+
+
+def test_lost_probe_is_replaced():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+    breaker.record_failure("chain/latest-block")
+    clock.now = 5
+    breaker.before_request("chain/latest-block")
+    clock.now = 10
+    breaker.before_request("chain/latest-block")
+
+
+def test_nested_deadlines_only_shorten():
+    assert remaining_time() is None
+    with deadline(10):
+        outer = remaining_time()
+        assert outer is not None and 9 < outer <= 10
+        with deadline(100):
+            inner = remaining_time()
+            assert inner is not None and inner <= outer
+        with deadline(1):
+            inner = remaining_time()
+            assert inner is not None and inner <= 1
+    assert remaining_time() is None
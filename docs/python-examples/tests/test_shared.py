@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from benchmarks.payloads import make_metagraph_payload
+from kami.columnar import ColumnarMetagraph
+from kami.shared import SharedMetagraphPublisher, SharedMetagraphReader
+
+
+def make_metagraph(block: int, num_uids: int = 64) -> ColumnarMetagraph:
+    return ColumnarMetagraph.from_response(
+        make_metagraph_payload(num_uids, netuid=1, block=block, seed=block)
+    )
+
+
+@pytest.fixture
+def name():
+    return f"kami-test-{os.getpid()}"
+
+
+def _total_stake(name: str) -> tuple[int, float]:
+    with SharedMetagraphReader(name) as reader:
+        metagraph = reader.get()
+        assert metagraph is not None
+        result = (metagraph.block, float(metagraph.totalStake.sum()))
+        del metagraph
+    return result
+
+
+def test_reader_sees_published_metagraph(name):
+    with SharedMetagraphPublisher(name) as publisher:
+        reader = SharedMetagraphReader(name)
+        assert reader.get() is None
+
+        expected = make_metagraph(100)
+        assert publisher.publish(expected) == 1
+        metagraph = reader.get()
+
+        assert reader.get() is metagraph
+        assert metagraph.block == 100
+        assert metagraph.hotkeys == expected.hotkeys
+        assert metagraph.identities == expected.identities
+        assert metagraph.get_axon(7) == expected.get_axon(7)
+        for column in ("totalStake", "lastUpdate", "active"):
+            np.testing.assert_array_equal(
+                getattr(metagraph, column), getattr(expected, column)
+            )
+        with pytest.raises(ValueError):
+            metagraph.totalStake[0] = 1.0
+        del metagraph
+        reader.close()
+
+
+def test_reader_follows_generations_and_releases_old_ones(name):
+    with SharedMetagraphPublisher(name) as publisher:
+        reader = SharedMetagraphReader(name)
+        publisher.publish(make_metagraph(100))
+        old = reader.get()
+        publisher.publish(make_metagraph(101, num_uids=128))
+
+        new = reader.get()
+        assert new.block == 101 and len(new.hotkeys) == 128
+        # Views of the superseded generation stay valid while referenced.
+        assert old.block == 100 and old.totalStake.shape == (64,)
+        assert len(reader._stale) == 1
+        del old
+        publisher.publish(make_metagraph(102))
+        assert reader.get().block == 102
+        assert len(reader._stale) == 1
+        del new
+        reader.close()
+
+
+def test_worker_processes_read_without_unlinking(name):
+    with SharedMetagraphPublisher(name) as publisher:
+        expected = make_metagraph(100)
+        publisher.publish(expected)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2) as pool:
+            results = pool.map(_total_stake, [name] * 4)
+        assert results == [(100, float(expected.totalStake.sum()))] * 4
+        # Workers exiting must not have removed the segments.
+        assert _total_stake(name)[0] == 100
+
+
+def test_restarted_publisher_continues_generations(name):
+    publisher = SharedMetagraphPublisher(name)
+    publisher.publish(make_metagraph(100))
+    publisher.close(unlink=False)
+
+    with SharedMetagraphPublisher(name) as restarted:
+        assert restarted.generation == 1
+        assert restarted.publish(make_metagraph(101)) == 2
+        assert _total_stake(name)[0] == 101
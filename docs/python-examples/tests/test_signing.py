@@ -0,0 +1,65 @@
+import hashlib
+import os
+
+import pytest
+
+from kami.signing import message_bytes, ss58_decode, verify_signature
+
+sr25519 = pytest.importorskip("sr25519")
+
+_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def ss58_encode(public_key: bytes, prefix: int = 42) -> str:
+    raw = bytes([prefix]) + public_key
+    raw += hashlib.blake2b(b"SS58PRE" + raw, digest_size=64).digest()[:2]
+    number = int.from_bytes(raw, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = _ALPHABET[remainder] + encoded
+    return encoded
+
+
+@pytest.fixture(scope="module")
+def keypair():
+    public_key, secret_key = sr25519.pair_from_seed(os.urandom(32))
+    return public_key, secret_key, ss58_encode(public_key)
+
+
+def sign(keypair, message: bytes) -> str:
+    public_key, secret_key, _ = keypair
+    return "0x" + sr25519.sign((public_key, secret_key), message).hex()
+
+
+def test_ss58_decode():
+    prefix, public_key = ss58_decode("5E4z3h9yVhmQyCFWNbY9BPpwhx4xFiPwq3eeqmBgVF6KULde")
+    assert prefix == 42
+    assert len(public_key) == 32
+
+
+def test_ss58_decode_rejects_bad_checksum():
+    address = "5E4z3h9yVhmQyCFWNbY9BPpwhx4xFiPwq3eeqmBgVF6KULdf"
+    with pytest.raises(ValueError):
+        ss58_decode(address)
+
+
+def test_message_bytes():
+    assert message_bytes("hello") == b"hello"
+    assert message_bytes("0x0102") == b"\x01\x02"
+    assert message_bytes("0xzz") == b"0xzz"
+
+
+def test_verify_signature(keypair):
+    address = keypair[2]
+    signature = sign(keypair, b"hello")
+    assert verify_signature("hello", signature, address)
+    assert not verify_signature("hellO", signature, address)
+    assert not verify_signature("hello", "0x1234", address)
+    assert not verify_signature("hello", signature, "not-an-address")
+
+
+def test_verify_signature_accepts_wrapped_bytes(keypair):
+    address = keypair[2]
+    assert verify_signature("hi", sign(keypair, b"<Bytes>hi</Bytes>"), address)
+    assert verify_signature("<Bytes>hi</Bytes>", sign(keypair, b"hi"), address)
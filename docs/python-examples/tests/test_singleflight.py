@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from kami.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return object()
+
+        callers = [asyncio.create_task(flight.do("a", fetch)) for _ in range(3)]
+        other = asyncio.create_task(flight.do("b", fetch))
+        await asyncio.sleep(0)
+        assert len(flight) == 2
+        release.set()
+        results = await asyncio.gather(*callers, other)
+        assert len(flight) == 0
+        # A call after the first one finished starts a new one.
+        results.append(await flight.do("a", fetch))
+        return results, flight
+
+    results, flight = asyncio.run(main())
+    assert results[0] is results[1] is results[2]
+    assert len({id(result) for result in results}) == 3
+    assert (flight.started, flight.shared) == (3, 2)
+
+
+def test_exceptions_reach_every_caller():
+    async def main():
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("a", fail), flight.do("a", fail), return_exceptions=True
+        )
+        assert len(flight) == 0
+        return results
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert results[0] is results[1]
+
+
+def test_cancelling_the_leader_does_not_cancel_followers():
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "metagraph"
+
+        leader = asyncio.create_task(flight.do("a", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("a", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "metagraph"
+
+
+def test_cancel_stops_running_calls():
+    async def main():
+        flight = SingleFlight()
+        never = asyncio.Event()
+        caller = asyncio.create_task(flight.do("a", never.wait))
+        await asyncio.sleep(0)
+        flight.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+        assert len(flight) == 0
+
+    asyncio.run(main())
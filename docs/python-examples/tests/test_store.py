@@ -0,0 +1,174 @@
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from benchmarks.payloads import make_metagraph_payload
+from kami.columnar import ColumnarMetagraph
+from kami.kami import Kami
+from kami.store import NUMERIC_COLUMNS, SnapshotStore
+from kami.tracker import MetagraphTracker
+from kami.types import SubnetMetagraph
+from tests.test_commit_reveal import make_hyperparameters
+
+URL = "http://127.0.0.1:8882"
+
+
+def make_metagraph(block: int, seed: int = 0) -> ColumnarMetagraph:
+    return ColumnarMetagraph.from_response(
+        make_metagraph_payload(32, netuid=2, block=block, seed=seed)
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path)
+
+
+def test_metagraph_round_trip(store):
+    metagraph = make_metagraph(100)
+    store.save_metagraph(metagraph)
+    loaded = store.load_metagraph(2, 100)
+
+    assert loaded is not None
+    assert isinstance(loaded.emission, np.memmap)
+    for name in NUMERIC_COLUMNS:
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(metagraph, name))
+    assert loaded.hotkeys == metagraph.hotkeys
+    assert loaded.coldkeys == metagraph.coldkeys
+    assert loaded.identities == metagraph.identities
+    assert loaded.taoDividendsPerHotkey == metagraph.taoDividendsPerHotkey
+    assert loaded.get_axon(3) == metagraph.get_axon(3)
+    assert loaded.name == metagraph.name and loaded.block == metagraph.block
+
+
+def test_pydantic_metagraph_is_stored_columnar(store):
+    payload = make_metagraph_payload(8, netuid=2, block=100)
+    store.save_metagraph(SubnetMetagraph.model_validate(payload))
+    loaded = store.load_metagraph(2)
+    assert loaded is not None
+    assert loaded.hotkeys == payload["hotkeys"]
+    assert loaded.get_axon(5) == SubnetMetagraph.model_validate(payload).axons[5]
+
+
+def test_overwrite_replaces_a_snapshot_atomically(store, monkeypatch):
+    store.save_metagraph(make_metagraph(100, seed=1))
+    before = store.load_metagraph(2, 100)
+    store.save_metagraph(make_metagraph(100, seed=2), overwrite=True)
+
+    # The old memory maps stay readable after the snapshot is replaced.
+    np.testing.assert_array_equal(
+        before.totalStake, make_metagraph(100, seed=1).totalStake
+    )
+    expected = make_metagraph(100, seed=2).totalStake
+    np.testing.assert_array_equal(store.load_metagraph(2, 100).totalStake, expected)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(np, "save", fail)
+    with pytest.raises(RuntimeError):
+        store.save_metagraph(make_metagraph(100, seed=3), overwrite=True)
+    monkeypatch.undo()
+    # A failed overwrite leaves the previous snapshot and no temporary directories.
+    np.testing.assert_array_equal(store.load_metagraph(2, 100).totalStake, expected)
+    assert [path.name for path in (store.root / "metagraph" / "2").iterdir()] == [
+        "100"
+    ]
+
+
+def test_failed_overwrite_restores_the_old_snapshot(store, monkeypatch):
+    store.save_metagraph(make_metagraph(100, seed=1))
+    replace = os.replace
+    calls = []
+
+    def fail_second(src, dst):
+        calls.append((src, dst))
+        # The first call moves the old snapshot aside, the second moves the new one in.
+        if len(calls) == 2:
+            raise OSError("rename failed")
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", fail_second)
+    with pytest.raises(OSError, match="rename failed"):
+        store.save_metagraph(make_metagraph(100, seed=2), overwrite=True)
+    monkeypatch.undo()
+
+    expected = make_metagraph(100, seed=1).totalStake
+    np.testing.assert_array_equal(store.load_metagraph(2, 100).totalStake, expected)
+    assert [path.name for path in (store.root / "metagraph" / "2").iterdir()] == [
+        "100"
+    ]
+
+
+def test_latest_blocks_and_missing(store):
+    for block in (300, 100, 200):
+        store.save_metagraph(make_metagraph(block))
+    # An interrupted write leaves no meta.json and is never loaded.
+    (store.root / "metagraph" / "2" / "400").mkdir()
+
+    assert store.netuids() == [2]
+    assert store.blocks(2) == [100, 200, 300, 400]
+    assert store.load_metagraph(2).block == 300
+    assert store.load_metagraph(2, 400) is None
+    assert store.load_metagraph(3) is None
+
+
+def test_history_reads_one_column(store):
+    for block in (100, 200, 300):
+        store.save_metagraph(make_metagraph(block, seed=block))
+
+    history = list(store.history(2, "totalStake", start=150))
+    assert [block for block, _ in history] == [200, 300]
+    np.testing.assert_array_equal(history[0][1], make_metagraph(200, seed=200).totalStake)
+    with pytest.raises(ValueError):
+        list(store.history(2, "hotkeys"))
+
+
+def test_prune_keeps_latest(store):
+    for block in (100, 200, 300):
+        store.save_metagraph(make_metagraph(block))
+    store.prune(2, keep=1)
+    assert store.blocks(2) == [300]
+
+
+def test_hyperparameters_at_or_before_block(store):
+    store.save_hyperparameters(2, 100, make_hyperparameters(tempo=100))
+    store.save_hyperparameters(2, 200, make_hyperparameters(tempo=200))
+
+    assert store.load_hyperparameters(2).tempo == 200
+    assert store.load_hyperparameters(2, 150).tempo == 100
+    assert store.load_hyperparameters(2, 50) is None
+
+
+def test_client_persists_responses_and_tracker_warm_starts(store):
+    async def run():
+        kami = Kami(url=URL, store=store)
+        responses = {
+            "chain/subnet-metagraph/2": make_metagraph_payload(32, netuid=2, block=100),
+            "chain/subnet-hyperparameters/2": make_hyperparameters().model_dump(),
+        }
+
+        async def get(endpoint, params=None, compact=False):
+            return {"success": True, "data": responses[endpoint]}
+
+        kami.get = get
+        await kami.get_metagraph(2, columnar=True)
+        await kami.get_subnet_hyperparameters(2)
+        # Unchanged hyperparameters are not stored again.
+        kami.latest_block = 101
+        await kami.get_subnet_hyperparameters(2)
+        await kami.close()
+
+        assert store.blocks(2) == [100]
+        assert store.load_hyperparameters(2) == make_hyperparameters()
+        assert list(
+            (store.root / "hyperparameters" / "2").glob("*.json")
+        ) == [store.root / "hyperparameters" / "2" / "100.json"]
+
+        tracker = MetagraphTracker(Kami(url=URL, store=store), 2)
+        assert tracker.snapshot is not None and tracker.snapshot.block == 100
+        assert tracker.index is not None and len(tracker.index) == 32
+
+    asyncio.run(run())
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aiohttp import web
+
+from benchmarks.payloads import make_metagraph_payload
+from kami.retry import deadline
+from kami.sync import SyncIterator, SyncKami
+from test_pool import Stub, envelope
+
+
+class MetagraphStub(Stub):
+    async def metagraph(self, request: web.Request) -> web.Response:
+        self.requests.append(f"metagraph-{request.match_info['netuid']}")
+        await asyncio.sleep(0.01)
+        netuid = int(request.match_info["netuid"])
+        return envelope(make_metagraph_payload(8, netuid=netuid, block=self.block))
+
+    def routes(self, app: web.Application):
+        super().routes(app)
+        app.router.add_get("/chain/subnet-metagraph/{netuid}", self.metagraph)
+
+
+@pytest.fixture
+def stub():
+    """A stub served from its own loop thread, like a remote Kami."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    stub = MetagraphStub("stub", 100)
+    asyncio.run_coroutine_threadsafe(stub.start(), loop).result()
+    yield stub
+    asyncio.run_coroutine_threadsafe(stub.stop(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_calls_block_and_reuse_one_session(stub):
+    with SyncKami(url=stub.url) as kami:
+        assert kami.get_current_block() == 100
+        session = kami.kami.session
+        assert kami.get_metagraph(3).netuid == 3
+        assert kami.kami.session is session
+        assert kami.get_metagraph.__doc__ == kami.kami.get_metagraph.__doc__
+        assert kami.latest_block == 100
+
+
+def test_concurrent_threads_share_the_loop(stub):
+    with SyncKami(url=stub.url) as kami:
+        with ThreadPoolExecutor(8) as pool:
+            blocks = list(pool.map(lambda _: kami.get_current_block(), range(32)))
+    assert blocks == [100] * 32
+    # Overlapping calls from different threads were coalesced on the loop.
+    assert len(stub.requests) < 32
+
+
+def test_async_iterators_become_blocking_iterators(stub):
+    with SyncKami(url=stub.url) as kami:
+        results = kami.get_metagraphs(range(4))
+        assert isinstance(results, SyncIterator)
+        assert sorted(result.netuid for result in results) == [0, 1, 2, 3]
+
+        with kami.get_metagraphs(range(100), concurrency=1) as results:
+            next(results)
+        assert len(stub.requests) < 100
+
+
+def test_timeout_and_deadline_cancel_the_call(stub):
+    with SyncKami(url=stub.url, timeout=0.001) as kami:
+        with pytest.raises(TimeoutError):
+            kami.get_current_block()
+    with SyncKami(url=stub.url) as kami:
+        with deadline(0.001):
+            with pytest.raises(RuntimeError, match="Timed out"):
+                kami.get_current_block()
+
+
+def test_misuse_raises(stub):
+    kami = SyncKami(url=stub.url)
+
+    async def reenter():
+        return kami.get_current_block()
+
+    with pytest.raises(RuntimeError, match="own event loop"):
+        kami._run(reenter())
+    kami.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        kami.get_current_block()
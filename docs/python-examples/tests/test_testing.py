@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+from kami.kami import Kami
+from kami.retry import RetryPolicy, deadline
+from kami.testing import FakeKami, record_fixtures
+from kami.types import SetWeightsPayload
+
+NO_RETRY = RetryPolicy(max_retries=0, failure_threshold=0)
+
+
+def test_serves_synthetic_payloads():
+    async def main():
+        async with FakeKami(netuids=[1, 2], num_uids=16, block=100) as fake:
+            async with Kami(url=fake.url) as kami:
+                metagraph = await kami.get_metagraph(2)
+                pinned = await kami.get_metagraph(2, block=90)
+                hyperparameters = await kami.get_subnet_hyperparameters(1)
+                hotkey = metagraph.hotkeys[3]
+                registered = await kami.is_hotkey_registered(2, hotkey, block=100)
+                health = await kami.health_check()
+                keyring = await kami.get_keyring_pair_info()
+                missing = await kami.get("chain/subnet-metagraph/3")
+        assert metagraph.netuid == 2 and len(metagraph.hotkeys) == 16
+        assert metagraph.block == 100 and pinned.block == 90
+        assert not hyperparameters.commitRevealWeightsEnabled
+        assert registered
+        assert health.latestBlock == 100
+        assert keyring.keyringPair.address
+        assert missing["statusCode"] == 404 and not missing["success"]
+        assert fake.requests["chain/subnet-metagraph/2"] == 2
+
+    asyncio.run(main())
+
+
+def test_records_extrinsics():
+    async def main():
+        async with FakeKami() as fake:
+            async with Kami(url=fake.url) as kami:
+                payload = SetWeightsPayload(
+                    netuid=1, dests=[0, 1], weights=[1, 2], version_key=0
+                )
+                result = await kami.set_weights(payload)
+                nonce = await kami.get_account_nonce("5Account")
+        assert result["success"] and result["data"].startswith("0x")
+        assert fake.extrinsics == [("chain/set-weights", payload.model_dump())]
+        assert nonce == 1
+
+    asyncio.run(main())
+
+
+def test_latency_and_jitter_delay_responses():
+    async def main():
+        async with FakeKami(latency=0.05, jitter=0.02) as fake:
+            async with Kami(url=fake.url, coalesce=False) as kami:
+                started = time.perf_counter()
+                await kami.get_current_block()
+                return time.perf_counter() - started
+
+    assert 0.05 <= asyncio.run(main()) < 1
+
+
+def test_injected_errors_are_retried():
+    async def main():
+        async with FakeKami(block=7) as fake:
+            fake.fail_next(2)
+            retry = RetryPolicy(
+                max_retries=2, initial_retry_delay=0.001, failure_threshold=0
+            )
+            async with Kami(url=fake.url, retry=retry) as kami:
+                assert await kami.get_current_block() == 7
+            assert fake.requests["chain/latest-block"] == 3
+
+            fake.fail_next(status=500)
+            async with Kami(url=fake.url, retry=NO_RETRY) as kami:
+                result = await kami.get("chain/latest-block")
+            assert not result["success"]
+            assert result["error"]["type"] == "Internal Server Error"
+
+    asyncio.run(main())
+
+
+def test_deadline_too_short_to_retry_returns_the_error_response(monkeypatch):
+    monkeypatch.setattr(RetryPolicy, "delay", lambda self, attempt: 10.0)
+
+    async def main():
+        async with FakeKami(block=7) as fake:
+            fake.fail_next()
+            async with Kami(url=fake.url) as kami:
+                with deadline(1):
+                    result = await kami.get("chain/latest-block")
+            assert fake.requests["chain/latest-block"] == 1
+            return result
+
+    result = asyncio.run(main())
+    assert result["statusCode"] == 503 and not result["success"]
+
+
+def test_error_rate_is_seeded():
+    async def failures(seed: int) -> list[bool]:
+        async with FakeKami(error_rate=0.5, seed=seed) as fake:
+            async with Kami(url=fake.url, retry=NO_RETRY) as kami:
+                results = [await kami.get("substrate/health") for _ in range(40)]
+        return [result["success"] for result in results]
+
+    first = asyncio.run(failures(1))
+    assert first == asyncio.run(failures(1))
+    assert 5 < first.count(False) < 35
+
+
+def test_recorded_fixtures_are_served(tmp_path):
+    async def main():
+        async with FakeKami(num_uids=8, block=100) as real:
+            async with Kami(url=real.url) as kami:
+                paths = await record_fixtures(kami, tmp_path, [1])
+        assert (tmp_path / "chain" / "subnet-metagraph" / "1.json") in paths
+
+        async with FakeKami(num_uids=32, block=200, fixtures=tmp_path) as fake:
+            async with Kami(url=fake.url) as kami:
+                recorded = await kami.get_metagraph(1)
+                synthetic = await kami.get_metagraph(1, block=150)
+                block = await kami.get_current_block()
+        assert len(recorded.hotkeys) == 8 and recorded.block == 100
+        assert len(synthetic.hotkeys) == 32 and synthetic.block == 150
+        assert block == 100
+
+    asyncio.run(main())
+
+
+def test_block_stream():
+    async def main():
+        async with FakeKami(block=100) as fake:
+            async with Kami(url=fake.url) as kami:
+                async with kami.subscribe_blocks() as blocks:
+                    await fake.wait_for_subscribers()
+                    await fake.produce_block()
+                    await fake.produce_block(skip=2)
+                    events = [await anext(blocks) for _ in range(4)]
+        assert [event.block.blockNumber for event in events] == [101, 102, 103, 104]
+        assert [event.backfilled for event in events] == [False, True, True, False]
+        assert events[0].block.parentHash
+
+    asyncio.run(main())
+
+
+def test_background_block_production():
+    async def main():
+        async with FakeKami(block=100, block_interval=0.01) as fake:
+            await asyncio.sleep(0.1)
+        return fake.block
+
+    assert asyncio.run(main()) > 102
@@ -0,0 +1,164 @@
+import asyncio
+import copy
+from typing import Any, Callable, Dict
+
+import pytest
+
+from kami.columnar import ColumnarMetagraph
+from kami.kami import Kami
+from kami.testing import make_metagraph_payload
+from kami.tracker import MetagraphTracker, diff_metagraphs
+
+URL = "http://127.0.0.1:8882"
+NUM_UIDS = 8
+
+
+def register(payload: Dict[str, Any], uid: int, hotkey: str):
+    payload["hotkeys"][uid] = hotkey
+    payload["blockAtRegistration"][uid] = payload["block"]
+    payload["totalStake"][uid] = 0.0
+
+
+def swap_hotkey(payload: Dict[str, Any], uid: int, hotkey: str):
+    payload["hotkeys"][uid] = hotkey
+
+
+def reregister_same_hotkey(payload: Dict[str, Any], uid: int, hotkey: str):
+    register(payload, uid, payload["hotkeys"][uid])
+
+
+def move_axon(payload: Dict[str, Any], uid: int, hotkey: str):
+    payload["axons"][uid] = dict(payload["axons"][uid], port=9000)
+
+
+def stake(payload: Dict[str, Any], uid: int, hotkey: str):
+    payload["alphaStake"][uid] += 1.0
+    payload["totalStake"][uid] += 1.0
+
+
+def shrink(payload: Dict[str, Any], uid: int, hotkey: str):
+    for name, value in list(payload.items()):
+        if isinstance(value, list) and len(value) == NUM_UIDS:
+            payload[name] = value[:uid]
+
+
+def grow(payload: Dict[str, Any], uid: int, hotkey: str):
+    grown = make_metagraph_payload(uid + 1, block=payload["block"])
+    for name, value in list(payload.items()):
+        if isinstance(value, list) and len(value) == NUM_UIDS:
+            payload[name] = value + grown[name][NUM_UIDS:]
+
+
+# mutation, uid, expected non-empty delta fields
+CASES = [
+    (register, 3, {"registered": [3]}),
+    (swap_hotkey, 3, {"hotkey_swaps": [3]}),
+    (reregister_same_hotkey, 3, {"registered": [3]}),
+    (move_axon, 5, {"axon_changes": [5]}),
+    (stake, 2, {"stake_changes": [2]}),
+    (shrink, 6, {"deregistered": [6, 7]}),
+    (grow, 9, {"registered": [8, 9]}),
+]
+UID_SETS = (
+    "registered",
+    "deregistered",
+    "hotkey_swaps",
+    "axon_changes",
+    "stake_changes",
+)
+
+
+def snapshots(
+    mutate: Callable[[Dict[str, Any], int, str], None], uid: int
+) -> tuple[ColumnarMetagraph, ColumnarMetagraph]:
+    previous = make_metagraph_payload(NUM_UIDS, block=100)
+    current = copy.deepcopy(previous)
+    current["block"] = 101
+    mutate(current, uid, "5NewHotkey")
+    return (
+        ColumnarMetagraph.from_response(previous),
+        ColumnarMetagraph.from_response(current),
+    )
+
+
+@pytest.mark.parametrize(
+    "mutate,uid,expected", CASES, ids=[case[0].__name__ for case in CASES]
+)
+def test_diff_reports_each_kind_of_change(mutate, uid, expected):
+    previous, current = snapshots(mutate, uid)
+    delta = diff_metagraphs(previous, current)
+
+    assert (delta.block, delta.previous_block) == (101, 100)
+    for name in UID_SETS:
+        assert getattr(delta, name).tolist() == expected.get(name, []), name
+    assert not delta.is_empty
+    assert delta.changes_identity is (mutate is not stake)
+
+
+def test_registered_uids_are_not_reported_as_changed():
+    previous, current = snapshots(register, 3)
+    delta = diff_metagraphs(previous, current)
+    assert all(3 not in uids for uids in delta.changed.values())
+    assert delta.stake_changes.size == 0
+
+
+def test_first_snapshot_registers_every_uid():
+    _, current = snapshots(stake, 0)
+    delta = diff_metagraphs(None, current)
+    assert delta.previous_block is None
+    assert delta.registered.tolist() == list(range(NUM_UIDS))
+
+
+def test_identical_snapshots_are_empty():
+    previous, current = snapshots(lambda *_: None, 0)
+    delta = diff_metagraphs(previous, current)
+    assert delta.is_empty and not delta.changes_identity
+
+
+def test_tracker_publishes_deltas_and_keeps_the_index():
+    async def main():
+        kami = Kami(url=URL)
+        payloads = [make_metagraph_payload(NUM_UIDS, block=100)]
+        for block, mutate in ((101, stake), (102, lambda *_: None), (103, swap_hotkey)):
+            payload = copy.deepcopy(payloads[-1])
+            payload["block"] = block
+            mutate(payload, 1, "5NewHotkey")
+            payloads.append(payload)
+        responses = iter(payloads + [payloads[1]])
+
+        async def get(endpoint, params=None, compact=False):
+            return {"success": True, "data": next(responses)}
+
+        kami.get = get
+        tracker = MetagraphTracker(kami, 1)
+        sync_deltas, async_deltas = [], []
+
+        async def on_delta(delta):
+            async_deltas.append(delta)
+
+        tracker.subscribe(sync_deltas.append)
+        unsubscribe = tracker.subscribe(on_delta)
+
+        first = await tracker.update()
+        index = tracker.index
+        staked = await tracker.update(101)
+        # Stake changes leave hotkeys and axons alone, so the index is kept.
+        assert tracker.index is index and index.block == 101
+        # An unchanged metagraph is not published.
+        assert await tracker.update(102) is None
+        unsubscribe()
+        swapped = await tracker.update(103)
+        assert tracker.index is not index
+        assert tracker.index.uid("5NewHotkey") == 1
+        # A response older than the snapshot, e.g. from a lagging replica, is ignored.
+        assert await tracker.update() is None
+        assert tracker.snapshot.block == 103
+        await kami.close()
+        return first, staked, swapped, sync_deltas, async_deltas
+
+    first, staked, swapped, sync_deltas, async_deltas = asyncio.run(main())
+    assert first.registered.size == NUM_UIDS
+    assert staked.stake_changes.tolist() == [1]
+    assert swapped.hotkey_swaps.tolist() == [1]
+    assert sync_deltas == [first, staked, swapped]
+    assert async_deltas == [first, staked]
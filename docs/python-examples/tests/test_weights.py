@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from kami.types import SubnetHyperparameters
+from kami.weights import (
+    U16_MAX,
+    build_set_weights_payload,
+    normalize_max_weight,
+    process_weights,
+    quantize_weights,
+)
+
+import reference_weights as reference
+
+SEEDS = range(200)
+
+
+def random_case(seed: int):
+    """Random scores with zeros and ties, plus random subnet limits."""
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(1, 300))
+    scores = rng.random(size) ** rng.integers(1, 8)
+    scores[rng.random(size) < rng.random()] = 0
+    if rng.random() < 0.2:
+        scores = np.round(scores, 1)
+    min_allowed_weights = int(rng.integers(0, size + 10))
+    max_weight_limit = float(rng.uniform(0.001, 1.0))
+    quantile = float(rng.choice([0.0, rng.random()]))
+    return scores, min_allowed_weights, max_weight_limit, quantile
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_normalize_max_weight_matches_reference(seed):
+    rng = np.random.default_rng(seed)
+    weights = rng.random(int(rng.integers(1, 500))) ** 4
+    limit = float(rng.uniform(0.001, 1.0))
+    expected = reference.normalize_max_weight(weights, limit=limit)
+    np.testing.assert_allclose(normalize_max_weight(weights, limit=limit), expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_process_weights_matches_reference(seed):
+    scores, min_allowed, limit, quantile = random_case(seed)
+    uids, weights = process_weights(scores, min_allowed, limit, quantile)
+    expected_uids, expected_weights = reference.process_weights(
+        scores.tolist(), min_allowed, limit, quantile
+    )
+    assert uids.tolist() == expected_uids
+    np.testing.assert_allclose(weights, expected_weights)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_quantize_weights_matches_reference(seed):
+    scores, min_allowed, limit, quantile = random_case(seed)
+    uids, weights = reference.process_weights(
+        scores.tolist(), min_allowed, limit, quantile
+    )
+    dests, quantized = quantize_weights(np.array(uids), np.array(weights))
+    expected_dests, expected_weights = reference.convert_weights_and_uids_for_emit(
+        uids, weights
+    )
+    assert dests.tolist() == expected_dests
+    assert quantized.tolist() == expected_weights
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_processed_weights_respect_subnet_limits(seed):
+    scores, min_allowed, limit, quantile = random_case(seed)
+    uids, weights = process_weights(scores, min_allowed, limit, quantile)
+    assert np.isclose(weights.sum(), 1.0)
+    assert len(uids) >= min(min_allowed, len(scores))
+    if len(uids) * limit > 1:
+        assert weights.max() <= limit + 1e-6
+
+
+def test_quantize_weights_scales_max_to_u16_and_drops_zeros():
+    dests, weights = quantize_weights(np.array([0, 1, 2]), np.array([0.5, 0.0, 1.0]))
+    assert dests.tolist() == [0, 2]
+    assert weights.tolist() == [round(0.5 * U16_MAX), U16_MAX]
+    assert weights.dtype == np.uint16
+
+
+def test_process_weights_rejects_invalid_scores():
+    with pytest.raises(ValueError):
+        process_weights(np.array([0.1, -0.1]), 1, 0.5)
+    with pytest.raises(ValueError):
+        process_weights(np.array([0.1, np.nan]), 1, 0.5)
+
+
+def test_build_set_weights_payload_uses_hyperparameters():
+    hyperparameters = SubnetHyperparameters.model_construct(
+        minAllowedWeights=2, maxWeightsLimit=U16_MAX
+    )
+    scores = np.array([0.0, 0.0, 1.0, 3.0, 0.0])
+    payload = build_set_weights_payload(scores, hyperparameters, netuid=7, version_key=3)
+    assert payload.netuid == 7
+    assert payload.version_key == 3
+    assert payload.dests == [2, 3]
+    assert payload.weights == [round(1 / 3 * U16_MAX), U16_MAX]
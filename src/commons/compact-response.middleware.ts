@@ -0,0 +1,81 @@
+import { NextFunction, Request, Response } from 'express';
+import { promisify } from 'util';
+import { brotliCompress, constants, gzip } from 'zlib';
+
+import { Logger } from '@nestjs/common';
+
+import { MSGPACK_CONTENT_TYPE, encodeMsgpack } from './utils/msgpack.util';
+
+export type ResponseFormat = 'json' | 'msgpack';
+
+// Smaller bodies are sent as is, compressing them saves less than it costs.
+const MIN_COMPRESSED_SIZE = 1024;
+
+const logger = new Logger('CompactResponse');
+const brotliCompressAsync = promisify(brotliCompress);
+const gzipAsync = promisify(gzip);
+
+function compress(body: Buffer, encoding: string): Promise<Buffer> {
+  if (encoding === 'br') {
+    // The default quality of 11 is meant for static assets and far too slow here.
+    return brotliCompressAsync(body, {
+      params: {
+        [constants.BROTLI_PARAM_QUALITY]: 4,
+        [constants.BROTLI_PARAM_SIZE_HINT]: body.length,
+      },
+    });
+  }
+  return gzipAsync(body, { level: 6 });
+}
+
+/**
+ * The response format negotiated by `MsgpackInterceptor`, 'json' on routes without
+ * it.
+ */
+export function responseFormat(response: Response): ResponseFormat {
+  return response.locals.format === 'msgpack' ? 'msgpack' : 'json';
+}
+
+/**
+ * Encode and compress every JSON response.
+ *
+ * On routes where `MsgpackInterceptor` negotiated MessagePack, the response
+ * envelope is sent as MessagePack, with arrays of numbers packed as typed arrays,
+ * see `encodeMsgpack`. Bodies of at least 1 KiB are compressed with brotli or gzip,
+ * whichever `Accept-Encoding` prefers. Compression runs on the libuv thread pool,
+ * so a large metagraph doesn't block the event loop while it is compressed.
+ */
+export function compactResponse(request: Request, response: Response, next: NextFunction) {
+  response.json = (body?: unknown) => {
+    let payload: Buffer;
+    if (responseFormat(response) === 'msgpack') {
+      payload = encodeMsgpack(body);
+      response.setHeader('Content-Type', MSGPACK_CONTENT_TYPE);
+    } else {
+      payload = Buffer.from(JSON.stringify(body) ?? '');
+      if (!response.getHeader('Content-Type')) {
+        response.setHeader('Content-Type', 'application/json; charset=utf-8');
+      }
+    }
+    response.vary('Accept-Encoding');
+
+    const encoding = request.acceptsEncodings('br', 'gzip');
+    // A fresh request is answered with a bodyless 304.
+    if (!encoding || payload.length < MIN_COMPRESSED_SIZE || request.fresh) {
+      return response.send(payload);
+    }
+    compress(payload, encoding).then(
+      compressed => {
+        response.setHeader('Content-Encoding', encoding);
+        response.send(compressed);
+      },
+      error => {
+        logger.error(`Failed to compress response with ${encoding}:`, error);
+        response.send(payload);
+      },
+    );
+    return response;
+  };
+
+  next();
+}
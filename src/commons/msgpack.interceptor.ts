@@ -0,0 +1,27 @@
+import { Request, Response } from 'express';
+import { Observable } from 'rxjs';
+
+import { CallHandler, ExecutionContext, Injectable, NestInterceptor } from '@nestjs/common';
+
+import { MSGPACK_CONTENT_TYPE } from './utils/msgpack.util';
+
+/**
+ * Offer MessagePack on a route, to clients that prefer `application/msgpack` in
+ * `Accept`.
+ *
+ * Only for routes whose clients expect arrays of numbers to come back as typed
+ * arrays, such as the subnet metagraph. The negotiated format is read with
+ * `responseFormat` and the response is encoded by `compactResponse`.
+ */
+@Injectable()
+export class MsgpackInterceptor implements NestInterceptor {
+  intercept(context: ExecutionContext, next: CallHandler): Observable<unknown> {
+    const http = context.switchToHttp();
+    const request = http.getRequest<Request>();
+    const response = http.getResponse<Response>();
+    const accepted = request.accepts(['application/json', MSGPACK_CONTENT_TYPE]);
+    response.locals.format = accepted === MSGPACK_CONTENT_TYPE ? 'msgpack' : 'json';
+    response.vary('Accept');
+    return next.handle();
+  }
+}
@@ -0,0 +1,38 @@
+import { Response } from 'express';
+
+/**
+ * ETag of a resource read from the chain at a block.
+ *
+ * The block hash identifies the chain state the resource was read from, so it can
+ * be compared with `If-None-Match` before the resource is read. Formats other than
+ * JSON are different representations and get their own ETag.
+ */
+export function blockEtag(resource: string, blockHash: string, format = 'json'): string {
+  const suffix = format === 'json' ? '' : `+${format}`;
+  return `"${resource}@${blockHash}${suffix}"`;
+}
+
+/**
+ * Whether an `If-None-Match` request header matches an ETag.
+ */
+export function etagMatches(ifNoneMatch: string | undefined, etag: string): boolean {
+  if (!ifNoneMatch) {
+    return false;
+  }
+  return ifNoneMatch
+    .split(',')
+    .map(tag => tag.trim().replace(/^W\//, ''))
+    .some(tag => tag === '*' || tag === etag);
+}
+
+/**
+ * Let clients keep a response, but make them revalidate it on every request.
+ *
+ * The best block moves every few seconds and a block number may be reorganised
+ * until it is finalized, so the ETag has to be checked each time. Express answers
+ * a request whose `If-None-Match` matches the ETag with a bodyless 304.
+ */
+export function setRevalidationHeaders(response: Response, etag: string) {
+  response.setHeader('ETag', etag);
+  response.setHeader('Cache-Control', 'no-cache');
+}
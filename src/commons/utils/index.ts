@@ -7,3 +7,4 @@ export * from './utf16.utils';
 export * from './unicode.utils';
 export * from './ip.util';
 export * from './format-number-string.util';
+export * from './etag.util';
@@ -0,0 +1,193 @@
+export const MSGPACK_CONTENT_TYPE = 'application/msgpack';
+
+// Extension types of arrays made only of numbers, holding little-endian values.
+export const MSGPACK_FLOAT64_ARRAY = 1;
+export const MSGPACK_INT64_ARRAY = 2;
+
+class MsgpackWriter {
+  private buffer = Buffer.allocUnsafe(4096);
+  private offset = 0;
+
+  result(): Buffer {
+    return this.buffer.subarray(0, this.offset);
+  }
+
+  private reserve(size: number): number {
+    const offset = this.offset;
+    if (offset + size > this.buffer.length) {
+      let length = this.buffer.length * 2;
+      while (length < offset + size) {
+        length *= 2;
+      }
+      const buffer = Buffer.allocUnsafe(length);
+      this.buffer.copy(buffer, 0, 0, offset);
+      this.buffer = buffer;
+    }
+    this.offset += size;
+    return offset;
+  }
+
+  write(value: unknown) {
+    if (value === null || value === undefined) {
+      this.byte(0xc0);
+    } else if (typeof value === 'boolean') {
+      this.byte(value ? 0xc3 : 0xc2);
+    } else if (typeof value === 'number') {
+      this.number(value);
+    } else if (typeof value === 'bigint') {
+      const offset = this.reserve(9);
+      this.buffer[offset] = 0xd3;
+      this.buffer.writeBigInt64BE(value, offset + 1);
+    } else if (typeof value === 'string') {
+      this.string(value);
+    } else if (Array.isArray(value)) {
+      this.array(value);
+    } else if (typeof value === 'object') {
+      const toJSON = (value as { toJSON?: () => unknown }).toJSON;
+      if (typeof toJSON === 'function') {
+        this.write(toJSON.call(value));
+      } else {
+        this.map(value as Record<string, unknown>);
+      }
+    } else {
+      // Like JSON, functions and symbols outside of objects become null.
+      this.byte(0xc0);
+    }
+  }
+
+  private byte(value: number) {
+    this.buffer[this.reserve(1)] = value;
+  }
+
+  private header(size: number, fix: number, fixMax: number, type16: number) {
+    if (size < fixMax) {
+      this.byte(fix | size);
+    } else if (size < 0x10000) {
+      const offset = this.reserve(3);
+      this.buffer[offset] = type16;
+      this.buffer.writeUInt16BE(size, offset + 1);
+    } else {
+      const offset = this.reserve(5);
+      this.buffer[offset] = type16 + 1;
+      this.buffer.writeUInt32BE(size, offset + 1);
+    }
+  }
+
+  private number(value: number) {
+    if (!Number.isFinite(value)) {
+      // JSON has no NaN or Infinity either.
+      this.byte(0xc0);
+      return;
+    }
+    if (!Number.isInteger(value) || Math.abs(value) >= 2 ** 63) {
+      const offset = this.reserve(9);
+      this.buffer[offset] = 0xcb;
+      this.buffer.writeDoubleBE(value, offset + 1);
+      return;
+    }
+    if (value >= 0 && value < 0x80) {
+      this.byte(value);
+    } else if (value < 0 && value >= -0x20) {
+      this.byte(value & 0xff);
+    } else if (value >= -0x80000000 && value <= 0xffffffff) {
+      const offset = this.reserve(5);
+      if (value < 0) {
+        this.buffer[offset] = 0xd2;
+        this.buffer.writeInt32BE(value, offset + 1);
+      } else {
+        this.buffer[offset] = 0xce;
+        this.buffer.writeUInt32BE(value, offset + 1);
+      }
+    } else {
+      const offset = this.reserve(9);
+      this.buffer[offset] = 0xd3;
+      this.buffer.writeBigInt64BE(BigInt(value), offset + 1);
+    }
+  }
+
+  private string(value: string) {
+    const size = Buffer.byteLength(value);
+    if (size < 0x20) {
+      this.byte(0xa0 | size);
+    } else if (size < 0x100) {
+      const offset = this.reserve(2);
+      this.buffer[offset] = 0xd9;
+      this.buffer[offset + 1] = size;
+    } else {
+      this.header(size, 0, 0, 0xda);
+    }
+    const offset = this.reserve(size);
+    this.buffer.write(value, offset, size, 'utf8');
+  }
+
+  private array(values: unknown[]) {
+    if (values.length > 0 && values.every(isFiniteNumber)) {
+      this.numbers(values as number[]);
+      return;
+    }
+    this.header(values.length, 0x90, 0x10, 0xdc);
+    for (const value of values) {
+      this.write(value);
+    }
+  }
+
+  private numbers(values: number[]) {
+    const integers = values.every(value => Number.isSafeInteger(value));
+    const size = values.length * 8;
+    if (size < 0x100) {
+      const offset = this.reserve(2);
+      this.buffer[offset] = 0xc7;
+      this.buffer[offset + 1] = size;
+    } else if (size < 0x10000) {
+      const offset = this.reserve(3);
+      this.buffer[offset] = 0xc8;
+      this.buffer.writeUInt16BE(size, offset + 1);
+    } else {
+      const offset = this.reserve(5);
+      this.buffer[offset] = 0xc9;
+      this.buffer.writeUInt32BE(size, offset + 1);
+    }
+    this.byte(integers ? MSGPACK_INT64_ARRAY : MSGPACK_FLOAT64_ARRAY);
+
+    let offset = this.reserve(size);
+    for (const value of values) {
+      if (integers) {
+        this.buffer.writeBigInt64LE(BigInt(value), offset);
+      } else {
+        this.buffer.writeDoubleLE(value, offset);
+      }
+      offset += 8;
+    }
+  }
+
+  private map(value: Record<string, unknown>) {
+    // JSON skips undefined, function and symbol properties.
+    const entries = Object.entries(value).filter(
+      ([, entry]) =>
+        entry !== undefined && typeof entry !== 'function' && typeof entry !== 'symbol',
+    );
+    this.header(entries.length, 0x80, 0x10, 0xde);
+    for (const [key, entry] of entries) {
+      this.string(key);
+      this.write(entry);
+    }
+  }
+}
+
+function isFiniteNumber(value: unknown): boolean {
+  return typeof value === 'number' && Number.isFinite(value);
+}
+
+/**
+ * Encode a response body as MessagePack.
+ *
+ * Values are encoded like `JSON.stringify` would see them, through `toJSON` where
+ * defined. Arrays made only of numbers, such as the per-UID columns of a metagraph,
+ * are packed as `MSGPACK_INT64_ARRAY` or `MSGPACK_FLOAT64_ARRAY` extensions that
+ * clients can read straight into typed arrays.
+ */
+export function encodeMsgpack(value: unknown): Buffer {
+  const writer = new MsgpackWriter();
+  writer.write(value);
+  return writer.result();
+}
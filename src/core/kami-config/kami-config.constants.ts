@@ -90,4 +90,10 @@ export const appConfigMapping: EnvMapping<KamiAppConfig>[] = [
     default: 3000,
     transform: value => parseInt(value),
   },
+  {
+    key: 'runtimeApiCacheSize',
+    envVar: 'RUNTIME_API_CACHE_SIZE',
+    default: 256,
+    transform: value => parseInt(value),
+  },
 ];
@@ -20,6 +20,8 @@ export interface KamiRetryConfig {
 
 export interface KamiAppConfig {
   kamiPort: number;
+  // Runtime API results kept per block hash, 0 disables the cache.
+  runtimeApiCacheSize: number;
 }
 
 export interface KamiConfig
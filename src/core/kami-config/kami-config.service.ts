@@ -84,6 +84,7 @@ export class KamiConfigService {
   getAppConfig(): KamiAppConfig {
     return {
       kamiPort: this.config.kamiPort,
+      runtimeApiCacheSize: this.config.runtimeApiCacheSize,
     };
   }
 }
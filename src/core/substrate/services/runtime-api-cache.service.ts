@@ -0,0 +1,81 @@
+import { KamiConfigService } from 'src/core/kami-config/kami-config.service';
+
+import { Injectable } from '@nestjs/common';
+
+import { u8aToHex } from '@polkadot/util';
+
+import { SubstrateClientService } from './substrate-client.service';
+
+/**
+ * Memoizes runtime API calls by block hash.
+ *
+ * A runtime API call returns the same result for the same block hash, so requests
+ * for the same call, params and block share one call to the subtensor node. Callers
+ * that arrive while the call is in flight wait for it, later ones get its result.
+ * Results are evicted least recently used first once more than
+ * `RUNTIME_API_CACHE_SIZE` are kept, and failed calls are not kept at all.
+ */
+@Injectable()
+export class RuntimeApiCacheService {
+  private readonly maxEntries: number;
+  // Insertion order is recency order, the first key is evicted first.
+  private readonly entries = new Map<string, Promise<any>>();
+
+  constructor(
+    private readonly substrateClientService: SubstrateClientService,
+    private readonly kamiConfigService: KamiConfigService,
+  ) {
+    this.maxEntries = this.kamiConfigService.getAppConfig().runtimeApiCacheSize;
+  }
+
+  /**
+   * The hash of a block, or of the best block if `block` is omitted.
+   */
+  async resolveBlockHash(block?: number): Promise<string> {
+    return block !== undefined
+      ? this.substrateClientService.getBlockHash(block)
+      : this.substrateClientService.getBestBlockHash();
+  }
+
+  async queryRuntimeApi(
+    runtimeDefName: string,
+    methodName: string,
+    params: Uint8Array,
+    blockHash: string,
+  ): Promise<any> {
+    if (this.maxEntries <= 0) {
+      return this.substrateClientService.queryRuntimeApi(
+        runtimeDefName,
+        methodName,
+        params,
+        blockHash,
+      );
+    }
+
+    const key = `${runtimeDefName}_${methodName}:${u8aToHex(params)}@${blockHash}`;
+    const cached = this.entries.get(key);
+    if (cached) {
+      this.entries.delete(key);
+      this.entries.set(key, cached);
+      return cached;
+    }
+
+    const result = this.substrateClientService.queryRuntimeApi(
+      runtimeDefName,
+      methodName,
+      params,
+      blockHash,
+    );
+    this.entries.set(key, result);
+    result.catch(() => {
+      if (this.entries.get(key) === result) {
+        this.entries.delete(key);
+      }
+    });
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+    }
+    return result;
+  }
+}
@@ -35,7 +35,12 @@ export class SubstrateClientService implements OnApplicationBootstrap {
     );
   }
 
-  async queryRuntimeApi(runtimeDefName: string, methodName: string, params: any): Promise<any> {
+  async queryRuntimeApi(
+    runtimeDefName: string,
+    methodName: string,
+    params: any,
+    blockHash?: string,
+  ): Promise<any> {
     const client = await this.substrateConnectionService.getClient();
 
     const runtimeDef: RuntimeApiMetadataV15 | undefined = client.runtimeMetadata.asV15.apis.find(
@@ -63,10 +68,11 @@ export class SubstrateClientService implements OnApplicationBootstrap {
       );
     }
 
-    const resultBytes: Bytes = await client.rpc.state.call(
-      [runtimeDefName, methodName].join('_'),
-      '0x' + hexParams,
-    );
+    const callName: string = [runtimeDefName, methodName].join('_');
+    // Without a block hash, the call runs against the best block.
+    const resultBytes: Bytes = blockHash
+      ? await client.rpc.state.call(callName, '0x' + hexParams, blockHash)
+      : await client.rpc.state.call(callName, '0x' + hexParams);
 
     const typeDef: string = client.registry.createLookupType(outputType);
 
@@ -121,6 +127,18 @@ export class SubstrateClientService implements OnApplicationBootstrap {
     return blockHashHex;
   }
 
+  async getBestBlockHash(): Promise<string> {
+    const client = await this.substrateConnectionService.getClient();
+    const blockHash = await client.rpc.chain.getBlockHash();
+    return blockHash.toHex();
+  }
+
+  async getFinalizedBlockHash(): Promise<string> {
+    const client = await this.substrateConnectionService.getClient();
+    const blockHash = await client.rpc.chain.getFinalizedHead();
+    return blockHash.toHex();
+  }
+
   async subscribeToFinalizedBlocks(callback: (blockInfo: BlockInfo) => void): Promise<() => void> {
     const client = await this.substrateConnectionService.getClient();
 
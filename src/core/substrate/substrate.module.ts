@@ -3,6 +3,7 @@ import { LatestBlockService } from 'src/features/latest-block/latest-block.servi
 import { Global, Logger, Module } from '@nestjs/common';
 
 import { KamiConfigModule } from '../kami-config/kami-config.module';
+import { RuntimeApiCacheService } from './services/runtime-api-cache.service';
 import { SubstrateClientService } from './services/substrate-client.service';
 import { SubstrateConnectionService } from './services/substrate-connection.service';
 import { SubstrateController } from './substrate.controller';
@@ -18,11 +19,12 @@ import { SubstrateController } from './substrate.controller';
       },
       inject: [SubstrateConnectionService],
     },
+    RuntimeApiCacheService,
     Logger,
     LatestBlockService,
   ],
   controllers: [SubstrateController],
-  exports: [SubstrateClientService, SubstrateConnectionService],
+  exports: [SubstrateClientService, SubstrateConnectionService, RuntimeApiCacheService],
   imports: [KamiConfigModule],
 })
 export class SubstrateModule {}
@@ -1,19 +1,29 @@
 import { ApiResponseDto } from '@app/commons/common-response.dto';
 import { ApiCodeSamples, pythonSample } from '@app/commons/decorators/api-code-examples.decorator';
 import { DomainValidationPipe } from '@app/commons/utils/domain-validation.pipe';
+import { blockEtag, etagMatches, setRevalidationHeaders } from '@app/commons/utils/etag.util';
+import { Response } from 'express';
 import { SubstrateExceptionFilter } from 'src/core/substrate/exceptions/substrate.exception-filter';
+import { RuntimeApiCacheService } from 'src/core/substrate/services/runtime-api-cache.service';
 
-import { Controller, Get, Logger, Param, UseFilters } from '@nestjs/common';
+import { Controller, Get, Headers, Logger, Param, Query, Res, UseFilters } from '@nestjs/common';
 import {
   ApiExtraModels,
+  ApiHeader,
   ApiOkResponse,
   ApiOperation,
   ApiParam,
+  ApiQuery,
+  ApiResponse,
   ApiTags,
   getSchemaPath,
 } from '@nestjs/swagger';
 
-import { SubnetHyperparamsDto, SubnetHyperparamsResponseDto } from './subnet-hyperparameter.dto';
+import {
+  SubnetHyperparamsDto,
+  SubnetHyperparamsQueryDto,
+  SubnetHyperparamsResponseDto,
+} from './subnet-hyperparameter.dto';
 import {
   SubnetHyperparameterNotFoundException,
   SubnetHyperparameterParamsInvalidException,
@@ -32,6 +42,7 @@ export class SubnetHyperparameterController {
   constructor(
     private readonly subnetHyperparameterService: SubnetHyperparameterService,
     private readonly subnetHyperparameterMapper: SubnetHyperparameterMapper,
+    private readonly runtimeApiCacheService: RuntimeApiCacheService,
   ) {}
 
   @Get('subnet-hyperparameters/:netuid')
@@ -44,6 +55,17 @@ export class SubnetHyperparameterController {
     type: Number,
     description: 'Network UID',
   })
+  @ApiQuery({
+    name: 'block',
+    type: Number,
+    description: 'Block to read the hyperparameters at, the best block if omitted',
+    required: false,
+  })
+  @ApiHeader({
+    name: 'If-None-Match',
+    description: 'ETag of hyperparameters the client already has',
+    required: false,
+  })
   @ApiOkResponse({
     description: 'Subnet hyperparameter retrieved successfully',
     schema: {
@@ -57,14 +79,38 @@ export class SubnetHyperparameterController {
       ],
     },
   })
+  @ApiResponse({
+    status: 304,
+    description: 'Not modified since the If-None-Match ETag, read at the same block',
+  })
   @ApiCodeSamples([pythonSample('docs/python-examples/get_subnet_hyperparameters.py')])
   async getSubnetHyperparams(
     @Param(new DomainValidationPipe(SubnetHyperparameterParamsInvalidException))
     param: SubnetHyperparamsDto,
+    @Query(new DomainValidationPipe(SubnetHyperparameterParamsInvalidException))
+    query: SubnetHyperparamsQueryDto,
+    @Headers('if-none-match') ifNoneMatch: string | undefined,
+    @Res({ passthrough: true }) response: Response,
   ) {
     const netuid = param.netuid;
-    this.logger.log(`Getting subnet hyperparameter for netuid: ${netuid}`);
-    const result = await this.subnetHyperparameterService.getSubnetHyperparameters(netuid);
+    const block = query.block;
+    this.logger.log(
+      `Getting subnet hyperparameter for netuid: ${netuid}` +
+        (block !== undefined ? ` at block: ${block}` : ''),
+    );
+    const blockHash = await this.runtimeApiCacheService.resolveBlockHash(block);
+    const etag = blockEtag(`subnet-hyperparameters/${netuid}`, blockHash);
+    if (etagMatches(ifNoneMatch, etag)) {
+      // Express turns the response into a 304 without a body.
+      setRevalidationHeaders(response, etag);
+      this.logger.log(`Subnet hyperparameter for netuid ${netuid} not modified`);
+      return null;
+    }
+
+    const result = await this.subnetHyperparameterService.getSubnetHyperparametersAt(
+      netuid,
+      blockHash,
+    );
 
     if (!result) {
       throw new SubnetHyperparameterNotFoundException(
@@ -73,6 +119,7 @@ export class SubnetHyperparameterController {
     }
 
     const subnetHyperparameterDto = this.subnetHyperparameterMapper.toDto(result);
+    setRevalidationHeaders(response, etag);
 
     this.logger.log(`Subnet hyperparameter for netuid ${netuid} retrieved successfully`);
     return subnetHyperparameterDto;
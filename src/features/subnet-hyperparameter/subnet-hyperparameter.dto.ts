@@ -1,5 +1,5 @@
 import { Type } from 'class-transformer';
-import { IsInt, IsNotEmpty, Min } from 'class-validator';
+import { IsInt, IsNotEmpty, IsOptional, Min } from 'class-validator';
 
 import { ApiProperty } from '@nestjs/swagger';
 
@@ -11,6 +11,19 @@ export class SubnetHyperparamsDto {
   netuid: number;
 }
 
+export class SubnetHyperparamsQueryDto {
+  @ApiProperty({
+    description: 'Block to read the hyperparameters at, the best block if omitted',
+    example: 1000000,
+    required: false,
+  })
+  @IsOptional()
+  @IsInt()
+  @Min(0)
+  @Type(() => Number)
+  block?: number;
+}
+
 export class SubnetHyperparamsResponseDto {
   @ApiProperty({
     description:
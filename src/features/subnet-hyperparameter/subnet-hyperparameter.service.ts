@@ -1,4 +1,4 @@
-import { SubstrateClientService } from 'src/core/substrate/services/substrate-client.service';
+import { RuntimeApiCacheService } from 'src/core/substrate/services/runtime-api-cache.service';
 import { SubstrateConnectionService } from 'src/core/substrate/services/substrate-connection.service';
 import { SubnetHyperparameters } from 'src/features/subnet-hyperparameter/subnet-hyperparameter.interface';
 
@@ -9,21 +9,34 @@ export class SubnetHyperparameterService {
   private readonly logger = new Logger(SubnetHyperparameterService.name);
 
   constructor(
-    private readonly substrateClientService: SubstrateClientService,
+    private readonly runtimeApiCacheService: RuntimeApiCacheService,
     private readonly substrateConnectionService: SubstrateConnectionService,
   ) {}
 
-  async getSubnetHyperparameters(netuid: number): Promise<SubnetHyperparameters> {
+  async getSubnetHyperparameters(netuid: number, block?: number): Promise<SubnetHyperparameters> {
+    const blockHash = await this.runtimeApiCacheService.resolveBlockHash(block);
+    return this.getSubnetHyperparametersAt(netuid, blockHash);
+  }
+
+  /**
+   * Read subnet hyperparameters at a block hash, shared with every other request
+   * for the same subnet and block.
+   */
+  async getSubnetHyperparametersAt(
+    netuid: number,
+    blockHash: string,
+  ): Promise<SubnetHyperparameters> {
     const client = await this.substrateConnectionService.getClient();
 
     const runtimeApiName: string = 'SubnetInfoRuntimeApi';
     const methodName: string = 'get_subnet_hyperparams';
     const encodedParams: Uint8Array = client.registry.createType('u16', netuid).toU8a();
 
-    const response = await this.substrateClientService.queryRuntimeApi(
+    const response = await this.runtimeApiCacheService.queryRuntimeApi(
       runtimeApiName,
       methodName,
       encodedParams,
+      blockHash,
     );
 
     const subnetHyperparameters: SubnetHyperparameters = response.toJSON();
@@ -1,20 +1,40 @@
 import { ApiResponseDto, ErrorDto } from '@app/commons/common-response.dto';
+import { responseFormat } from '@app/commons/compact-response.middleware';
 import { ApiCodeSamples, pythonSample } from '@app/commons/decorators/api-code-examples.decorator';
+import { MsgpackInterceptor } from '@app/commons/msgpack.interceptor';
 import { DomainValidationPipe } from '@app/commons/utils/domain-validation.pipe';
+import { blockEtag, etagMatches, setRevalidationHeaders } from '@app/commons/utils/etag.util';
+import { Response } from 'express';
 import { SubstrateExceptionFilter } from 'src/core/substrate/exceptions/substrate.exception-filter';
+import { RuntimeApiCacheService } from 'src/core/substrate/services/runtime-api-cache.service';
 import {
   SubnetMetagraphDto,
   SubnetMetagraphParamsDto,
+  SubnetMetagraphQueryDto,
 } from 'src/features/subnet-metagraph/subnet-metagraph.dto';
 import { SubnetMetagraphMapper } from 'src/features/subnet-metagraph/subnet-metagraph.mapper';
 
-import { Controller, Get, Logger, Param, UseFilters } from '@nestjs/common';
+import {
+  Controller,
+  Get,
+  Headers,
+  Logger,
+  Param,
+  Query,
+  Res,
+  UseFilters,
+  UseInterceptors,
+} from '@nestjs/common';
 import {
   ApiExtraModels,
+  ApiHeader,
   ApiNotFoundResponse,
   ApiOkResponse,
   ApiOperation,
   ApiParam,
+  ApiProduces,
+  ApiQuery,
+  ApiResponse,
   ApiTags,
   getSchemaPath,
 } from '@nestjs/swagger';
@@ -36,18 +56,32 @@ export class SubnetMetagraphController {
   constructor(
     private readonly subnetMetagraphService: SubnetMetagraphService,
     private readonly subnetMetagraphMapper: SubnetMetagraphMapper,
+    private readonly runtimeApiCacheService: RuntimeApiCacheService,
   ) {}
 
   @Get('subnet-metagraph/:netuid')
+  @UseInterceptors(MsgpackInterceptor)
   @ApiOperation({
     summary: 'Get subnet metagraph',
     description: 'Retrieves all subnet metagraph information by netuid',
   })
+  @ApiProduces('application/json', 'application/msgpack')
   @ApiParam({
     name: 'netuid',
     type: Number,
     description: 'Network UID',
   })
+  @ApiQuery({
+    name: 'block',
+    type: Number,
+    description: 'Block to read the metagraph at, the best block if omitted',
+    required: false,
+  })
+  @ApiHeader({
+    name: 'If-None-Match',
+    description: 'ETag of a metagraph the client already has',
+    required: false,
+  })
   @ApiOkResponse({
     description: 'Subnet metagraph retrieved successfully',
     schema: {
@@ -61,6 +95,10 @@ export class SubnetMetagraphController {
       ],
     },
   })
+  @ApiResponse({
+    status: 304,
+    description: 'Not modified since the If-None-Match ETag, read at the same block',
+  })
   @ApiNotFoundResponse({
     description: 'Subnet metagraph not found',
     schema: {
@@ -78,16 +116,34 @@ export class SubnetMetagraphController {
   async getSubnetMetagraph(
     @Param(new DomainValidationPipe(SubnetMetagraphParamsInvalidException))
     param: SubnetMetagraphParamsDto,
+    @Query(new DomainValidationPipe(SubnetMetagraphParamsInvalidException))
+    query: SubnetMetagraphQueryDto,
+    @Headers('if-none-match') ifNoneMatch: string | undefined,
+    @Res({ passthrough: true }) response: Response,
   ) {
     const netuid = param.netuid;
-    this.logger.log(`Getting subnet metagraph for netuid: ${netuid}`);
-    const result = await this.subnetMetagraphService.getSubnetMetagraph(netuid);
+    const block = query.block;
+    this.logger.log(
+      `Getting subnet metagraph for netuid: ${netuid}` +
+        (block !== undefined ? ` at block: ${block}` : ''),
+    );
+    const blockHash = await this.runtimeApiCacheService.resolveBlockHash(block);
+    const etag = blockEtag(`subnet-metagraph/${netuid}`, blockHash, responseFormat(response));
+    if (etagMatches(ifNoneMatch, etag)) {
+      // Express turns the response into a 304 without a body.
+      setRevalidationHeaders(response, etag);
+      this.logger.log(`Subnet metagraph for netuid ${netuid} not modified`);
+      return null;
+    }
+
+    const result = await this.subnetMetagraphService.getSubnetMetagraphAt(netuid, blockHash);
 
     if (!result) {
       throw new SubnetMetagraphNotFoundException(netuid);
     }
 
     const subnetMetagraphDto = this.subnetMetagraphMapper.toDto(result);
+    setRevalidationHeaders(response, etag);
 
     this.logger.log(`Subnet metagraph for netuid ${netuid} retrieved successfully`);
     return subnetMetagraphDto;
@@ -2,7 +2,7 @@ import { DivideBy } from '@app/commons/decorators';
 import { UnicodeToString } from '@app/commons/decorators/unicode-to-string-transform.decorator';
 import { UtfToString } from '@app/commons/decorators/utf-to-string-transform.decorator';
 import { Type } from 'class-transformer';
-import { IsInt, IsNotEmpty, Min } from 'class-validator';
+import { IsInt, IsNotEmpty, IsOptional, Min } from 'class-validator';
 
 import { ApiProperty } from '@nestjs/swagger';
 
@@ -16,6 +16,19 @@ export class SubnetMetagraphParamsDto {
   netuid: number;
 }
 
+export class SubnetMetagraphQueryDto {
+  @ApiProperty({
+    description: 'Block to read the metagraph at, the best block if omitted',
+    example: 1000000,
+    required: false,
+  })
+  @IsOptional()
+  @IsInt()
+  @Min(0)
+  @Type(() => Number)
+  block?: number;
+}
+
 export class SubnetMetagraphDto {
   @ApiProperty({
     description: 'The subnet UID',
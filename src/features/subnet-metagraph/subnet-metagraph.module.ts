@@ -10,5 +10,6 @@ import { SubnetMetagraphService } from './subnet-metagraph.service';
   imports: [SubstrateModule],
   controllers: [SubnetMetagraphController],
   providers: [SubnetMetagraphService, SubnetMetagraphMapper],
+  exports: [SubnetMetagraphService, SubnetMetagraphMapper],
 })
 export class SubnetMetagraphModule {}
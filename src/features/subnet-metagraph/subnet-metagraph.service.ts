@@ -1,4 +1,4 @@
-import { SubstrateClientService } from 'src/core/substrate/services/substrate-client.service';
+import { RuntimeApiCacheService } from 'src/core/substrate/services/runtime-api-cache.service';
 import { SubstrateConnectionService } from 'src/core/substrate/services/substrate-connection.service';
 import { SubnetMetagraph } from 'src/features/subnet-metagraph/subnet-metagraph.interface';
 
@@ -9,21 +9,31 @@ export class SubnetMetagraphService {
   private readonly logger = new Logger(SubnetMetagraphService.name);
 
   constructor(
-    private readonly substrateClientService: SubstrateClientService,
+    private readonly runtimeApiCacheService: RuntimeApiCacheService,
     private readonly substrateConnectionService: SubstrateConnectionService,
   ) {}
 
-  async getSubnetMetagraph(netuid: number): Promise<SubnetMetagraph> {
+  async getSubnetMetagraph(netuid: number, block?: number): Promise<SubnetMetagraph> {
+    const blockHash = await this.runtimeApiCacheService.resolveBlockHash(block);
+    return this.getSubnetMetagraphAt(netuid, blockHash);
+  }
+
+  /**
+   * Read a subnet metagraph at a block hash, shared with every other request for
+   * the same subnet and block.
+   */
+  async getSubnetMetagraphAt(netuid: number, blockHash: string): Promise<SubnetMetagraph> {
     const client = await this.substrateConnectionService.getClient();
 
     const runtimeApiName = 'SubnetInfoRuntimeApi';
     const methodName = 'get_metagraph';
     const encodedParams = client.registry.createType('u16', netuid).toU8a();
 
-    const response = await this.substrateClientService.queryRuntimeApi(
+    const response = await this.runtimeApiCacheService.queryRuntimeApi(
       runtimeApiName,
       methodName,
       encodedParams,
+      blockHash,
     );
 
     const subnetMetagraph: SubnetMetagraph = response.toJSON();
@@ -0,0 +1,95 @@
+import { SubstrateClientService } from 'src/core/substrate/services/substrate-client.service';
+import { BlockInfo } from 'src/features/latest-block/latest-block.interface';
+
+import { Injectable, Logger } from '@nestjs/common';
+
+type BlockListener = (blockInfo: BlockInfo) => void;
+
+interface Upstream {
+  listeners: Set<BlockListener>;
+  unsubscribe: Promise<() => void>;
+}
+
+/**
+ * Shares one upstream subscription to finalized blocks and one to best blocks
+ * between every listener in the process.
+ *
+ * The upstream subscription is opened for the first listener and closed when the
+ * last one is removed, so the number of RPC subscriptions to the subtensor node
+ * does not grow with the number of websocket clients.
+ */
+@Injectable()
+export class BlockFanoutService {
+  private readonly logger = new Logger(BlockFanoutService.name);
+  private readonly upstreams = new Map<boolean, Upstream>();
+
+  constructor(private readonly substrateClientService: SubstrateClientService) {}
+
+  /**
+   * Call `listener` with every new finalized (or best) block.
+   *
+   * @returns a function that removes the listener
+   */
+  async subscribe(finalised: boolean, listener: BlockListener): Promise<() => void> {
+    const upstream = this.upstreams.get(finalised) ?? this.open(finalised);
+    this.upstreams.set(finalised, upstream);
+    upstream.listeners.add(listener);
+
+    try {
+      await upstream.unsubscribe;
+    } catch (error) {
+      upstream.listeners.delete(listener);
+      throw error;
+    }
+
+    let removed = false;
+    return () => {
+      if (removed) {
+        return;
+      }
+      removed = true;
+      this.remove(finalised, upstream, listener);
+    };
+  }
+
+  listenerCount(finalised: boolean): number {
+    return this.upstreams.get(finalised)?.listeners.size ?? 0;
+  }
+
+  private open(finalised: boolean): Upstream {
+    const kind = finalised ? 'finalized' : 'best';
+    const listeners = new Set<BlockListener>();
+    this.logger.log(`Opening upstream ${kind} block subscription`);
+
+    const unsubscribe = this.substrateClientService.subscribeToBlocks(
+      finalised,
+      (blockInfo: BlockInfo) => {
+        for (const listener of listeners) {
+          try {
+            listener(blockInfo);
+          } catch (error) {
+            this.logger.error(`Error in ${kind} block listener:`, error);
+          }
+        }
+      },
+    );
+    const upstream: Upstream = { listeners, unsubscribe };
+    unsubscribe.catch(error => {
+      this.logger.error(`Error opening upstream ${kind} block subscription:`, error);
+      if (this.upstreams.get(finalised) === upstream) {
+        this.upstreams.delete(finalised);
+      }
+    });
+    return upstream;
+  }
+
+  private remove(finalised: boolean, upstream: Upstream, listener: BlockListener) {
+    upstream.listeners.delete(listener);
+    if (upstream.listeners.size > 0 || this.upstreams.get(finalised) !== upstream) {
+      return;
+    }
+    this.upstreams.delete(finalised);
+    this.logger.log(`Closing upstream ${finalised ? 'finalized' : 'best'} block subscription`);
+    void upstream.unsubscribe.then(unsubscribe => unsubscribe(), () => undefined);
+  }
+}
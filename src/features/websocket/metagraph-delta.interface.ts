@@ -0,0 +1,17 @@
+export interface MetagraphArrayChanges {
+  // Length of the array after the change, shorter arrays are truncated
+  length: number;
+  // Changed entries as [index, value] pairs
+  changes: [number, unknown][];
+}
+
+export interface MetagraphDelta {
+  netuid: number;
+  block: number;
+  // Block of the metagraph the delta applies to
+  baseBlock: number;
+  // Changed fields that are not arrays, e.g. `tempo` or `identity`
+  fields: Record<string, unknown>;
+  // Changed entries of per-UID arrays, e.g. `totalStake` or `axons`
+  arrays: Record<string, MetagraphArrayChanges>;
+}
@@ -0,0 +1,143 @@
+import { SubstrateClientService } from 'src/core/substrate/services/substrate-client.service';
+import { SubnetMetagraphDto } from 'src/features/subnet-metagraph/subnet-metagraph.dto';
+import { SubnetMetagraphMapper } from 'src/features/subnet-metagraph/subnet-metagraph.mapper';
+import { SubnetMetagraphService } from 'src/features/subnet-metagraph/subnet-metagraph.service';
+import { isDeepStrictEqual } from 'util';
+
+import { Injectable, Logger } from '@nestjs/common';
+
+import { MetagraphArrayChanges, MetagraphDelta } from './metagraph-delta.interface';
+
+/**
+ * Diff two metagraphs of the same subnet.
+ *
+ * Array fields are compared entry by entry, so a block where a few UIDs changed
+ * produces a few [index, value] pairs instead of the whole column.
+ */
+export function diffMetagraph(
+  previous: SubnetMetagraphDto,
+  next: SubnetMetagraphDto,
+): MetagraphDelta {
+  const fields: Record<string, unknown> = {};
+  const arrays: Record<string, MetagraphArrayChanges> = {};
+  const base = previous as unknown as Record<string, unknown>;
+
+  for (const [key, value] of Object.entries(next)) {
+    const old = base[key];
+    if (Array.isArray(value) && Array.isArray(old)) {
+      const changes: [number, unknown][] = [];
+      value.forEach((entry, index) => {
+        if (index >= old.length || !isDeepStrictEqual(entry, old[index])) {
+          changes.push([index, entry]);
+        }
+      });
+      if (changes.length > 0 || value.length !== old.length) {
+        arrays[key] = { length: value.length, changes };
+      }
+    } else if (!isDeepStrictEqual(value, old)) {
+      fields[key] = value;
+    }
+  }
+
+  return {
+    netuid: next.netuid,
+    block: next.block,
+    baseBlock: previous.block,
+    fields,
+    arrays,
+  };
+}
+
+/**
+ * Keeps the latest metagraph of every subscribed subnet and turns new blocks into
+ * deltas against it.
+ *
+ * Each subnet is read at most once per block, however many clients subscribe to it.
+ * Reads and updates of one subnet run one after another, so a delta always applies
+ * to the snapshot sent before it.
+ */
+@Injectable()
+export class MetagraphDeltaService {
+  private readonly logger = new Logger(MetagraphDeltaService.name);
+  private readonly snapshots = new Map<number, SubnetMetagraphDto>();
+  private readonly queues = new Map<number, Promise<unknown>>();
+
+  constructor(
+    private readonly substrateClientService: SubstrateClientService,
+    private readonly subnetMetagraphService: SubnetMetagraphService,
+    private readonly subnetMetagraphMapper: SubnetMetagraphMapper,
+  ) {}
+
+  /**
+   * The latest metagraph of a subnet, read at the latest finalized block if it is not
+   * tracked yet. Deltas are read at finalized blocks too, so they always apply to a
+   * snapshot of the same chain, never to a best block that is later forked out.
+   */
+  async getSnapshot(netuid: number): Promise<SubnetMetagraphDto> {
+    return this.serialize(netuid, async () => {
+      const snapshot = this.snapshots.get(netuid);
+      if (snapshot) {
+        return snapshot;
+      }
+      const metagraph = await this.read(netuid);
+      this.snapshots.set(netuid, metagraph);
+      return metagraph;
+    });
+  }
+
+  /**
+   * Read a subnet at a new block and return the delta against the tracked snapshot.
+   *
+   * @returns null if the subnet is not tracked or already at or past the block
+   */
+  async update(netuid: number, block: number): Promise<MetagraphDelta | null> {
+    return this.serialize(netuid, async () => {
+      const previous = this.snapshots.get(netuid);
+      if (!previous || previous.block >= block) {
+        return null;
+      }
+      const next = await this.read(netuid, block);
+      this.snapshots.set(netuid, next);
+      return diffMetagraph(previous, next);
+    });
+  }
+
+  /**
+   * Stop tracking a subnet, e.g. once it has no subscribers left.
+   */
+  forget(netuid: number) {
+    this.snapshots.delete(netuid);
+  }
+
+  get trackedNetuids(): number[] {
+    return [...this.snapshots.keys()];
+  }
+
+  private async read(netuid: number, block?: number): Promise<SubnetMetagraphDto> {
+    this.logger.debug(
+      `Reading metagraph for netuid: ${netuid}` +
+        (block === undefined ? ' at the finalized head' : ` at block: ${block}`),
+    );
+    const metagraph =
+      block === undefined
+        ? await this.subnetMetagraphService.getSubnetMetagraphAt(
+            netuid,
+            await this.substrateClientService.getFinalizedBlockHash(),
+          )
+        : await this.subnetMetagraphService.getSubnetMetagraph(netuid, block);
+    return this.subnetMetagraphMapper.toDto(metagraph);
+  }
+
+  private serialize<T>(netuid: number, task: () => Promise<T>): Promise<T> {
+    const previous = this.queues.get(netuid) ?? Promise.resolve();
+    const next = previous.then(task, task);
+    const settled = next.catch(() => undefined);
+    this.queues.set(netuid, settled);
+    void settled.then(() => {
+      if (this.queues.get(netuid) === settled) {
+        this.queues.delete(netuid);
+      }
+    });
+    return next;
+  }
+}
@@ -1,6 +1,7 @@
 import { Server } from 'socket.io';
-import { SubstrateClientService } from 'src/core/substrate/services/substrate-client.service';
 import { BlockInfo } from 'src/features/latest-block/latest-block.interface';
+import { BlockFanoutService } from 'src/features/websocket/block-fanout.service';
+import { MetagraphDeltaService } from 'src/features/websocket/metagraph-delta.service';
 
 import { Logger } from '@nestjs/common';
 import {
@@ -13,27 +14,47 @@ import {
 } from '@nestjs/websockets';
 
 /**
- * WebSocket Gateway for real-time block subscriptions
+ * WebSocket Gateway for real-time block and metagraph subscriptions
  *
  * @event subscribe-blocks Subscribe to new blocks (true for finalized blocks, false for new blocks)
  * @event new-block Emitted when a new block is published and returns {@link BlockInfo}
  * @event subscription-confirmed Emitted when block subscription is successful
  * @event subscription-error Emitted when block subscription fails
+ * @event subscribe-metagraph Subscribe to the metagraphs of a list of netuids
+ * @event metagraph-snapshot Emitted per subscribed netuid with the full {@link SubnetMetagraphDto}
+ * @event metagraph-delta Emitted per subscribed netuid on every finalized block, returns the
+ *   {@link MetagraphDelta} against the previous metagraph
+ * @event metagraph-subscription-confirmed Emitted when metagraph subscription is successful
+ * @event metagraph-subscription-error Emitted when metagraph subscription fails
+ * @event unsubscribe-metagraph Stop receiving metagraph deltas for a list of netuids
+ * @event metagraph-unsubscribed Emitted when metagraph unsubscription is successful
  * @event ping Test connection
  * @event pong Emitted when ping is received
  *
  * @see [Python example](../../docs/python-examples/block_subscription.py) Complete Python example
+ * @see [Python example](../../docs/python-examples/metagraph_subscription.py) Metagraph deltas in Python
  *
  */
 @WebSocketGateway()
 export class WebsocketClient implements OnGatewayInit, OnGatewayConnection, OnGatewayDisconnect {
   private readonly logger = new Logger(WebsocketClient.name);
 
-  constructor(private readonly substrateClientService: SubstrateClientService) {}
+  // Listener broadcasting blocks to the room of each kind of block, by finalised
+  private readonly blockBroadcasts = new Map<boolean, Promise<() => void>>();
+  // Listener updating the metagraphs of every subscribed subnet
+  private metagraphBlocks: Promise<() => void> | null = null;
+  private metagraphUpdating = false;
+  private pendingMetagraphBlock: number | null = null;
+
+  constructor(
+    private readonly blockFanoutService: BlockFanoutService,
+    private readonly metagraphDeltaService: MetagraphDeltaService,
+  ) {}
 
   @WebSocketServer() io: Server;
 
-  afterInit() {
+  afterInit(server: Server) {
+    server.of('/').adapter.on('delete-room', (room: string) => this.handleRoomDeleted(room));
     this.logger.log(`Server Initialised!`);
   }
 
@@ -45,12 +66,8 @@ export class WebsocketClient implements OnGatewayInit, OnGatewayConnection, OnGa
   }
 
   handleDisconnect(client: any) {
+    // socket.io removes the client from its rooms, see handleRoomDeleted
     this.logger.log(`Client ID: ${client.id} disconnected.`);
-
-    if (client.data?.blockUnsubscribe) {
-      this.logger.debug(`Cleaning up block subscription for client ${client.id}`);
-      client.data.blockUnsubscribe();
-    }
   }
 
   @SubscribeMessage('ping')
@@ -65,16 +82,13 @@ export class WebsocketClient implements OnGatewayInit, OnGatewayConnection, OnGa
 
   @SubscribeMessage('subscribe-blocks')
   async handleBlockSubscription(client: any, finalised: boolean) {
+    finalised = Boolean(finalised);
+    const room = blockRoom(finalised);
     try {
-      const unsubscribe = await this.substrateClientService.subscribeToBlocks(
-        finalised,
-        (blockInfo: BlockInfo) => {
-          this.logger.debug(`New block ${blockInfo.blockNumber} for client ${client.id}`);
-          client.emit('new-block', blockInfo);
-        },
-      );
-
-      client.data.blockUnsubscribe = unsubscribe;
+      // Subscribing again replaces the previous subscription of the client
+      await client.leave(blockRoom(!finalised));
+      await client.join(room);
+      await this.broadcastBlocks(finalised);
 
       return {
         event: 'subscription-confirmed',
@@ -82,10 +96,182 @@ export class WebsocketClient implements OnGatewayInit, OnGatewayConnection, OnGa
       };
     } catch (error) {
       this.logger.error(`Error subscribing client ${client.id} to blocks:`, error);
+      await client.leave(room);
       return {
         event: 'subscription-error',
         data: { message: 'Failed to subscribe to blocks', error: error.message },
       };
     }
   }
+
+  @SubscribeMessage('subscribe-metagraph')
+  async handleMetagraphSubscription(client: any, netuids: number[]) {
+    if (!isNetuidList(netuids)) {
+      return {
+        event: 'metagraph-subscription-error',
+        data: { message: 'netuids must be a non-empty array of non-negative integers' },
+      };
+    }
+
+    try {
+      for (const netuid of netuids) {
+        // Join before reading the snapshot, so no delta computed after it is missed
+        await client.join(metagraphRoom(netuid));
+        const snapshot = await this.metagraphDeltaService.getSnapshot(netuid);
+        client.emit('metagraph-snapshot', snapshot);
+      }
+      await this.subscribeMetagraphBlocks();
+
+      this.logger.debug(`Client ${client.id} subscribed to metagraphs of netuids ${netuids}`);
+      return {
+        event: 'metagraph-subscription-confirmed',
+        data: { message: 'Successfully subscribed to metagraphs', netuids },
+      };
+    } catch (error) {
+      this.logger.error(`Error subscribing client ${client.id} to metagraphs:`, error);
+      return {
+        event: 'metagraph-subscription-error',
+        data: { message: 'Failed to subscribe to metagraphs', error: error.message },
+      };
+    }
+  }
+
+  @SubscribeMessage('unsubscribe-metagraph')
+  async handleMetagraphUnsubscription(client: any, netuids: number[]) {
+    if (!isNetuidList(netuids)) {
+      return {
+        event: 'metagraph-subscription-error',
+        data: { message: 'netuids must be a non-empty array of non-negative integers' },
+      };
+    }
+    for (const netuid of netuids) {
+      await client.leave(metagraphRoom(netuid));
+    }
+    return {
+      event: 'metagraph-unsubscribed',
+      data: { message: 'Successfully unsubscribed from metagraphs', netuids },
+    };
+  }
+
+  private async broadcastBlocks(finalised: boolean) {
+    if (!this.blockBroadcasts.has(finalised)) {
+      const room = blockRoom(finalised);
+      const broadcast = this.blockFanoutService.subscribe(finalised, (blockInfo: BlockInfo) => {
+        this.logger.debug(`New block ${blockInfo.blockNumber} for room ${room}`);
+        this.io.to(room).emit('new-block', blockInfo);
+      });
+      this.blockBroadcasts.set(finalised, broadcast);
+      broadcast.catch(() => {
+        if (this.blockBroadcasts.get(finalised) === broadcast) {
+          this.blockBroadcasts.delete(finalised);
+        }
+      });
+    }
+    await this.blockBroadcasts.get(finalised);
+  }
+
+  private handleRoomDeleted(room: string) {
+    for (const finalised of [true, false]) {
+      const broadcast = this.blockBroadcasts.get(finalised);
+      if (room === blockRoom(finalised) && broadcast) {
+        this.blockBroadcasts.delete(finalised);
+        void broadcast.then(remove => remove(), () => undefined);
+        this.logger.debug(`No ${room} subscribers left, stopped broadcasting`);
+      }
+    }
+
+    if (room.startsWith(METAGRAPH_ROOM_PREFIX)) {
+      this.metagraphDeltaService.forget(Number(room.slice(METAGRAPH_ROOM_PREFIX.length)));
+      if (this.metagraphDeltaService.trackedNetuids.length === 0) {
+        this.unsubscribeMetagraphBlocks();
+      }
+    }
+  }
+
+  private async subscribeMetagraphBlocks() {
+    if (!this.metagraphBlocks) {
+      const subscription = this.blockFanoutService.subscribe(true, (blockInfo: BlockInfo) => {
+        void this.handleMetagraphBlock(blockInfo.blockNumber);
+      });
+      this.metagraphBlocks = subscription;
+      subscription.catch(() => {
+        if (this.metagraphBlocks === subscription) {
+          this.metagraphBlocks = null;
+        }
+      });
+    }
+    await this.metagraphBlocks;
+  }
+
+  private unsubscribeMetagraphBlocks() {
+    const subscription = this.metagraphBlocks;
+    this.metagraphBlocks = null;
+    if (subscription) {
+      void subscription.then(remove => remove(), () => undefined);
+      this.logger.debug('No metagraph subscribers left, stopped reading metagraphs');
+    }
+  }
+
+  private async handleMetagraphBlock(blockNumber: number) {
+    // Blocks arriving while subnets are being read are coalesced into the newest one
+    if (this.metagraphUpdating) {
+      this.pendingMetagraphBlock = blockNumber;
+      return;
+    }
+    this.metagraphUpdating = true;
+    try {
+      let block: number | null = blockNumber;
+      while (block !== null) {
+        this.pendingMetagraphBlock = null;
+        await this.publishMetagraphDeltas(block);
+        block = this.pendingMetagraphBlock;
+      }
+    } finally {
+      this.metagraphUpdating = false;
+    }
+  }
+
+  private async publishMetagraphDeltas(block: number) {
+    const rooms = this.io.sockets.adapter.rooms;
+
+    await Promise.all(
+      this.metagraphDeltaService.trackedNetuids.map(async netuid => {
+        const room = metagraphRoom(netuid);
+        if (!rooms.get(room)?.size) {
+          this.metagraphDeltaService.forget(netuid);
+          return;
+        }
+        try {
+          const delta = await this.metagraphDeltaService.update(netuid, block);
+          if (delta) {
+            this.io.to(room).emit('metagraph-delta', delta);
+          }
+        } catch (error) {
+          this.logger.error(`Error computing metagraph delta for netuid ${netuid}:`, error);
+        }
+      }),
+    );
+
+    if (this.metagraphDeltaService.trackedNetuids.length === 0) {
+      this.unsubscribeMetagraphBlocks();
+    }
+  }
+}
+
+const METAGRAPH_ROOM_PREFIX = 'metagraph:';
+
+function blockRoom(finalised: boolean): string {
+  return finalised ? 'blocks:finalized' : 'blocks:best';
+}
+
+function metagraphRoom(netuid: number): string {
+  return `${METAGRAPH_ROOM_PREFIX}${netuid}`;
+}
+
+function isNetuidList(netuids: unknown): netuids is number[] {
+  return (
+    Array.isArray(netuids) &&
+    netuids.length > 0 &&
+    netuids.every(netuid => Number.isInteger(netuid) && netuid >= 0)
+  );
 }
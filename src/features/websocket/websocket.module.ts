@@ -1,12 +1,15 @@
 import { SubstrateModule } from 'src/core/substrate/substrate.module';
+import { SubnetMetagraphModule } from 'src/features/subnet-metagraph/subnet-metagraph.module';
 
 import { Module } from '@nestjs/common';
 
+import { BlockFanoutService } from './block-fanout.service';
+import { MetagraphDeltaService } from './metagraph-delta.service';
 import { WebsocketClient } from './websocket.gateway';
 
 @Module({
-  providers: [WebsocketClient],
+  providers: [WebsocketClient, BlockFanoutService, MetagraphDeltaService],
   exports: [WebsocketClient],
-  imports: [SubstrateModule],
+  imports: [SubstrateModule, SubnetMetagraphModule],
 })
 export class WebSocketModule {}
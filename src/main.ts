@@ -6,11 +6,13 @@ import { NestFactory } from '@nestjs/core';
 import { DocumentBuilder, SwaggerDocumentOptions, SwaggerModule } from '@nestjs/swagger';
 
 import { AppModule } from './app.module';
+import { compactResponse } from './commons/compact-response.middleware';
 
 dotenv.config();
 
 async function bootstrap() {
   const app = await NestFactory.create(AppModule);
+  app.use(compactResponse);
   const config = new DocumentBuilder()
     .setTitle('Tensorplex Kami')
     .setDescription(